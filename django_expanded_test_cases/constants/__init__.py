@@ -6,6 +6,7 @@ Imports to make this folder behave like a single file.
 from .auth_constants import (
     ETC_AUTO_GENERATE_USERS,
     ETC_AUTO_GENERATE_USERS_IN_SETUPTESTDATA,
+    ETC_AUTO_GENERATE_USERS_LAZILY,
     ETC_DEFAULT_ADMIN_USER_IDENTIFIER,
     ETC_DEFAULT_INACTIVE_USER_IDENTIFIER,
     ETC_DEFAULT_STANDARD_USER_IDENTIFIER,
@@ -13,6 +14,7 @@ from .auth_constants import (
     ETC_DEFAULT_USER_PASSWORD,
     ETC_GENERATE_USERS_WITH_REAL_NAMES,
     ETC_REQUEST_USER_STRICTNESS,
+    ETC_USE_USER_HANDLES,
     ETC_USER_MODEL_IDENTIFIER,
 )
 
@@ -21,8 +23,20 @@ from .auth_constants import (
 from .general_handling_constants import (
     ETC_ALLOW_MESSAGE_PARTIALS,
     ETC_ALLOW_TITLE_PARTIALS,
+    ETC_ASSERT_NO_N_PLUS_ONE,
+    ETC_BENCHMARK_OUTPUT_FILE,
+    ETC_DEDUPLICATE_APPEND_SLASH_WARNINGS,
+    ETC_FOLLOW_REDIRECTS,
+    ETC_LIGHTWEIGHT_CLIENT,
     ETC_MATCH_ALL_CONTEXT_MESSAGES,
+    ETC_MAX_REDIRECTS,
+    ETC_N_PLUS_ONE_THRESHOLD,
+    ETC_PERFORMANCE_BASELINE_FILE,
+    ETC_PERFORMANCE_BASELINE_MODE,
+    ETC_PERFORMANCE_BASELINE_SAMPLES,
+    ETC_PERFORMANCE_BASELINE_TOLERANCE,
     ETC_RESET_CLIENT_STATE_ON_REQUEST,
+    ETC_RESPONSE_DEBUG_LOGGERS,
     ETC_RESPONSE_DEBUG_LOGGING_LEVEL,
     ETC_SKIP_CONTENT_AFTER,
     ETC_SKIP_CONTENT_BEFORE,
@@ -36,7 +50,12 @@ from .general_handling_constants import (
 from .debug_output_constants import (
     COLORAMA_PRESENT,
     ETC_ASSERT_CONTENT__SURROUNDING_CHECK_OUTPUT_LENGTH,
+    ETC_ASSERT_TEXT__DIFF_CONTEXT_LINES,
+    ETC_RESPONSE_TIMINGS_REPORT,
+    ETC_RESPONSE_TIMINGS_REPORT_LENGTH,
     ETC_DEBUG_PRINT,
+    ETC_DEBUG_PRINT__BACKGROUND_RENDER,
+    ETC_DEBUG_PRINT__COLOR,
     ETC_DEBUG_PRINT__LOGGING_SEPARATOR,
     ETC_DEBUG_PRINT__RESPONSE_SEPARATOR,
     ETC_DEBUG_PRINT__STD_OUT_SEPARATOR,
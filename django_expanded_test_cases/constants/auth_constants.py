@@ -37,6 +37,26 @@ ETC_AUTO_GENERATE_USERS_IN_SETUPTESTDATA = bool(
         False,
     )
 )
+# Controls if test-users are generated lazily.
+# True  means each user is only created on first access, such as `self.test_user` or `get_user('test_user')`.
+# False (default) means all users are created up front.
+# Only applies when users are generated in `setUp()`. Users generated in `setUpTestData()` are always created up front.
+ETC_AUTO_GENERATE_USERS_LAZILY = bool(
+    getattr(
+        settings,
+        'DJANGO_EXPANDED_TESTCASES_AUTO_GENERATE_USERS_LAZILY',
+        False,
+    )
+)
+# Controls if test-users generated in `setUpTestData()` are held as lightweight handles, instead of model instances.
+# Each test then gets its own user instance, rebuilt from held values on first access, without querying.
+ETC_USE_USER_HANDLES = bool(
+    getattr(
+        settings,
+        'DJANGO_EXPANDED_TESTCASES_USE_USER_HANDLES',
+        False,
+    )
+)
 # Controls what level of strictness UnitTest requests have for users.
 ETC_REQUEST_USER_STRICTNESS = (
     str(
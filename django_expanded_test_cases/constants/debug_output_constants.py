@@ -2,6 +2,9 @@
 Constants related to end-user debug/testing output.
 """
 
+# System Imports.
+import sys
+
 # Third-Party Imports.
 from django.conf import settings
 
@@ -33,6 +36,17 @@ ETC_DEBUG_PRINT = bool(
 )
 
 
+# Indicates whether slower sections of debug output (such as response content and json formatting) should render
+# in a background thread. Output is then held and displayed in original order, at the end of each test.
+ETC_DEBUG_PRINT__BACKGROUND_RENDER = bool(
+    getattr(
+        settings,
+        'DJANGO_EXPANDED_TESTCASES_DEBUG_PRINT__BACKGROUND_RENDER',
+        False,
+    )
+)
+
+
 # A set of regex-matching strings to skip displaying during debug output.
 # Useful such as when importing third-party libraries with front-end elements, if you don't expect to ever
 # need to test for said elements.
@@ -105,6 +119,39 @@ ETC_ASSERT_CONTENT__SURROUNDING_CHECK_OUTPUT_LENGTH = int(
 if ETC_ASSERT_CONTENT__SURROUNDING_CHECK_OUTPUT_LENGTH < 0:
     ETC_ASSERT_CONTENT__SURROUNDING_CHECK_OUTPUT_LENGTH = 0
 
+
+# Controls how many matching lines are shown around each mismatch on assertText test error.
+# Longer runs of matching lines are collapsed into a single "lines hidden" line.
+# Setting to a negative value will disable collapsing, and always show the full text.
+ETC_ASSERT_TEXT__DIFF_CONTEXT_LINES = int(
+    getattr(
+        settings,
+        'DJANGO_EXPANDED_TESTCASES_ASSERT_TEXT__DIFF_CONTEXT_LINES',
+        5,
+    )
+)
+
+
+# Indicates whether per-phase assertResponse timings should be collected across the full test run.
+# If so, then a report ranking the slowest urls and phases is displayed at the end of the test run.
+ETC_RESPONSE_TIMINGS_REPORT = bool(
+    getattr(
+        settings,
+        'DJANGO_EXPANDED_TESTCASES_RESPONSE_TIMINGS_REPORT',
+        False,
+    )
+)
+
+
+# Controls how many of the slowest urls are shown in the above RESPONSE_TIMINGS_REPORT.
+ETC_RESPONSE_TIMINGS_REPORT_LENGTH = int(
+    getattr(
+        settings,
+        'DJANGO_EXPANDED_TESTCASES_RESPONSE_TIMINGS_REPORT_LENGTH',
+        10,
+    )
+)
+
 # endregion General Debug Handling
 
 
@@ -173,142 +220,115 @@ ETC_INCLUDE_RESPONSE_DEBUG_USER_INFO = bool(
 
 # region Console Color Options
 
+# Indicates whether debug output should include console coloring.
+# Defaults to None, which auto-detects based on if the original stdout is an interactive terminal.
+# When output goes to a file or CI log, all color values below resolve to empty strings,
+# and output is rendered without any color formatting.
+ETC_DEBUG_PRINT__COLOR = getattr(
+    settings,
+    'DJANGO_EXPANDED_TESTCASES_DEBUG_PRINT__COLOR',
+    None,
+)
+if ETC_DEBUG_PRINT__COLOR is None:
+    try:
+        ETC_DEBUG_PRINT__COLOR = bool(sys.__stdout__ is not None and sys.__stdout__.isatty())
+    except (AttributeError, ValueError):
+        # Stdout has been replaced or closed. Assume non-interactive.
+        ETC_DEBUG_PRINT__COLOR = False
+ETC_DEBUG_PRINT__COLOR = bool(ETC_DEBUG_PRINT__COLOR)
+
+
+def _get_style(setting_name, default):
+    """Resolves value for a single color setting. Always empty when console coloring is disabled.
+
+    :param setting_name: Name of Django setting to check for a user-provided value.
+    :param default: Value to use when setting is not provided.
+    :return: Resolved color string.
+    """
+    if not ETC_DEBUG_PRINT__COLOR:
+        return ''
+    return str(getattr(settings, setting_name, default))
+
+
 # General output/color format settings.
-ETC_OUTPUT_ERROR_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_OUTPUT_ERROR_HEADER_COLOR',
-        '{0}{1}{2}'.format(Fore.RED, Back.RESET, Style.NORMAL) if COLORAMA_PRESENT else '',
-    )
+ETC_OUTPUT_ERROR_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_OUTPUT_ERROR_HEADER_COLOR',
+    '{0}{1}{2}'.format(Fore.RED, Back.RESET, Style.NORMAL) if COLORAMA_PRESENT else '',
 )
-ETC_OUTPUT_EXPECTED_MATCH_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_OUTPUT_EXPECTED_MATCH_COLOR',
-        '{0}{1}{2}'.format(Fore.CYAN, Back.RESET, Style.NORMAL) if COLORAMA_PRESENT else '',
-    )
+ETC_OUTPUT_EXPECTED_MATCH_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_OUTPUT_EXPECTED_MATCH_COLOR',
+    '{0}{1}{2}'.format(Fore.CYAN, Back.RESET, Style.NORMAL) if COLORAMA_PRESENT else '',
 )
-ETC_OUTPUT_EXPECTED_ERROR_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_OUTPUT_EXPECTED_ERROR_COLOR',
-        '{0}{1}{2}'.format(Fore.BLACK, Back.CYAN, Style.NORMAL) if COLORAMA_PRESENT else '',
-    )
+ETC_OUTPUT_EXPECTED_ERROR_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_OUTPUT_EXPECTED_ERROR_COLOR',
+    '{0}{1}{2}'.format(Fore.BLACK, Back.CYAN, Style.NORMAL) if COLORAMA_PRESENT else '',
 )
-ETC_OUTPUT_ACTUALS_MATCH_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_OUTPUT_ACTUALS_MATCH_COLOR',
-        '{0}{1}{2}'.format(Fore.MAGENTA, Back.RESET, Style.NORMAL) if COLORAMA_PRESENT else '',
-    )
+ETC_OUTPUT_ACTUALS_MATCH_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_OUTPUT_ACTUALS_MATCH_COLOR',
+    '{0}{1}{2}'.format(Fore.MAGENTA, Back.RESET, Style.NORMAL) if COLORAMA_PRESENT else '',
 )
-ETC_OUTPUT_ACTUALS_ERROR_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_OUTPUT_ACTUALS_ERROR_COLOR',
-        '{0}{1}{2}'.format(Fore.BLACK, Back.MAGENTA, Style.NORMAL) if COLORAMA_PRESENT else '',
-    )
+ETC_OUTPUT_ACTUALS_ERROR_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_OUTPUT_ACTUALS_ERROR_COLOR',
+    '{0}{1}{2}'.format(Fore.BLACK, Back.MAGENTA, Style.NORMAL) if COLORAMA_PRESENT else '',
 )
-ETC_OUTPUT_EMPHASIS_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_OUTPUT_EMPHASIS_COLOR',
-        (Style.BRIGHT if COLORAMA_PRESENT else '') + UNDERLINE,
-    )
+ETC_OUTPUT_EMPHASIS_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_OUTPUT_EMPHASIS_COLOR',
+    (Style.BRIGHT if COLORAMA_PRESENT else '') + UNDERLINE,
 )
-ETC_OUTPUT_RESET_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_OUTPUT_RESET_COLOR',
-        Style.RESET_ALL if COLORAMA_PRESENT else UNDERLINE_RESET,
-    )
+ETC_OUTPUT_RESET_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_OUTPUT_RESET_COLOR',
+    Style.RESET_ALL if COLORAMA_PRESENT else UNDERLINE_RESET,
 )
 
 # Output/color formatting for response sections.
-ETC_RESPONSE_DEBUG_URL_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_URL_COLOR',
-        Fore.YELLOW if COLORAMA_PRESENT else '',
-    )
+ETC_RESPONSE_DEBUG_URL_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_URL_COLOR',
+    Fore.YELLOW if COLORAMA_PRESENT else '',
 )
-ETC_RESPONSE_DEBUG_CONTENT_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_CONTENT_COLOR',
-        Fore.WHITE if COLORAMA_PRESENT else '',
-    )
+ETC_RESPONSE_DEBUG_CONTENT_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_CONTENT_COLOR',
+    Fore.WHITE if COLORAMA_PRESENT else '',
 )
-ETC_RESPONSE_DEBUG_HEADER_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_HEADER_COLOR',
-        Fore.CYAN if COLORAMA_PRESENT else '',
-    )
+ETC_RESPONSE_DEBUG_HEADER_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_HEADER_COLOR',
+    Fore.CYAN if COLORAMA_PRESENT else '',
 )
-ETC_RESPONSE_DEBUG_CONTEXT_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_CONTEXT_COLOR',
-        Fore.BLUE if COLORAMA_PRESENT else '',
-    )
+ETC_RESPONSE_DEBUG_CONTEXT_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_CONTEXT_COLOR',
+    Fore.BLUE if COLORAMA_PRESENT else '',
 )
-ETC_RESPONSE_DEBUG_SESSION_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_SESSION_COLOR',
-        Fore.MAGENTA if COLORAMA_PRESENT else '',
-    )
+ETC_RESPONSE_DEBUG_SESSION_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_SESSION_COLOR',
+    Fore.MAGENTA if COLORAMA_PRESENT else '',
 )
-ETC_RESPONSE_DEBUG_MESSAGE_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_MESSAGES_COLOR',
-        Fore.CYAN if COLORAMA_PRESENT else '',
-    )
+ETC_RESPONSE_DEBUG_MESSAGE_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_MESSAGES_COLOR',
+    Fore.CYAN if COLORAMA_PRESENT else '',
 )
-ETC_RESPONSE_DEBUG_FORM_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_FORMS_COLOR',
-        Fore.BLUE if COLORAMA_PRESENT else '',
-    )
+ETC_RESPONSE_DEBUG_FORM_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_FORMS_COLOR',
+    Fore.BLUE if COLORAMA_PRESENT else '',
 )
-ETC_RESPONSE_DEBUG_USER_INFO_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_USER_INFO_COLOR',
-        Fore.MAGENTA if COLORAMA_PRESENT else '',
-    )
+ETC_RESPONSE_DEBUG_USER_INFO_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_USER_INFO_COLOR',
+    Fore.MAGENTA if COLORAMA_PRESENT else '',
 )
 # JSON response debug colors.
-ETC_RESPONSE_DEBUG_JSON_MATCH_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_JSON_MATCH_COLOR',
-        Back.GREEN if COLORAMA_PRESENT else '',
-    )
+ETC_RESPONSE_DEBUG_JSON_MATCH_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_JSON_MATCH_COLOR',
+    Back.GREEN if COLORAMA_PRESENT else '',
 )
-ETC_RESPONSE_DEBUG_JSON_TYPE_MISMATCH_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_JSON_TYPE_MISMATCH_COLOR',
-        Back.MAGENTA if COLORAMA_PRESENT else '',
-    )
+ETC_RESPONSE_DEBUG_JSON_TYPE_MISMATCH_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_JSON_TYPE_MISMATCH_COLOR',
+    Back.MAGENTA if COLORAMA_PRESENT else '',
 )
-ETC_RESPONSE_DEBUG_JSON_LENGTH_MISMATCH_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_JSON_LENGTH_MISMATCH_COLOR',
-        Back.YELLOW if COLORAMA_PRESENT else '',
-    )
+ETC_RESPONSE_DEBUG_JSON_LENGTH_MISMATCH_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_JSON_LENGTH_MISMATCH_COLOR',
+    Back.YELLOW if COLORAMA_PRESENT else '',
 )
-ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR = str(
-    getattr(
-        settings,
-        'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_JSON_CONTENT_MISMATCH_COLOR',
-        Back.RED if COLORAMA_PRESENT else '',
-    )
+ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR = _get_style(
+    'DJANGO_EXPANDED_TESTCASES_RESPONSE_OUTPUT_JSON_CONTENT_MISMATCH_COLOR',
+    Back.RED if COLORAMA_PRESENT else '',
 )
 
 # endregion Console Color Options
@@ -113,6 +113,100 @@ else:
     ETC_RESPONSE_DEBUG_LOGGING_LEVEL = None
 
 
+# Optional logger names to limit the above RESPONSE_DEBUG_LOGGING_LEVEL to. Child loggers are also affected.
+# If not set, then the logging level applies to all logging.
+ETC_RESPONSE_DEBUG_LOGGERS = getattr(
+    settings,
+    'DJANGO_EXPANDED_TESTCASES_RESPONSE_DEBUG_LOGGERS',
+    None,
+)
+if isinstance(ETC_RESPONSE_DEBUG_LOGGERS, str):
+    ETC_RESPONSE_DEBUG_LOGGERS = [ETC_RESPONSE_DEBUG_LOGGERS]
+
+
+# Indicates whether tests should implicitly check for "N+1" queries on every assertResponse statement.
+# Aka, the same query (ignoring literal values) being run many times by a single view request.
+ETC_ASSERT_NO_N_PLUS_ONE = bool(
+    getattr(
+        settings,
+        'DJANGO_EXPANDED_TESTCASES_ASSERT_NO_N_PLUS_ONE',
+        False,
+    )
+)
+
+
+# How many times the same query can run within a single view request, before it's considered an "N+1" query.
+ETC_N_PLUS_ONE_THRESHOLD = int(
+    getattr(
+        settings,
+        'DJANGO_EXPANDED_TESTCASES_N_PLUS_ONE_THRESHOLD',
+        3,
+    )
+)
+
+
+# Path to a JSON file of per-url performance baseline values.
+# Used by assertResponse statements with check_performance_baseline. If not set, then baselines are disabled.
+ETC_PERFORMANCE_BASELINE_FILE = getattr(
+    settings,
+    'DJANGO_EXPANDED_TESTCASES_PERFORMANCE_BASELINE_FILE',
+    None,
+)
+
+
+# How performance baselines are handled.
+# "fail": Compares against the baseline file, and fails tests on regression.
+# "warn": Compares against the baseline file, and only raises a warning on regression.
+# "record": Saves new baseline values to the baseline file, at the end of the test run.
+ETC_PERFORMANCE_BASELINE_MODE = (
+    str(
+        getattr(
+            settings,
+            'DJANGO_EXPANDED_TESTCASES_PERFORMANCE_BASELINE_MODE',
+            'fail',
+        )
+    )
+    .strip()
+    .lower()
+)
+if ETC_PERFORMANCE_BASELINE_MODE not in ['fail', 'warn', 'record']:
+    raise ValueError(
+        'Invalid value provided for DJANGO_EXPANDED_TESTCASES_PERFORMANCE_BASELINE_MODE setting. '
+        'Must be one of: ["fail", "warn", "record"].'
+    )
+
+
+# How much (as a fraction) response duration and content size can exceed baseline values, before it's a regression.
+# Query counts are always compared exactly.
+ETC_PERFORMANCE_BASELINE_TOLERANCE = float(
+    getattr(
+        settings,
+        'DJANGO_EXPANDED_TESTCASES_PERFORMANCE_BASELINE_TOLERANCE',
+        0.25,
+    )
+)
+
+
+# How many times GET requests are sampled, when comparing to or recording performance baselines.
+# The median duration of all samples is used, to reduce noise.
+ETC_PERFORMANCE_BASELINE_SAMPLES = int(
+    getattr(
+        settings,
+        'DJANGO_EXPANDED_TESTCASES_PERFORMANCE_BASELINE_SAMPLES',
+        5,
+    )
+)
+
+
+# Path to a file that benchmarkResponse results are appended to, as one JSON object per line.
+# Can be overridden per benchmark. If not set, then results are only returned.
+ETC_BENCHMARK_OUTPUT_FILE = getattr(
+    settings,
+    'DJANGO_EXPANDED_TESTCASES_BENCHMARK_OUTPUT_FILE',
+    None,
+)
+
+
 # Indicates whether tests should implicitly check for page redirects on every assertResponse statement.
 # None: Default behavior (does nothing, user must explicitly check via 404 status or url assertions).
 # True: Implicitly checks for page redirect on every assertResponse statement, unless explicitly told otherwise.
@@ -128,6 +222,65 @@ if ETC_VIEWS_SHOULD_REDIRECT is not None:
     ETC_VIEWS_SHOULD_REDIRECT = bool(ETC_VIEWS_SHOULD_REDIRECT)
 
 
+# How assertResponse statements handle view redirects.
+# True: Follows the full redirect chain, so assertions run against the final page.
+# False: Never follows redirects, so assertions run against the initial view response.
+# "auto": Stops after the first hop when only redirect expectations are given. Follows the full chain when any
+#   assertion needs the final page (such as content, title, header, messages, or json).
+ETC_FOLLOW_REDIRECTS = getattr(
+    settings,
+    'DJANGO_EXPANDED_TESTCASES_FOLLOW_REDIRECTS',
+    True,
+)
+if str(ETC_FOLLOW_REDIRECTS).strip().lower() == 'auto':
+    ETC_FOLLOW_REDIRECTS = 'auto'
+elif str(ETC_FOLLOW_REDIRECTS).strip().lower() in ('true', 'false'):
+    ETC_FOLLOW_REDIRECTS = str(ETC_FOLLOW_REDIRECTS).strip().lower() == 'true'
+elif isinstance(ETC_FOLLOW_REDIRECTS, str):
+    raise ValueError(
+        'Invalid value provided for DJANGO_EXPANDED_TESTCASES_FOLLOW_REDIRECTS setting. '
+        'Must be one of: [True, False, "auto"].'
+    )
+else:
+    ETC_FOLLOW_REDIRECTS = bool(ETC_FOLLOW_REDIRECTS)
+
+
+# Max number of redirects that assertResponse statements will follow for a single request.
+# Exceeding this raises a RedirectCycleError. Defaults to the same limit as the Django test client.
+ETC_MAX_REDIRECTS = int(
+    getattr(
+        settings,
+        'DJANGO_EXPANDED_TESTCASES_MAX_REDIRECTS',
+        20,
+    )
+)
+
+
+# Indicates whether assertResponse statements should skip capturing template context, when it isn't needed.
+# The Django test client copies the context of every rendered template into `response.context`.
+# If True, then only messages and form objects of the top-level template are captured, and only when message
+# assertions are requested. Otherwise no context is captured. Debug output always captures the full context.
+ETC_LIGHTWEIGHT_CLIENT = bool(
+    getattr(
+        settings,
+        'DJANGO_EXPANDED_TESTCASES_LIGHTWEIGHT_CLIENT',
+        False,
+    )
+)
+
+
+# Indicates whether APPEND_SLASH url warnings should only be shown once per distinct url, per test run.
+# Repeated warnings are instead counted, and a summary of the skipped count is shown at the end of the run.
+# Defaults to True, as otherwise large test suites can produce the same warning thousands of times.
+ETC_DEDUPLICATE_APPEND_SLASH_WARNINGS = bool(
+    getattr(
+        settings,
+        'DJANGO_EXPANDED_TESTCASES_DEDUPLICATE_APPEND_SLASH_WARNINGS',
+        True,
+    )
+)
+
+
 # Void element list as defined at:
 # https://www.w3.org/TR/2011/WD-html-markup-20110113/syntax.html#void-element
 # TLDR: A "void element" is an HTML element that does not require a closing tag.
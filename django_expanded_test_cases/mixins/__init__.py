@@ -8,7 +8,7 @@ from .core_mixin import BaseMixin as EmptyTemplateMixin
 
 
 # Expanded "Base" TestCase utility mixins.
-from .core_mixin import CoreTestCaseMixin
+from .core_mixin import CoreTestCaseMixin, UserHandle
 
 
 # Expanded "Integration" TestCase utility mixins.
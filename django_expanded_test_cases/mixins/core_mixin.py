@@ -3,8 +3,14 @@ Core testing logic, universal to all test cases.
 """
 
 # System Imports.
+import copy
+import io
+import os
 import re
+import threading
 import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
+from difflib import SequenceMatcher
 from functools import wraps
 from types import FunctionType
 
@@ -15,10 +21,15 @@ from django.utils.http import urlencode
 
 # Internal Imports.
 from django_expanded_test_cases.constants import (
+    ETC_ASSERT_TEXT__DIFF_CONTEXT_LINES,
     ETC_DEBUG_PRINT,
+    ETC_DEBUG_PRINT__BACKGROUND_RENDER,
+    ETC_DEBUG_PRINT__COLOR,
     ETC_AUTO_GENERATE_USERS,
     ETC_AUTO_GENERATE_USERS_IN_SETUPTESTDATA,
+    ETC_AUTO_GENERATE_USERS_LAZILY,
     ETC_REQUEST_USER_STRICTNESS,
+    ETC_USE_USER_HANDLES,
     ETC_USER_MODEL_IDENTIFIER,
     ETC_DEBUG_PRINT__TEST_SEPARATOR,
     ETC_DEFAULT_SUPER_USER_IDENTIFIER,
@@ -36,6 +47,19 @@ from django_expanded_test_cases.constants import (
 )
 
 
+# Max combined length of mismatched characters within a line, to still compare per-character on assertText failure.
+# Anything larger is displayed as a single mismatch, to avoid slow comparisons on very long lines.
+_LINE_DIFF_MAX_LENGTH = 5000
+
+# Text markers for mismatched characters in text comparison output, used when console coloring is disabled.
+_EXPECTED_DIFF_MARKERS = ('[-', '-]')
+_ACTUAL_DIFF_MARKERS = ('{+', '+}')
+
+# Number of additional characters of actual text to display on assertTextStartsWith/assertTextEndsWith failure,
+# past the portion that was compared.
+_TEXT_EXTRA_LENGTH = 1000
+
+
 # region Debug Print Wrapper Logic
 
 
@@ -72,6 +96,551 @@ class DebugPrintMetaClass(type):
 # endregion Debug Print Wrapper Logic
 
 
+# region Debug Output Background Render Logic
+
+# Per-thread list to hold debug output in, rather than printing immediately.
+# Populated on the main thread while background rendering is enabled, and within each render worker thread.
+_debug_output_local = threading.local()
+
+# Thread pool for rendering debug output. Created on first use.
+_debug_render_executor = None
+
+
+def _get_debug_render_executor():
+    """Returns thread pool used to render debug output."""
+    global _debug_render_executor
+
+    if _debug_render_executor is None:
+        _debug_render_executor = ThreadPoolExecutor(thread_name_prefix='etc_debug_render')
+    return _debug_render_executor
+
+
+def _render_debug_output(render_function, *args, **kwargs):
+    """Runs given debug output function within a render worker thread.
+
+    :return: List of held output strings, in original order.
+    """
+    _debug_output_local.buffer = []
+    _debug_output_local.is_render_thread = True
+    try:
+        render_function(*args, **kwargs)
+        return _debug_output_local.buffer
+    finally:
+        _debug_output_local.buffer = None
+
+
+# endregion Debug Output Background Render Logic
+
+
+# region User Auth Tracking Logic
+
+# Revision counters for user Group/Permission membership, keyed by user pk.
+# Any membership change increments the corresponding counter. ETC compares these against the revision
+# saved with its own record of a user's auth data, to know if that record can still be trusted.
+# The `None` key acts as a global counter, for changes where the affected users are unknown.
+_user_auth_revisions = {None: 0}
+
+
+def _get_user_auth_revision(user_pk):
+    """Returns current auth revision for the given user pk."""
+    return (_user_auth_revisions[None], _user_auth_revisions.get(user_pk, 0))
+
+
+def _increment_user_auth_revision(user_pk=None):
+    """Increments auth revision for the given user pk. If no pk is provided, then all users are affected."""
+    _user_auth_revisions[user_pk] = _user_auth_revisions.get(user_pk, 0) + 1
+
+
+def _user_auth_m2m_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    """Signal receiver to track any change to user Group/Permission membership."""
+    if not action.startswith('post_'):
+        return
+
+    if not reverse:
+        # Change was made from the user side of the relation.
+        _increment_user_auth_revision(instance.pk)
+    elif pk_set:
+        # Change was made from the Group/Permission side of the relation.
+        for user_pk in pk_set:
+            _increment_user_auth_revision(user_pk)
+    else:
+        # Relation was cleared from the Group/Permission side. Affected users are unknown.
+        _increment_user_auth_revision()
+
+
+def _user_auth_post_delete(sender, **kwargs):
+    """Signal receiver to track deletion of Groups/Permissions, which cascades to user membership."""
+    _increment_user_auth_revision()
+
+
+# Per-process lookup of Permissions and Groups, by identifying str value.
+# Built with a single query on first use, and dropped whenever Permissions/Groups may have changed.
+# Test data is rolled back at the end of each test and class, so any change during either also drops it at that point.
+_auth_lookup_cache = {
+    'permissions': None,
+    'groups': None,
+    'changed_in_test': False,
+    'changed_in_class': False,
+}
+
+
+def _clear_auth_lookup_cache():
+    """Drops cached Permission/Group lookups, so that they're rebuilt on next use."""
+    _auth_lookup_cache['permissions'] = None
+    _auth_lookup_cache['groups'] = None
+
+
+def _auth_lookup_changed(sender, **kwargs):
+    """Signal receiver to track any change to Permissions/Groups, which invalidates cached lookups."""
+    _clear_auth_lookup_cache()
+    _auth_lookup_cache['changed_in_test'] = True
+    _auth_lookup_cache['changed_in_class'] = True
+
+
+def _get_cached_permission(identifier):
+    """Returns Permission matching given codename or name, or None if not found in cached lookup.
+
+    Matches by codename first, then falls back to name. Same as a direct query,
+    raises MultipleObjectsReturned if more than one Permission matches.
+    """
+    # Django imports here to avoid situational "Apps aren't loaded yet" error.
+    from django.contrib.auth.models import Permission
+
+    if _auth_lookup_cache['permissions'] is None:
+        by_codename = {}
+        by_name = {}
+        for permission in Permission.objects.select_related('content_type'):
+            by_codename.setdefault(permission.codename, []).append(permission)
+            by_name.setdefault(permission.name, []).append(permission)
+        _auth_lookup_cache['permissions'] = (by_codename, by_name)
+
+    for lookup in _auth_lookup_cache['permissions']:
+        matches = lookup.get(identifier, None)
+        if matches:
+            if len(matches) > 1:
+                raise Permission.MultipleObjectsReturned(
+                    'Found {0} permissions matching "{1}".'.format(len(matches), identifier)
+                )
+            return matches[0]
+
+    return None
+
+
+def _get_cached_group(identifier):
+    """Returns Group matching given name, or None if not found in cached lookup."""
+    # Django imports here to avoid situational "Apps aren't loaded yet" error.
+    from django.contrib.auth.models import Group
+
+    if _auth_lookup_cache['groups'] is None:
+        _auth_lookup_cache['groups'] = {group.name: group for group in Group.objects.all()}
+
+    return _auth_lookup_cache['groups'].get(identifier, None)
+
+
+def _connect_user_auth_signals():
+    """Connects signal receivers used to track user Group/Permission membership.
+
+    Receivers are bound to specific senders where possible, so that unrelated models are unaffected.
+    Safe to call multiple times.
+    """
+    # Django imports here to avoid situational "Apps aren't loaded yet" error.
+    from django.contrib.auth.models import Group, Permission
+    from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save
+
+    user_model = get_user_model()
+    for field_name in ('groups', 'user_permissions'):
+        if hasattr(user_model, field_name):
+            m2m_changed.connect(
+                _user_auth_m2m_changed,
+                sender=getattr(user_model, field_name).through,
+                dispatch_uid='etc_user_auth_m2m_changed__{0}'.format(field_name),
+            )
+    post_delete.connect(_user_auth_post_delete, sender=Group, dispatch_uid='etc_user_auth_post_delete__group')
+    post_delete.connect(
+        _user_auth_post_delete,
+        sender=Permission,
+        dispatch_uid='etc_user_auth_post_delete__permission',
+    )
+
+    # Also track changes that invalidate cached Permission/Group lookups.
+    # Flushing the database (such as in TransactionTestCase) recreates Permissions, so also watch migrate signals.
+    for model in (Group, Permission):
+        post_save.connect(
+            _auth_lookup_changed,
+            sender=model,
+            dispatch_uid='etc_auth_lookup_changed__post_save__{0}'.format(model._meta.model_name),
+        )
+        post_delete.connect(
+            _auth_lookup_changed,
+            sender=model,
+            dispatch_uid='etc_auth_lookup_changed__post_delete__{0}'.format(model._meta.model_name),
+        )
+    post_migrate.connect(_auth_lookup_changed, dispatch_uid='etc_auth_lookup_changed__post_migrate')
+
+
+def _get_user_auth_record(user):
+    """Returns ETC's record of Groups/Permissions for the given user, or None if no up-to-date record exists."""
+    auth_record = getattr(user, '_etc_auth_record', None)
+    if auth_record is None or auth_record['revision'] != _get_user_auth_revision(user.pk):
+        return None
+    return auth_record
+
+
+def _set_user_auth_record(user, groups=(), permissions=()):
+    """Saves ETC's record of Groups/Permissions for the given user, as of the current auth revision."""
+    user._etc_auth_record = {
+        'revision': _get_user_auth_revision(user.pk),
+        'groups': {group.pk: group for group in groups},
+        'permissions': {permission.pk: permission for permission in permissions},
+    }
+
+
+# Per-process cache of password hashes, keyed by raw password and active hashers.
+# Hashing is intentionally slow, so users created in bulk share a single precomputed hash.
+_password_hashes = {}
+
+
+def _get_password_hash(password):
+    """Returns hashed value of given raw password, computing it only once per process."""
+    # Django imports here to avoid situational "Apps aren't loaded yet" error.
+    from django.contrib.auth.hashers import make_password
+
+    hash_key = (password, tuple(settings.PASSWORD_HASHERS))
+    if hash_key not in _password_hashes:
+        _password_hashes[hash_key] = make_password(password)
+    return _password_hashes[hash_key]
+
+
+# endregion User Auth Tracking Logic
+
+
+# region Default User Logic
+
+# Values used to create each "special case" default test user.
+# Key is the attribute name the user is accessed by, on the TestCase class.
+_DEFAULT_USER_VALUES = {
+    # Superuser model. Can access/see everything, regardless of permissions.
+    'test_superuser': {
+        'identifier': ETC_DEFAULT_SUPER_USER_IDENTIFIER,
+        'create_kwargs': {'is_superuser': True},
+        'real_names': ('John', 'Doe', 'John'),
+        'names': ('SuperUserFirst', 'SuperUserLast', 'SuperUserName'),
+        'email': 'super_user@example.com',
+    },
+    # Admin user model. Can access Django admin.
+    'test_admin': {
+        'identifier': ETC_DEFAULT_ADMIN_USER_IDENTIFIER,
+        'create_kwargs': {'is_staff': True},
+        'real_names': ('Jenny', 'Johnson', 'Jenny'),
+        'names': ('AdminUserFirst', 'AdminUserLast', 'AdminUserName'),
+        'email': 'admin_user@example.com',
+    },
+    # Inactive user model. Has "is_active" set to false, and cannot login.
+    'test_inactive_user': {
+        'identifier': ETC_DEFAULT_INACTIVE_USER_IDENTIFIER,
+        'create_kwargs': {'is_active': False},
+        'real_names': ('Clang', 'Zythor', 'Clang'),
+        'names': ('InactiveUserFirst', 'InactiveUserLast', 'InactiveUserName'),
+        'email': 'inactive_user@example.com',
+    },
+    # Standard user model.
+    'test_user': {
+        'identifier': ETC_DEFAULT_STANDARD_USER_IDENTIFIER,
+        'create_kwargs': {},
+        'real_names': ('Sammy', 'Smith', 'Sammy'),
+        'names': ('UserFirst', 'UserLast', 'StandardUserName'),
+        'email': 'user@example.com',
+    },
+}
+
+# State of default test users.
+# Users are created on first access (or up front, by accessing each), and only while auto-generation is active
+# for the current test/class.
+# An `extra_usergen_kwargs` value of None indicates auto-generation is not currently active.
+_default_user_state = {
+    'extra_usergen_kwargs': None,
+    'password': None,
+    'with_real_names': False,
+    'as_handles': False,
+    'users': {},
+    'in_test': False,
+    'activated_in_test': False,
+    'test_created': set(),
+}
+
+
+def _activate_default_users(extra_usergen_kwargs):
+    """Resets default test users, so that each is created fresh on next access.
+
+    If activated within a test (rather than class setup), users only last until the end of said test.
+    """
+    _default_user_state['extra_usergen_kwargs'] = extra_usergen_kwargs
+    # Settings are also saved at this point, so that users match the settings at time of generation.
+    _default_user_state['password'] = ETC_DEFAULT_USER_PASSWORD
+    _default_user_state['with_real_names'] = ETC_GENERATE_USERS_WITH_REAL_NAMES
+    _default_user_state['as_handles'] = ETC_USE_USER_HANDLES
+    _default_user_state['users'] = {}
+    _default_user_state['activated_in_test'] = _default_user_state['in_test']
+    _default_user_state['test_created'] = set()
+
+
+def _deactivate_default_users():
+    """Drops all default test users, and prevents further creation until next activated."""
+    _default_user_state['extra_usergen_kwargs'] = None
+    _default_user_state['users'] = {}
+    _default_user_state['test_created'] = set()
+
+
+def _end_default_users_test():
+    """Drops default test users that were created during the current test, as they're rolled back with it."""
+    _default_user_state['in_test'] = False
+    if _default_user_state['activated_in_test']:
+        _deactivate_default_users()
+    else:
+        for name in _default_user_state['test_created']:
+            _default_user_state['users'].pop(name, None)
+        _default_user_state['test_created'] = set()
+
+
+def _set_default_user_names(user, name, with_real_names):
+    """Sets name values for the default test user corresponding to the given attribute name."""
+    # If fields exist, then they will populate on save. Else are ignored.
+    if with_real_names:
+        user.first_name, user.last_name, user.name = _DEFAULT_USER_VALUES[name]['real_names']
+    else:
+        user.first_name, user.last_name, user.name = _DEFAULT_USER_VALUES[name]['names']
+
+
+def _create_default_user(name, password, with_real_names, extra_usergen_kwargs, using=None):
+    """Creates the default test user corresponding to the given attribute name."""
+    user_values = _DEFAULT_USER_VALUES[name]
+
+    user_manager = get_user_model()._default_manager.db_manager(using)
+    user = user_manager.create_user(
+        **{ETC_USER_MODEL_IDENTIFIER: user_values['identifier']},
+        password=password,
+        **user_values['create_kwargs'],
+        **extra_usergen_kwargs,
+    )
+    # Attempt to set fields and then save. If fields exist, then they will populate. Else are ignored.
+    _set_default_user_names(user, name, with_real_names)
+    if ETC_USER_MODEL_IDENTIFIER.lower() != 'email':
+        user.email = user_values['email']
+    user.save(using=using)
+
+    # Password was already set on create, so only the unhashed value needs to be tracked.
+    user.unhashed_password = password
+    # Newly created, so guaranteed to have no Groups/Permissions yet.
+    _set_user_auth_record(user)
+
+    return user
+
+
+# Index of the currently running test. Used to know when per-test cached values are no longer valid.
+_user_handle_test = {'index': 0}
+
+
+class UserHandle:
+    """Lightweight reference to a user, for storing on a TestCase class, such as in setUpTestData().
+
+    Only holds the user pk, identifier, and field values at time of creation. Django's per-test deepcopy of
+    class data is then trivial, compared to copying a full model instance (plus any prefetched relations).
+    On first access within each test, a fresh user instance is rebuilt from held values without querying,
+    and then cached until the end of said test.
+    """
+
+    def __init__(self, user):
+        self.pk = user.pk
+        self.identifier = getattr(user, ETC_USER_MODEL_IDENTIFIER)
+        self._model = type(user)
+        self._db = user._state.db
+        self._field_names = tuple(field.attname for field in user._meta.concrete_fields)
+        self._values = tuple(getattr(user, field_name) for field_name in self._field_names)
+
+        # Also hold non-field values attached to instance, such as "unhashed_password" and ETC's auth record.
+        # Relation caches are intentionally excluded.
+        self._extra_values = {
+            key: value
+            for key, value in user.__dict__.items()
+            if key not in self._field_names and (not key.startswith('_') or key == '_etc_auth_record')
+        }
+
+        self._cached_user = None
+        self._cached_index = None
+
+    def __repr__(self):
+        return '<UserHandle: {0} (pk={1})>'.format(self.identifier, self.pk)
+
+    def __deepcopy__(self, memo):
+        # Handle holds no per-test state that needs copying, so is safe to share between tests as-is.
+        return self
+
+    def get(self):
+        """Returns user instance for the current test.
+
+        :return: User object.
+        """
+        if self._cached_user is None or self._cached_index != _user_handle_test['index']:
+            self._cached_user = self._build_user()
+            self._cached_index = _user_handle_test['index']
+        return self._cached_user
+
+    def _build_user(self):
+        """Returns a new user instance, built from held values without querying."""
+        user = self._model.from_db(self._db, self._field_names, self._values)
+        user.__dict__.update(self._extra_values)
+        return user
+
+
+class _DefaultUser:
+    """Descriptor for a default test user, such as `test_user`. The user is created on first access.
+
+    When auto-generation is not active, class-level access returns the descriptor itself (same as an unbound
+    function would), so that test loaders and other introspection never trigger user creation.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if _default_user_state['extra_usergen_kwargs'] is None:
+            # Auto-generation not currently active. Behave as if attribute is not set.
+            if instance is None:
+                return self
+            raise AttributeError(
+                "'{0}' object has no attribute '{1}'".format(type(instance).__name__, self.name),
+            )
+
+        user = _default_user_state['users'].get(self.name, None)
+        if user is None:
+            user = _create_default_user(
+                self.name,
+                _default_user_state['password'],
+                _default_user_state['with_real_names'],
+                _default_user_state['extra_usergen_kwargs'],
+            )
+            if _default_user_state['in_test']:
+                # Created within test, rather than class setup. Will be rolled back at end of test.
+                _default_user_state['test_created'].add(self.name)
+            elif _default_user_state['as_handles']:
+                # Created as part of class setup. Hold as handle, so each test gets its own instance.
+                user = UserHandle(user)
+            _default_user_state['users'][self.name] = user
+
+        if isinstance(user, UserHandle):
+            return user.get()
+        return user
+
+
+# Environment variable used to tell parallel test worker processes that default users were pre-created,
+# in the test database that each worker's database was cloned from. Value is the database alias.
+_PRECREATED_USERS_ENV_VAR = 'DJANGO_EXPANDED_TESTCASES_PRECREATED_USERS'
+
+# Default users pre-created as part of test database setup, held as handles.
+# Only populated when using the ETC test runner or pytest plugin.
+_precreated_users = {
+    'handles': None,
+    'password': None,
+    'with_real_names': False,
+}
+
+
+def _precreate_default_users(using=None):
+    """Creates all default test users directly in the test database, as part of test database setup.
+
+    Users are then created once per test run, rather than once per test or class.
+
+    :param using: Database alias to create users in. Defaults to the database used for writing users.
+    """
+    # Django imports here to avoid situational "Apps aren't loaded yet" error.
+    from django.db import router
+
+    user_model = get_user_model()
+    if using is None:
+        using = router.db_for_write(user_model)
+
+    # Remove any users left over from a prior run, such as when the test database is kept between runs.
+    identifiers = [user_values['identifier'] for user_values in _DEFAULT_USER_VALUES.values()]
+    user_model._default_manager.using(using).filter(
+        **{'{0}__in'.format(ETC_USER_MODEL_IDENTIFIER): identifiers},
+    ).delete()
+
+    _precreated_users['handles'] = {
+        name: UserHandle(
+            _create_default_user(name, ETC_DEFAULT_USER_PASSWORD, ETC_GENERATE_USERS_WITH_REAL_NAMES, {}, using=using)
+        )
+        for name in _DEFAULT_USER_VALUES
+    }
+    _precreated_users['password'] = ETC_DEFAULT_USER_PASSWORD
+    _precreated_users['with_real_names'] = ETC_GENERATE_USERS_WITH_REAL_NAMES
+    os.environ[_PRECREATED_USERS_ENV_VAR] = using
+
+
+def _clear_precreated_default_users():
+    """Forgets any pre-created default test users. Run on test database teardown."""
+    _precreated_users['handles'] = None
+    os.environ.pop(_PRECREATED_USERS_ENV_VAR, None)
+
+
+def _get_precreated_default_users():
+    """Returns handles of pre-created default test users, or None if users were not pre-created."""
+    using = os.environ.get(_PRECREATED_USERS_ENV_VAR, None)
+    if _precreated_users['handles'] is None and using:
+        # Users were pre-created by a parent process, before the test database was cloned for this worker.
+        # Load them from the database once, for this process.
+        identifiers = [user_values['identifier'] for user_values in _DEFAULT_USER_VALUES.values()]
+        user_model = get_user_model()
+        user_query = user_model._default_manager.using(using).filter(
+            **{'{0}__in'.format(ETC_USER_MODEL_IDENTIFIER): identifiers},
+        )
+        users = {getattr(user, ETC_USER_MODEL_IDENTIFIER): user for user in user_query}
+        handles = {}
+        for name, user_values in _DEFAULT_USER_VALUES.items():
+            user = users.get(user_values['identifier'], None)
+            if user is None:
+                # Users are missing. Fall back to standard generation.
+                return None
+            _set_default_user_names(user, name, ETC_GENERATE_USERS_WITH_REAL_NAMES)
+            user.unhashed_password = ETC_DEFAULT_USER_PASSWORD
+            _set_user_auth_record(user)
+            handles[name] = UserHandle(user)
+
+        _precreated_users['handles'] = handles
+        _precreated_users['password'] = ETC_DEFAULT_USER_PASSWORD
+        _precreated_users['with_real_names'] = ETC_GENERATE_USERS_WITH_REAL_NAMES
+
+    return _precreated_users['handles']
+
+
+def _bind_precreated_default_users():
+    """Uses pre-created default test users for current test/class, if any exist and match current settings."""
+    handles = _get_precreated_default_users()
+    if handles is None:
+        return
+
+    user_model = get_user_model()
+    user_pks = [handle.pk for handle in handles.values()]
+    if (
+        not _default_user_state['extra_usergen_kwargs']
+        and _default_user_state['password'] == _precreated_users['password']
+        and _default_user_state['with_real_names'] == _precreated_users['with_real_names']
+        and user_model._default_manager.filter(pk__in=user_pks).count() == len(user_pks)
+    ):
+        # Pre-created users are usable as-is. Each test gets its own instance from the corresponding handle.
+        for name, handle in handles.items():
+            # Any Group/Permission changes from prior tests have since been rolled back, so users have none.
+            user = handle._build_user()
+            _set_user_auth_record(user)
+            _default_user_state['users'][name] = UserHandle(user)
+    else:
+        # Pre-created users don't match current settings, or have been removed (such as by a database flush).
+        # Remove any that remain, so that users are generated fresh. Removal is rolled back with other test data.
+        user_model._default_manager.filter(pk__in=user_pks).delete()
+
+
+# endregion Default User Logic
+
+
 class BaseMixin:
     """Base mixin that all other project classes should inherit from in some way.
 
@@ -151,6 +720,12 @@ class CoreTestCaseMixin(BaseMixin):
     Therefore we treat this as a separate mixin that inherits from nothing, and is included in all.
     """
 
+    # Default "special case" test users. Only created on first access.
+    test_superuser = _DefaultUser()
+    test_admin = _DefaultUser()
+    test_inactive_user = _DefaultUser()
+    test_user = _DefaultUser()
+
     # region Class Functions
 
     @classmethod
@@ -172,6 +747,9 @@ class CoreTestCaseMixin(BaseMixin):
 
         cls._site_root_url = None
 
+        # Track user Group/Permission changes, so that debug output can avoid re-querying them.
+        _connect_user_auth_signals()
+
     @classmethod
     def setUpTestData(cls, *args, extra_usergen_kwargs=None, **kwargs):
         """Test logic setup run at the start of class creation, specifically for data setup.
@@ -208,6 +786,24 @@ class CoreTestCaseMixin(BaseMixin):
         # Call parent logic.
         super().setUp(*args, **kwargs)
 
+        # Track that any default users created from here on are specific to this test.
+        _default_user_state['in_test'] = True
+        _user_handle_test['index'] += 1
+
+        # Snapshot of user auth revisions, to know at tearDown if any Group/Permission records went stale.
+        self._user_auth_revisions_at_setup = dict(_user_auth_revisions)
+
+        # Map of identifier to user instance, for users resolved by get_user() during this test.
+        # Ensures each user is only queried (and has password set) once per test.
+        self._user_identity_map = {}
+
+        # Optionally hold debug output for the duration of the test, so background rendering can be used.
+        # Held output is displayed in original order on test tearDown.
+        if ETC_DEBUG_PRINT__BACKGROUND_RENDER and self._debug_print_bool:
+            _debug_output_local.buffer = []
+        else:
+            _debug_output_local.buffer = None
+
         if len(ETC_DEBUG_PRINT__TEST_SEPARATOR) > 0:
             self._debug_print(ETC_DEBUG_PRINT__TEST_SEPARATOR)
 
@@ -232,11 +828,54 @@ class CoreTestCaseMixin(BaseMixin):
         # Reset display error, in case multiple subtests run and fail in a given test.
         self._error_displayed = False
 
+    def tearDown(self, *args, **kwargs):
+        """Test logic setup run at the end of every test function."""
+
+        # Call parent logic.
+        super().tearDown(*args, **kwargs)
+
+        # Display any debug output held for background rendering.
+        self._display_held_debug_output()
+
+        # Clear users resolved during test, so that instances never carry over to the next test.
+        self._user_identity_map = None
+
+        # Drop default users created during test, as they are rolled back with the rest of the test data.
+        _end_default_users_test()
+
+        # Invalidate all records of user Groups/Permissions if any changed during test, as such changes are rolled back.
+        # Otherwise users shared across tests (such as from setUpTestData()) would keep a record of rolled back data.
+        if _user_auth_revisions != self._user_auth_revisions_at_setup:
+            _increment_user_auth_revision()
+
+        # Drop cached Permission/Group lookups if they changed during test, as such changes are rolled back.
+        if _auth_lookup_cache['changed_in_test']:
+            _clear_auth_lookup_cache()
+            _auth_lookup_cache['changed_in_test'] = False
+
+    @classmethod
+    def tearDownClass(cls, *args, **kwargs):
+        """Test logic setup run at the end of class execution, as part of termination/clean up."""
+
+        # Call parent logic.
+        super().tearDownClass(*args, **kwargs)
+
+        # Drop default users, as they are rolled back with the rest of the class data.
+        _deactivate_default_users()
+
+        # Drop cached Permission/Group lookups if they changed during class, such as in setUpTestData().
+        if _auth_lookup_cache['changed_in_class']:
+            _clear_auth_lookup_cache()
+            _auth_lookup_cache['changed_in_class'] = False
+
     @classmethod
     def _auto_generate_test_users(cls, extra_usergen_kwargs=None):
         """Logic to automatically generate test users.
 
         Only run if DJANGO_EXPANDED_TESTCASES_AUTO_GENERATE_USERS setting is true.
+        If DJANGO_EXPANDED_TESTCASES_AUTO_GENERATE_USERS_LAZILY setting is also true,
+        then users are instead created on first access of the corresponding class attribute.
+        If users were pre-created during test database setup (see ExpandedTestRunner), then those are reused instead.
         """
         # Django imports here to avoid situational "Apps aren't loaded yet" error.
         from django.contrib.auth.models import AnonymousUser
@@ -249,91 +888,16 @@ class CoreTestCaseMixin(BaseMixin):
                 'get_user_model().objects.create_user() function.'
             )
 
-        # Generate "special case" test user instances.
+        # Set up "special case" test user instances.
         # Guarantees that there will always be at least some default User models when tests are run.
-
-        # Superuser model. Can access/see everything, regardless of permissions.
-        cls.test_superuser = get_user_model().objects.create_user(
-            **{ETC_USER_MODEL_IDENTIFIER: ETC_DEFAULT_SUPER_USER_IDENTIFIER},
-            password=ETC_DEFAULT_USER_PASSWORD,
-            is_superuser=True,
-            **extra_usergen_kwargs,
-        )
-        # Attempt to set fields and then save. If fields exist, then they will populate. Else are ignored.
-        if ETC_GENERATE_USERS_WITH_REAL_NAMES:
-            cls.test_superuser.first_name = 'John'
-            cls.test_superuser.last_name = 'Doe'
-            cls.test_superuser.name = 'John'
-        else:
-            cls.test_superuser.first_name = 'SuperUserFirst'
-            cls.test_superuser.last_name = 'SuperUserLast'
-            cls.test_superuser.name = 'SuperUserName'
-        if ETC_USER_MODEL_IDENTIFIER.lower() != 'email':
-            cls.test_superuser.email = 'super_user@example.com'
-        cls.test_superuser.save()
-        cls.test_superuser = cls.get_user(cls, ETC_DEFAULT_SUPER_USER_IDENTIFIER)
-
-        # Admin user model. Can access Django admin.
-        cls.test_admin = get_user_model().objects.create_user(
-            **{ETC_USER_MODEL_IDENTIFIER: ETC_DEFAULT_ADMIN_USER_IDENTIFIER},
-            password=ETC_DEFAULT_USER_PASSWORD,
-            is_staff=True,
-            **extra_usergen_kwargs,
-        )
-        # Attempt to set fields and then save. If fields exist, then they will populate. Else are ignored.
-        if ETC_GENERATE_USERS_WITH_REAL_NAMES:
-            cls.test_admin.first_name = 'Jenny'
-            cls.test_admin.last_name = 'Johnson'
-            cls.test_admin.name = 'Jenny'
-        else:
-            cls.test_admin.first_name = 'AdminUserFirst'
-            cls.test_admin.last_name = 'AdminUserLast'
-            cls.test_admin.name = 'AdminUserName'
-        if ETC_USER_MODEL_IDENTIFIER.lower() != 'email':
-            cls.test_admin.email = 'admin_user@example.com'
-        cls.test_admin.save()
-        cls.test_admin = cls.get_user(cls, ETC_DEFAULT_ADMIN_USER_IDENTIFIER)
-
-        # Inactive user model. Has "is_active" set to false, and cannot login.
-        cls.test_inactive_user = get_user_model().objects.create_user(
-            **{ETC_USER_MODEL_IDENTIFIER: ETC_DEFAULT_INACTIVE_USER_IDENTIFIER},
-            password=ETC_DEFAULT_USER_PASSWORD,
-            is_active=False,
-            **extra_usergen_kwargs,
-        )
-        # Attempt to set fields and then save. If fields exist, then they will populate. Else are ignored.
-        if ETC_GENERATE_USERS_WITH_REAL_NAMES:
-            cls.test_inactive_user.first_name = 'Clang'
-            cls.test_inactive_user.last_name = 'Zythor'
-            cls.test_inactive_user.name = 'Clang'
-        else:
-            cls.test_inactive_user.first_name = 'InactiveUserFirst'
-            cls.test_inactive_user.last_name = 'InactiveUserLast'
-            cls.test_inactive_user.name = 'InactiveUserName'
-        if ETC_USER_MODEL_IDENTIFIER.lower() != 'email':
-            cls.test_inactive_user.email = 'inactive_user@example.com'
-        cls.test_inactive_user.save()
-        cls.test_inactive_user = cls.get_user(cls, ETC_DEFAULT_INACTIVE_USER_IDENTIFIER)
-
-        # Standard user model.
-        cls.test_user = get_user_model().objects.create_user(
-            **{ETC_USER_MODEL_IDENTIFIER: ETC_DEFAULT_STANDARD_USER_IDENTIFIER},
-            password=ETC_DEFAULT_USER_PASSWORD,
-            **extra_usergen_kwargs,
-        )
-        # Attempt to set fields and then save. If fields exist, then they will populate. Else are ignored.
-        if ETC_GENERATE_USERS_WITH_REAL_NAMES:
-            cls.test_user.first_name = 'Sammy'
-            cls.test_user.last_name = 'Smith'
-            cls.test_user.name = 'Sammy'
-        else:
-            cls.test_user.first_name = 'UserFirst'
-            cls.test_user.last_name = 'UserLast'
-            cls.test_user.name = 'StandardUserName'
-        if ETC_USER_MODEL_IDENTIFIER.lower() != 'email':
-            cls.test_user.email = 'user@example.com'
-        cls.test_user.save()
-        cls.test_user = cls.get_user(cls, ETC_DEFAULT_STANDARD_USER_IDENTIFIER)
+        _activate_default_users(extra_usergen_kwargs)
+        _bind_precreated_default_users()
+        if not ETC_AUTO_GENERATE_USERS_LAZILY or not _default_user_state['in_test']:
+            # Create all users now.
+            # Always the case for class setup, so that users are shared by every test in class.
+            # Otherwise, each is created on first access, so that unused users cost nothing.
+            for name in _DEFAULT_USER_VALUES:
+                getattr(cls, name)
 
         # Set actual default "class user" for tests based on settings.
         if ETC_REQUEST_USER_STRICTNESS == 'anonymous':
@@ -361,11 +925,69 @@ class CoreTestCaseMixin(BaseMixin):
         Mostly used for internal testcase logic.
         """
         if self._debug_print_bool:
-            print(fore, end='')
-            print(back, end='')
-            print(style, end='')
-            print(*args, **kwargs, end='')
-            print(ETC_OUTPUT_RESET_COLOR)
+            output_buffer = getattr(_debug_output_local, 'buffer', None)
+            if output_buffer is None:
+                if ETC_DEBUG_PRINT__COLOR:
+                    print(fore, end='')
+                    print(back, end='')
+                    print(style, end='')
+                    print(*args, **kwargs, end='')
+                    print(ETC_OUTPUT_RESET_COLOR)
+                else:
+                    # Console coloring disabled. Skip all color formatting.
+                    print(*args, **kwargs)
+            else:
+                # Output is currently being held. Save to display later.
+                output = io.StringIO()
+                if ETC_DEBUG_PRINT__COLOR:
+                    print(fore, back, style, sep='', end='', file=output)
+                    print(*args, **kwargs, end='', file=output)
+                    print(ETC_OUTPUT_RESET_COLOR, file=output)
+                else:
+                    print(*args, **kwargs, file=output)
+                output_buffer.append(output.getvalue())
+
+    def _debug_print_in_background(self, render_function, *args, **kwargs):
+        """Runs given debug output function, in a background thread if DEBUG_PRINT__BACKGROUND_RENDER is enabled.
+
+        Function args are deep-copied, so that rendering works off a snapshot of values at time of call.
+        As such, the function should not rely on database access or other state of the test itself.
+
+        :param render_function: Debug output function to run.
+        """
+        output_buffer = getattr(_debug_output_local, 'buffer', None)
+        if output_buffer is None or getattr(_debug_output_local, 'is_render_thread', False):
+            # Not holding output, or already within a render thread. Run immediately.
+            render_function(*args, **kwargs)
+        else:
+            output_buffer.append(
+                _get_debug_render_executor().submit(
+                    _render_debug_output,
+                    render_function,
+                    *copy.deepcopy(args),
+                    **copy.deepcopy(kwargs),
+                )
+            )
+
+    def _display_held_debug_output(self):
+        """Displays any debug output held while background rendering was enabled, in original order."""
+        output_buffer = getattr(_debug_output_local, 'buffer', None)
+        _debug_output_local.buffer = None
+        if output_buffer is None:
+            return
+
+        for output in output_buffer:
+            if isinstance(output, Future):
+                # Wait on background render to finish.
+                try:
+                    output = ''.join(output.result())
+                except Exception as err:
+                    output = '{0}Failed to render debug output: {1}{2}\n'.format(
+                        ETC_OUTPUT_ERROR_COLOR,
+                        err,
+                        ETC_OUTPUT_RESET_COLOR,
+                    )
+            print(output, end='')
 
     # region Custom Assertions
 
@@ -397,178 +1019,28 @@ class CoreTestCaseMixin(BaseMixin):
         except AssertionError as err:
             # Assertion failed. Provide debug output.
 
-            # Loop through to calculate color output differences.
-            # First split on newlines.
-            split_expected = expected_text.split('\n')
-            split_actual = actual_text.split('\n')
-            append_newline = False
-
-            # Handle if either is empty.
-            if len(split_expected) == 1 and split_expected[0].strip() == '':
-                split_expected = []
-            if len(split_actual) == 1 and split_actual[0].strip() == '':
-                split_actual = []
-
-            # Determine which one is longer.
-            if len(split_actual) > len(split_expected):
-                max_lines = len(split_actual)
-            else:
-                max_lines = len(split_expected)
-
-            formatted_expected_output = ''
-            formatted_actual_output = ''
-            total_actual_count_thus_far = 0
-            total_actual_index = None
-            actual_text_total_len = len(actual_text)
+            # Handle if compare_index value is provided, for startsWith() and endsWith() versions.
+            # Only the corresponding portion of actual text is compared. The remainder displays without coloring.
+            leading_text = ''
+            trailing_text = ''
             if compare_index is not None:
                 if compare_index > 0:
-                    # Is positive, so starstWith().
-                    total_actual_index = 0
+                    # Is positive, so startsWith(). Compare from start of text.
+                    trailing_text = actual_text[compare_index:]
+                    actual_text = actual_text[:compare_index]
                 else:
-                    # Is negative, so endsWith().
-                    total_actual_index = actual_text_total_len
-
-            # Loop through all lines.
-            for line_index in range(max_lines):
-
-                # Check if expected/actual each have lines up to this index.
-                try:
-                    curr_expected_line = split_expected[line_index]
-                    if append_newline:
-                        curr_expected_line = '\n{0}'.format(curr_expected_line)
-                except IndexError:
-                    curr_expected_line = None
-                try:
-                    curr_actual_line = split_actual[line_index]
-                    if append_newline:
-                        curr_actual_line = '\n{0}'.format(curr_actual_line)
-                except IndexError:
-                    curr_actual_line = None
-                append_newline = False
-
-                # Handle if compare_index value is provided.
-                if compare_index is not None and line_index > 0:
-                    if compare_index > 0:
-                        # Is positive, so startsWith. Count from start of text.
-                        total_actual_index = total_actual_count_thus_far
-                    else:
-                        # Is negative, so endsWith(). Count from end of text.
-                        total_actual_index = actual_text_total_len - total_actual_count_thus_far
-
-                if curr_expected_line == curr_actual_line:
-                    # Line is full match and correct.
-                    curr_expected_line = '{output_color}{line_output}{reset_color}\n'.format(
-                        output_color=ETC_OUTPUT_EXPECTED_MATCH_COLOR,
-                        line_output=curr_expected_line,
-                        reset_color=ETC_OUTPUT_RESET_COLOR,
-                    )
-                    curr_actual_line = '{output_color}{line_output}{reset_color}\n'.format(
-                        output_color=ETC_OUTPUT_ACTUALS_MATCH_COLOR,
-                        line_output=curr_actual_line,
-                        reset_color=ETC_OUTPUT_RESET_COLOR,
-                    )
-                elif curr_expected_line is None:
-                    # "Actual" output is longer than "expected" output. Impossible to match current line.
-                    curr_expected_line = ''
-                    curr_actual_line = '{output_color}{line_output}{reset_color}\n'.format(
-                        output_color=ETC_OUTPUT_ACTUALS_ERROR_COLOR,
-                        line_output=curr_actual_line,
-                        reset_color=ETC_OUTPUT_RESET_COLOR,
-                    )
-                elif curr_actual_line is None:
-                    # "Expected" output is longer than "actual" output. Impossible to match current line.
-                    curr_expected_line = '{output_color}{line_output}{reset_color}\n'.format(
-                        output_color=ETC_OUTPUT_EXPECTED_ERROR_COLOR,
-                        line_output=curr_expected_line,
-                        reset_color=ETC_OUTPUT_RESET_COLOR,
-                    )
-                    curr_actual_line = ''
-                else:
-                    # Both lines are populated but do not match.
-                    # Determine which one is longer.
-                    if len(curr_actual_line) > len(curr_expected_line):
-                        max_chars = len(curr_actual_line)
-                    else:
-                        max_chars = len(curr_expected_line)
-
-                    # Check each character and determine where non-match happens.
-                    curr_expected_color = ETC_OUTPUT_RESET_COLOR
-                    curr_actual_color = ETC_OUTPUT_RESET_COLOR
-                    curr_expected_char_line = ''
-                    curr_actual_char_line = ''
-                    for char_index in range(max_chars):
-
-                        # Handle if starstWith() or endsWith().
-                        do_char_compare = True
-                        if compare_index is not None:
-                            if compare_index > 0:
-                                # Is positive, so startsWith()
-                                total_actual_index += 1
-
-                                # Skip comparison if actual_index is past compare_index.
-                                if total_actual_index > compare_index:
-                                    do_char_compare = False
-                            else:
-                                # Is negative, so endsWith().
-                                total_actual_index -= 1
-
-                                # Skip comparison if actual_index is before compare_index.
-                                if total_actual_index > -compare_index:
-                                    do_char_compare = False
-
-                        # Grab current character.
-                        try:
-                            expected_char = curr_expected_line[char_index]
-                        except IndexError:
-                            expected_char = ''
-                        try:
-                            actual_char = curr_actual_line[char_index]
-                        except IndexError:
-                            actual_char = ''
-
-                        # Format based on match.
-                        if not do_char_compare:
-                            # Skip comparison, for either startsWith() or endsWith() assertions.
-                            if curr_expected_color != ETC_OUTPUT_RESET_COLOR:
-                                curr_expected_color = ETC_OUTPUT_RESET_COLOR
-                                curr_expected_char_line += curr_expected_color
-                            if curr_actual_color != ETC_OUTPUT_RESET_COLOR:
-                                curr_actual_color = ETC_OUTPUT_RESET_COLOR
-                                curr_actual_char_line += curr_actual_color
-
-                        elif expected_char == actual_char:
-                            # Match.
-                            if curr_expected_color != ETC_OUTPUT_EXPECTED_MATCH_COLOR:
-                                curr_expected_color = ETC_OUTPUT_EXPECTED_MATCH_COLOR
-                                curr_expected_char_line += curr_expected_color
-                            if curr_actual_color != ETC_OUTPUT_ACTUALS_MATCH_COLOR:
-                                curr_actual_color = ETC_OUTPUT_ACTUALS_MATCH_COLOR
-                                curr_actual_char_line += curr_actual_color
-
-                        else:
-                            # Non-match.
-                            if curr_expected_color != ETC_OUTPUT_EXPECTED_ERROR_COLOR:
-                                curr_expected_color = ETC_OUTPUT_EXPECTED_ERROR_COLOR
-                                curr_expected_char_line += curr_expected_color
-                            if curr_actual_color != ETC_OUTPUT_ACTUALS_ERROR_COLOR:
-                                curr_actual_color = ETC_OUTPUT_ACTUALS_ERROR_COLOR
-                                curr_actual_char_line += curr_actual_color
-
-                        curr_expected_char_line += '{0}'.format(expected_char)
-                        curr_actual_char_line += '{0}'.format(actual_char)
-
-                    # Update output strings.
-                    append_newline = True
-                    formatted_expected_output += curr_expected_char_line
-                    formatted_actual_output += curr_actual_char_line
-                    continue
-
-                # Update output strings.
-                formatted_expected_output += curr_expected_line
-                formatted_actual_output += curr_actual_line
-
-                # Update total actual length.
-                total_actual_count_thus_far += len(curr_actual_line)
+                    # Is negative, so endsWith(). Compare from end of text.
+                    split_index = max(len(actual_text) + compare_index, 0)
+                    leading_text = actual_text[:split_index]
+                    actual_text = actual_text[split_index:]
+
+            # Calculate color output differences.
+            formatted_expected_output, formatted_actual_output = self._get_text_diff_output(
+                expected_text,
+                actual_text,
+                leading_text=leading_text,
+                trailing_text=trailing_text,
+            )
 
             # Finally print actual debug output.
             self._debug_print('')
@@ -595,15 +1067,18 @@ class CoreTestCaseMixin(BaseMixin):
         actual_text = str(actual_text)
 
         # Handle optional cleaning params.
+        # Actual text is only scanned for outer whitespace, to avoid copying potentially large values.
         if strip:
             expected_text = expected_text.strip()
-            actual_text = actual_text.strip()
+        actual_start, actual_end = self._get_text_bounds(actual_text, strip=strip)
 
         # Check if start matches.
-        if not str(actual_text).startswith(expected_text):
+        if not actual_text.startswith(expected_text, actual_start, actual_end):
             # Failed to match. Call original assertText for output handling.
+            # Only provide the relevant portion of actual text, plus some extra for context.
             text_length = len(expected_text)
-            return self.assertText(expected_text, actual_text, text_length, strip=strip)
+            actual_text = actual_text[actual_start : min(actual_start + text_length + _TEXT_EXTRA_LENGTH, actual_end)]
+            return self.assertText(expected_text, actual_text, text_length, strip=False)
 
         # Passed.
         return True
@@ -611,22 +1086,25 @@ class CoreTestCaseMixin(BaseMixin):
     def assertTextEndsWith(self, expected_text, actual_text, strip=True):
         """Modified wrapper for assertEqual(), that prints full values to console on mismatch.
 
-        Considered a pass if entire string of "expected_text" is at the beginning of "actual_text" variable.
+        Considered a pass if entire string of "expected_text" is at the end of "actual_text" variable.
         """
         # Enforce str type.
         expected_text = str(expected_text)
         actual_text = str(actual_text)
 
         # Handle optional cleaning params.
+        # Actual text is only scanned for outer whitespace, to avoid copying potentially large values.
         if strip:
             expected_text = expected_text.strip()
-            actual_text = actual_text.strip()
+        actual_start, actual_end = self._get_text_bounds(actual_text, strip=strip)
 
         # Check if ending matches.
-        if not str(actual_text).endswith(expected_text):
+        if not actual_text.endswith(expected_text, actual_start, actual_end):
             # Failed to match. Call original assertText for output handling.
+            # Only provide the relevant portion of actual text, plus some extra for context.
             text_length = len(expected_text)
-            return self.assertText(expected_text, actual_text, compare_index=-text_length, strip=strip)
+            actual_text = actual_text[max(actual_end - text_length - _TEXT_EXTRA_LENGTH, actual_start) : actual_end]
+            return self.assertText(expected_text, actual_text, compare_index=-text_length, strip=False)
 
         # Passed.
         return True
@@ -638,7 +1116,7 @@ class CoreTestCaseMixin(BaseMixin):
     def get_user(self, user, password=ETC_DEFAULT_USER_PASSWORD, extra_usergen_kwargs=None):
         """Returns user matching provided value.
 
-        :param user: User model, or corresponding user identifier, to use.
+        :param user: User model, UserHandle, or corresponding user identifier, to use.
         :param password: Password str to assign to user.
         :param extra_usergen_kwargs: Optional extra kwargs to pass into the
                                      get_user_model().objects.create_user()
@@ -651,6 +1129,10 @@ class CoreTestCaseMixin(BaseMixin):
             # Already User model. This is fine.
             pass
 
+        elif isinstance(user, UserHandle):
+            # Lightweight user reference. Get corresponding instance for current test.
+            user = user.get()
+
         # Handle all "special cases" for testing logic.
         elif ETC_AUTO_GENERATE_USERS is True and user == ETC_DEFAULT_SUPER_USER_IDENTIFIER:
             user = self.test_superuser
@@ -672,16 +1154,34 @@ class CoreTestCaseMixin(BaseMixin):
                     'get_user_model().objects.create_user() function.'
                 )
 
-            try:
-                user = get_user_model().objects.get(
-                    **{ETC_USER_MODEL_IDENTIFIER: str(user)},
-                    **extra_usergen_kwargs,
-                )
-            except get_user_model().DoesNotExist:
-                user = get_user_model().objects.create(
-                    **{ETC_USER_MODEL_IDENTIFIER: str(user)},
-                    **extra_usergen_kwargs,
-                )
+            # Check for user already resolved during this test.
+            # Only simple identifier lookups are tracked, as extra kwargs may further filter the result.
+            user_identity_map = getattr(self, '_user_identity_map', None)
+            if extra_usergen_kwargs:
+                user_identity_map = None
+            identifier = str(user)
+            cached_user = None
+            if user_identity_map is not None:
+                cached_user = user_identity_map.get(identifier, None)
+
+            if cached_user is not None and cached_user.pk is not None:
+                user = cached_user
+            else:
+                try:
+                    user = get_user_model().objects.get(
+                        **{ETC_USER_MODEL_IDENTIFIER: identifier},
+                        **extra_usergen_kwargs,
+                    )
+                except get_user_model().DoesNotExist:
+                    user = get_user_model().objects.create(
+                        **{ETC_USER_MODEL_IDENTIFIER: identifier},
+                        **extra_usergen_kwargs,
+                    )
+                    # Newly created, so guaranteed to have no Groups/Permissions yet.
+                    _set_user_auth_record(user)
+
+                if user_identity_map is not None:
+                    user_identity_map[identifier] = user
 
         # Handle passwords.
         if not hasattr(user, 'unhashed_password') or user.unhashed_password != password:
@@ -695,6 +1195,85 @@ class CoreTestCaseMixin(BaseMixin):
 
         return user
 
+    def make_users(self, user_specs, password=ETC_DEFAULT_USER_PASSWORD):
+        """Creates multiple new users at once, each with their own Permissions/Groups.
+
+        All users share a single precomputed password hash, and are created with one bulk insert.
+        Permissions and Groups are then each added with one bulk insert, regardless of user count.
+
+        :param user_specs: Dict of {user identifier: spec}. Each spec is either a list of Permissions,
+                           or a dict with optional `user_permissions` and `user_groups` lists, plus any other
+                           user field values.
+        :param password: Password str to assign to all users.
+        :return: Dict of {user identifier: UserHandle}.
+        """
+        user_model = get_user_model()
+
+        # Handle passwords.
+        password = str(password).strip()
+        if len(password) == 0:
+            # Empty password. Reset back to default settings value.
+            password = ETC_DEFAULT_USER_PASSWORD
+        password_hash = _get_password_hash(password)
+
+        # Build all user instances, along with the Permissions/Groups each should have.
+        users = []
+        user_auth = []
+        for identifier, spec in user_specs.items():
+            if isinstance(spec, dict):
+                spec = dict(spec)
+                user_permissions = spec.pop('user_permissions', None) or []
+                user_groups = spec.pop('user_groups', None) or []
+            elif isinstance(spec, (list, tuple)):
+                user_permissions, user_groups, spec = spec, [], {}
+            else:
+                raise TypeError('Provided user spec must be either a list of Permissions, or a dict.')
+
+            # Remove any duplicate Permissions/Groups, as each is only added once.
+            permissions = {permission.pk: permission for permission in self._get_permissions(user_permissions)}
+            groups = {group.pk: group for group in self._get_groups(user_groups)}
+
+            users.append(user_model(**{ETC_USER_MODEL_IDENTIFIER: str(identifier), 'password': password_hash, **spec}))
+            user_auth.append((list(permissions.values()), list(groups.values())))
+
+        user_model._default_manager.bulk_create(users)
+        if any(user.pk is None for user in users):
+            # Database backend doesn't return pks on bulk create. Get them with a single query.
+            user_pks = dict(
+                user_model._default_manager.filter(
+                    **{'{0}__in'.format(ETC_USER_MODEL_IDENTIFIER): [str(identifier) for identifier in user_specs]}
+                ).values_list(ETC_USER_MODEL_IDENTIFIER, 'pk')
+            )
+            for user in users:
+                user.pk = user_pks[getattr(user, ETC_USER_MODEL_IDENTIFIER)]
+                user._state.adding = False
+
+        # Add all Permissions/Groups, with a single insert per through table.
+        for field_name, auth_index in (('user_permissions', 0), ('groups', 1)):
+            field = user_model._meta.get_field(field_name)
+            through_rows = [
+                field.remote_field.through(**{field.m2m_field_name(): user, field.m2m_reverse_field_name(): item})
+                for user, auth in zip(users, user_auth)
+                for item in auth[auth_index]
+            ]
+            if through_rows:
+                field.remote_field.through._default_manager.bulk_create(through_rows)
+
+        handles = {}
+        user_identity_map = getattr(self, '_user_identity_map', None)
+        for identifier, user, (permissions, groups) in zip(user_specs, users, user_auth):
+            # Bulk inserts bypass m2m signals, so revisions must be updated here instead.
+            _increment_user_auth_revision(user.pk)
+            _set_user_auth_record(user, groups=groups, permissions=permissions)
+            user.unhashed_password = password
+
+            handle = UserHandle(user)
+            handles[identifier] = handle
+            if user_identity_map is not None:
+                user_identity_map[str(identifier)] = handle.get()
+
+        return handles
+
     def add_user_permission(self, user_permission, user=None):
         """Adds Permission to given user.
 
@@ -702,41 +1281,36 @@ class CoreTestCaseMixin(BaseMixin):
         :param user: User to add Permission to. If not provided, defaults to test_user model.
         :return: Updated user object.
         """
-        # Django imports here to avoid situational "Apps aren't loaded yet" error.
-        from django.contrib.auth.models import AnonymousUser, Permission
+        return self.add_user_permissions([user_permission], user=user)
 
-        # Check if instance is a Permission model.
-        if isinstance(user_permission, Permission):
-            # Already Permission model. This is fine.
-            permission = user_permission
+    def add_user_permissions(self, user_permissions, user=None):
+        """Adds multiple Permissions to given user, in a single write.
 
-        else:
-            # Is not Permission model. Attempt to get.
-            user_permission = str(user_permission)
-            try:
-                permission = Permission.objects.get(codename=user_permission)
-            except Permission.DoesNotExist:
-                # Failed to get by codename. Attempt again with name.
-                try:
-                    permission = Permission.objects.get(name=user_permission)
-                except Permission.DoesNotExist as pde:
-                    raise ValueError('Failed to find permission of "{0}".'.format(user_permission)) from pde
-
-        # If we made it this far, then valid Permission was found. Apply to user.
-        # But first determine what user we're applying to.
-        if user is not None:
-            # Actual user arg provided to function. Use that.
-            user = self.get_user(user)
-        elif self.user and not isinstance(self.user, AnonymousUser):
-            # No arg provided to function. Fall back to class user, if provided.
-            user = self.get_user(self.user)
-        else:
-            # No arg provided to function AND no class user defined.
-            # Resort to "default standard user" as final fallback.
-            user = self.get_user(ETC_DEFAULT_STANDARD_USER_IDENTIFIER)
+        If user is already known to have all provided Permissions, then the write is skipped entirely.
 
-        # Actually add permission.
-        user.user_permissions.add(permission)
+        :param user_permissions: List of Permissions to add.
+        :param user: User to add Permissions to. If not provided, defaults to test_user model.
+        :return: Updated user object.
+        """
+        permissions = self._get_permissions(user_permissions)
+
+        # If we made it this far, then valid Permissions were found. Apply to user.
+        user = self._get_auth_update_user(user)
+
+        # Actually add permissions.
+        # Record is read before the write, as the write itself invalidates it.
+        auth_record = _get_user_auth_record(user)
+        if auth_record is not None and all(permission.pk in auth_record['permissions'] for permission in permissions):
+            # User is already known to have all provided Permissions. Nothing to write.
+            return user
+        user.user_permissions.add(*permissions)
+        if auth_record is not None:
+            # Keep record of user Groups/Permissions in sync, so debug output can skip querying them.
+            _set_user_auth_record(
+                user,
+                groups=auth_record['groups'].values(),
+                permissions=[*auth_record['permissions'].values(), *permissions],
+            )
 
         # Return user object in case user wants to run additional checks.
         return user
@@ -748,45 +1322,455 @@ class CoreTestCaseMixin(BaseMixin):
         :param user: User to add Group to. If not provided, defaults to test_user model.
         :return: Updated user object.
         """
+        return self.add_user_groups([user_group], user=user)
+
+    def add_user_groups(self, user_groups, user=None):
+        """Adds multiple Groups to given user, in a single write.
+
+        If user is already known to have all provided Groups, then the write is skipped entirely.
+
+        :param user_groups: List of Groups to add.
+        :param user: User to add Groups to. If not provided, defaults to test_user model.
+        :return: Updated user object.
+        """
+        groups = self._get_groups(user_groups)
+
+        # If we made it this far, then valid Groups were found. Apply to user.
+        user = self._get_auth_update_user(user)
+
+        # Actually add groups.
+        # Record is read before the write, as the write itself invalidates it.
+        auth_record = _get_user_auth_record(user)
+        if auth_record is not None and all(group.pk in auth_record['groups'] for group in groups):
+            # User is already known to have all provided Groups. Nothing to write.
+            return user
+        user.groups.add(*groups)
+        if auth_record is not None:
+            # Keep record of user Groups/Permissions in sync, so debug output can skip querying them.
+            _set_user_auth_record(
+                user,
+                groups=[*auth_record['groups'].values(), *groups],
+                permissions=auth_record['permissions'].values(),
+            )
+
+        # Return user object in case user wants to run additional checks.
+        return user
+
+    def _get_permissions(self, user_permissions):
+        """Returns Permission models corresponding to provided values.
+
+        :param user_permissions: List of Permission models, codenames, or names.
+        :return: List of Permission models.
+        """
         # Django imports here to avoid situational "Apps aren't loaded yet" error.
-        from django.contrib.auth.models import AnonymousUser, Group
+        from django.contrib.auth.models import Permission
 
-        # Check if instance is a Group model.
-        if isinstance(user_group, Group):
-            # Already Group model. This is fine.
-            group = user_group
+        permissions = []
+        for user_permission in user_permissions:
+
+            # Check if instance is a Permission model.
+            if isinstance(user_permission, Permission):
+                # Already Permission model. This is fine.
+                permission = user_permission
+
+            else:
+                # Is not Permission model. Attempt to get.
+                user_permission = str(user_permission)
+                permission = _get_cached_permission(user_permission)
+                if permission is None:
+                    # Not found in cached lookup. Query directly, in case it was created without triggering signals.
+                    try:
+                        permission = Permission.objects.select_related('content_type').get(codename=user_permission)
+                    except Permission.DoesNotExist:
+                        # Failed to get by codename. Attempt again with name.
+                        try:
+                            permission = Permission.objects.select_related('content_type').get(name=user_permission)
+                        except Permission.DoesNotExist as pde:
+                            raise ValueError('Failed to find permission of "{0}".'.format(user_permission)) from pde
+
+            permissions.append(permission)
+
+        return permissions
+
+    def _get_groups(self, user_groups):
+        """Returns Group models corresponding to provided values.
+
+        :param user_groups: List of Group models or names.
+        :return: List of Group models.
+        """
+        # Django imports here to avoid situational "Apps aren't loaded yet" error.
+        from django.contrib.auth.models import Group
+
+        groups = []
+        for user_group in user_groups:
+
+            # Check if instance is a Group model.
+            if isinstance(user_group, Group):
+                # Already Group model. This is fine.
+                group = user_group
+
+            else:
+                # Is not Group model. Attempt to get.
+                user_group = str(user_group)
+                group = _get_cached_group(user_group)
+                if group is None:
+                    # Not found in cached lookup. Query directly, in case it was created without triggering signals.
+                    try:
+                        group = Group.objects.get(name=user_group)
+                    except Group.DoesNotExist as gde:
+                        raise ValueError('Failed to find Group of "{0}".'.format(user_group)) from gde
+
+            groups.append(group)
+
+        return groups
+
+    def _get_auth_update_user(self, user=None):
+        """Determines user to apply Groups/Permissions to.
+
+        :param user: User provided to function, if any.
+        :return: User object.
+        """
+        # Django imports here to avoid situational "Apps aren't loaded yet" error.
+        from django.contrib.auth.models import AnonymousUser
 
-        else:
-            # Is not Group model. Attempt to get.
-            user_group = str(user_group)
-            try:
-                group = Group.objects.get(name=user_group)
-            except Group.DoesNotExist as gde:
-                raise ValueError('Failed to find Group of "{0}".'.format(user_group)) from gde
-
-        # If we made it this far, then valid Group was found. Apply to user.
-        # But first determine what user we're applying to.
         if user is not None:
             # Actual user arg provided to function. Use that.
-            user = self.get_user(user)
+            return self.get_user(user)
         elif self.user and not isinstance(self.user, AnonymousUser):
             # No arg provided to function. Fall back to class user, if provided.
-            user = self.get_user(self.user)
+            return self.get_user(self.user)
         else:
             # No arg provided to function AND no class user defined.
             # Resort to "default standard user" as final fallback.
-            user = self.get_user(ETC_DEFAULT_STANDARD_USER_IDENTIFIER)
+            return self.get_user(ETC_DEFAULT_STANDARD_USER_IDENTIFIER)
 
-        # Actually add groups.
-        user.groups.add(group)
+    def _get_user_auth_data(self, user):
+        """Returns Groups and Permissions currently assigned to given user.
 
-        # Return user object in case user wants to run additional checks.
-        return user
+        Uses ETC's own record of applied Groups/Permissions when still accurate, to avoid extra queries.
+        Otherwise falls back to querying the database, and records the result for subsequent calls.
+
+        :param user: User to get Groups/Permissions of.
+        :return: Tuple of (groups, permissions) lists.
+        """
+        auth_record = _get_user_auth_record(user)
+        if auth_record is None:
+            # No up-to-date record of user Groups/Permissions. Query and then save for later calls.
+            _set_user_auth_record(
+                user,
+                groups=user.groups.order_by('pk'),
+                permissions=user.user_permissions.select_related('content_type'),
+            )
+            auth_record = user._etc_auth_record
+
+        # Sort to match default model orderings.
+        groups = sorted(auth_record['groups'].values(), key=lambda group: group.pk)
+        permissions = sorted(
+            auth_record['permissions'].values(),
+            key=lambda permission: (
+                permission.content_type.app_label,
+                permission.content_type.model,
+                permission.codename,
+            ),
+        )
+
+        return groups, permissions
 
     # endregion User Management Functions
 
     # region Helper Functions
 
+    def _get_text_bounds(self, text, strip=True):
+        """Determines start and end index of text, excluding outer whitespace.
+
+        Equivalent to the bounds of text.strip(), but without creating a copy of the text.
+
+        :param text: Text to get bounds of.
+        :param strip: Bool indicating if outer whitespace should be excluded. Defaults to True.
+        :return: Tuple of (start_index, end_index).
+        """
+        text_start = 0
+        text_end = len(text)
+        if strip:
+            while text_start < text_end and text[text_start].isspace():
+                text_start += 1
+            while text_end > text_start and text[text_end - 1].isspace():
+                text_end -= 1
+
+        return text_start, text_end
+
+    def _get_text_diff_output(self, expected_text, actual_text, leading_text='', trailing_text=''):
+        """Generates colored debug output for two mismatched text values, as used in assertText().
+
+        Lines are first aligned with a sequence matcher, so that a single added or removed line does not
+        offset all lines after it. Mismatched line pairs are then further compared per-character.
+        Long runs of matching lines are collapsed, based on the ASSERT_TEXT__DIFF_CONTEXT_LINES setting.
+
+        :param expected_text: Expected text value to compare.
+        :param actual_text: Actual text value to compare.
+        :param leading_text: Optional additional actual text to display before compared text, without coloring.
+        :param trailing_text: Optional additional actual text to display after compared text, without coloring.
+        :return: Tuple of (expected_output, actual_output) strings.
+        """
+        # Split on newlines.
+        split_expected = expected_text.split('\n')
+        split_actual = actual_text.split('\n')
+
+        # Handle if either is empty.
+        if len(split_expected) == 1 and split_expected[0].strip() == '':
+            split_expected = []
+        if len(split_actual) == 1 and split_actual[0].strip() == '':
+            split_actual = []
+
+        # Trim lines that match at start and end, so that sequence matcher only has to handle the changed region.
+        max_trim_count = min(len(split_expected), len(split_actual))
+        prefix_count = 0
+        while prefix_count < max_trim_count and split_expected[prefix_count] == split_actual[prefix_count]:
+            prefix_count += 1
+        suffix_count = 0
+        while (
+            suffix_count < max_trim_count - prefix_count
+            and split_expected[-(suffix_count + 1)] == split_actual[-(suffix_count + 1)]
+        ):
+            suffix_count += 1
+        expected_end = len(split_expected) - suffix_count
+        actual_end = len(split_actual) - suffix_count
+
+        # Determine line-level differences.
+        matcher = SequenceMatcher(
+            None,
+            split_expected[prefix_count:expected_end],
+            split_actual[prefix_count:actual_end],
+            autojunk=False,
+        )
+        opcodes = [('equal', 0, prefix_count, 0, prefix_count)]
+        for tag, expected_start, expected_stop, actual_start, actual_stop in matcher.get_opcodes():
+            opcodes.append(
+                (
+                    tag,
+                    expected_start + prefix_count,
+                    expected_stop + prefix_count,
+                    actual_start + prefix_count,
+                    actual_stop + prefix_count,
+                )
+            )
+        opcodes.append(('equal', expected_end, len(split_expected), actual_end, len(split_actual)))
+        opcodes = [opcode for opcode in opcodes if opcode[1] != opcode[2] or opcode[3] != opcode[4]]
+
+        expected_lines = []
+        actual_lines = []
+        # Tracks if final line of each output was compared per-character.
+        expected_ends_inline = False
+        actual_ends_inline = False
+
+        for opcode_index, (tag, expected_start, expected_stop, actual_start, actual_stop) in enumerate(opcodes):
+
+            if tag == 'equal':
+                # Lines are full match and correct.
+                # Determine how much context to keep, in relation to any surrounding mismatches.
+                line_count = expected_stop - expected_start
+                keep_before = ETC_ASSERT_TEXT__DIFF_CONTEXT_LINES if opcode_index > 0 else 0
+                keep_after = ETC_ASSERT_TEXT__DIFF_CONTEXT_LINES if opcode_index < len(opcodes) - 1 else 0
+                if ETC_ASSERT_TEXT__DIFF_CONTEXT_LINES >= 0 and line_count > keep_before + keep_after + 1:
+                    line_ranges = [
+                        (0, keep_before),
+                        None,
+                        (line_count - keep_after, line_count),
+                    ]
+                else:
+                    line_ranges = [(0, line_count)]
+
+                for line_range in line_ranges:
+                    if line_range is None:
+                        # Collapse matching lines.
+                        hidden_line = '{0}... {1} matching lines hidden ...'.format(
+                            ETC_OUTPUT_RESET_COLOR,
+                            line_count - keep_before - keep_after,
+                        )
+                        expected_lines.append(hidden_line)
+                        actual_lines.append(hidden_line)
+                        continue
+
+                    for line_offset in range(*line_range):
+                        expected_lines.append(
+                            '{0}{1}{2}'.format(
+                                ETC_OUTPUT_EXPECTED_MATCH_COLOR,
+                                split_expected[expected_start + line_offset],
+                                ETC_OUTPUT_RESET_COLOR,
+                            )
+                        )
+                        actual_lines.append(
+                            '{0}{1}{2}'.format(
+                                ETC_OUTPUT_ACTUALS_MATCH_COLOR,
+                                split_actual[actual_start + line_offset],
+                                ETC_OUTPUT_RESET_COLOR,
+                            )
+                        )
+                expected_ends_inline = False
+                actual_ends_inline = False
+                continue
+
+            # Lines do not match. Pair up lines within changed region.
+            for line_offset in range(max(expected_stop - expected_start, actual_stop - actual_start)):
+                expected_index = expected_start + line_offset
+                actual_index = actual_start + line_offset
+
+                if expected_index < expected_stop and actual_index < actual_stop:
+                    # Both lines are populated but do not match. Compare per-character.
+                    expected_line, actual_line = self._get_line_diff_output(
+                        split_expected[expected_index],
+                        split_actual[actual_index],
+                    )
+                    expected_lines.append(expected_line)
+                    actual_lines.append(actual_line)
+                    expected_ends_inline = True
+                    actual_ends_inline = True
+                elif expected_index < expected_stop:
+                    # "Expected" output has line that "actual" output does not. Impossible to match line.
+                    expected_lines.append(
+                        '{0}{1}{2}'.format(
+                            ETC_OUTPUT_EXPECTED_ERROR_COLOR,
+                            self._get_line_diff_marked(split_expected[expected_index], _EXPECTED_DIFF_MARKERS),
+                            ETC_OUTPUT_RESET_COLOR,
+                        )
+                    )
+                    expected_ends_inline = False
+                else:
+                    # "Actual" output has line that "expected" output does not. Impossible to match line.
+                    actual_lines.append(
+                        '{0}{1}{2}'.format(
+                            ETC_OUTPUT_ACTUALS_ERROR_COLOR,
+                            self._get_line_diff_marked(split_actual[actual_index], _ACTUAL_DIFF_MARKERS),
+                            ETC_OUTPUT_RESET_COLOR,
+                        )
+                    )
+                    actual_ends_inline = False
+
+        # Handle additional uncompared actual text, if provided.
+        if leading_text:
+            split_leading = leading_text.split('\n')
+            split_leading[0] = '{0}{1}'.format(ETC_OUTPUT_RESET_COLOR, split_leading[0])
+            if actual_lines:
+                split_leading[-1] += actual_lines[0]
+                actual_lines = split_leading + actual_lines[1:]
+            else:
+                actual_lines = split_leading
+                actual_ends_inline = True
+        if trailing_text:
+            split_trailing = trailing_text.split('\n')
+            split_trailing[0] = '{0}{1}'.format(ETC_OUTPUT_RESET_COLOR, split_trailing[0])
+            if actual_lines and actual_ends_inline:
+                actual_lines[-1] += split_trailing[0]
+                split_trailing = split_trailing[1:]
+            actual_lines += split_trailing
+            actual_ends_inline = True
+
+        # Combine lines into final output.
+        # Lines compared per-character are left open, and rely on debug print to reset coloring.
+        formatted_expected_output = '\n'.join(expected_lines)
+        if expected_lines and not expected_ends_inline:
+            formatted_expected_output += '\n'
+        formatted_actual_output = '\n'.join(actual_lines)
+        if actual_lines and not actual_ends_inline:
+            formatted_actual_output += '\n'
+
+        return formatted_expected_output, formatted_actual_output
+
+    def _get_line_diff_marked(self, line, markers):
+        """Wraps a fully mismatched line in text markers, if console coloring is disabled.
+
+        :param line: Line value to mark.
+        :param markers: Tuple of (start, end) marker strings.
+        :return: Line value, marked as needed.
+        """
+        if ETC_DEBUG_PRINT__COLOR:
+            return line
+        return '{0}{1}{2}'.format(markers[0], line, markers[1])
+
+    def _get_line_diff_output(self, expected_line, actual_line):
+        """Generates colored debug output for two mismatched lines, comparing per-character.
+
+        When console coloring is disabled, mismatched characters are instead wrapped in text markers.
+        Aka "[-" and "-]" for expected output, and "{+" and "+}" for actual output.
+
+        :param expected_line: Expected line value to compare.
+        :param actual_line: Actual line value to compare.
+        :return: Tuple of (expected_output, actual_output) strings.
+        """
+        # Trim characters that match at start and end, so that sequence matcher only has to handle changed region.
+        max_trim_count = min(len(expected_line), len(actual_line))
+        prefix_count = len(os.path.commonprefix([expected_line, actual_line]))
+        suffix_count = 0
+        while (
+            suffix_count < max_trim_count - prefix_count
+            and expected_line[-(suffix_count + 1)] == actual_line[-(suffix_count + 1)]
+        ):
+            suffix_count += 1
+        expected_end = len(expected_line) - suffix_count
+        actual_end = len(actual_line) - suffix_count
+
+        # Build list of (is_match, start, stop) sections for each line.
+        expected_sections = [(True, 0, prefix_count)]
+        actual_sections = [(True, 0, prefix_count)]
+        changed_length = expected_end + actual_end - (prefix_count * 2)
+        if changed_length <= _LINE_DIFF_MAX_LENGTH:
+            # Changed region is reasonably sized. Determine character-level differences.
+            matcher = SequenceMatcher(
+                None,
+                expected_line[prefix_count:expected_end],
+                actual_line[prefix_count:actual_end],
+                autojunk=False,
+            )
+            for tag, expected_start, expected_stop, actual_start, actual_stop in matcher.get_opcodes():
+                is_match = tag == 'equal'
+                expected_sections.append((is_match, expected_start + prefix_count, expected_stop + prefix_count))
+                actual_sections.append((is_match, actual_start + prefix_count, actual_stop + prefix_count))
+        else:
+            # Changed region is too large to efficiently compare. Treat as a single mismatch.
+            expected_sections.append((False, prefix_count, expected_end))
+            actual_sections.append((False, prefix_count, actual_end))
+        expected_sections.append((True, expected_end, len(expected_line)))
+        actual_sections.append((True, actual_end, len(actual_line)))
+
+        # Format based on match, only outputting color values when they change.
+        output = []
+        for line, sections, match_color, error_color, error_markers in (
+            (
+                expected_line,
+                expected_sections,
+                ETC_OUTPUT_EXPECTED_MATCH_COLOR,
+                ETC_OUTPUT_EXPECTED_ERROR_COLOR,
+                _EXPECTED_DIFF_MARKERS,
+            ),
+            (
+                actual_line,
+                actual_sections,
+                ETC_OUTPUT_ACTUALS_MATCH_COLOR,
+                ETC_OUTPUT_ACTUALS_ERROR_COLOR,
+                _ACTUAL_DIFF_MARKERS,
+            ),
+        ):
+            line_output = []
+            curr_color = None
+            for is_match, start, stop in sections:
+                if start == stop:
+                    continue
+                if not ETC_DEBUG_PRINT__COLOR:
+                    # Console coloring disabled. Mark mismatched characters with text instead.
+                    if is_match:
+                        line_output.append(line[start:stop])
+                    else:
+                        line_output.append('{0}{1}{2}'.format(error_markers[0], line[start:stop], error_markers[1]))
+                    continue
+                color = match_color if is_match else error_color
+                if color != curr_color:
+                    curr_color = color
+                    line_output.append(color)
+                line_output.append(line[start:stop])
+            output.append(''.join(line_output))
+
+        return output[0], output[1]
+
     def generate_get_url(self, url=None, **kwargs):
         """Generates a full GET request url, passing in the provided args.
 
@@ -3,27 +3,36 @@ Core testing logic that pertains to handling Response objects.
 """
 
 # System Imports.
+import atexit
 import json
 import logging
 import re
+import sys
+import time
 import warnings
+from functools import lru_cache
 from urllib.parse import parse_qs
 
 # Third-Party Imports.
 from bs4 import BeautifulSoup
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db.models.query import REPR_OUTPUT_SIZE
 from django.forms import BaseForm, BaseFormSet
 from django.forms.formsets import ManagementForm
 from django.http.response import HttpResponseBase
+from django.test.signals import setting_changed
+from django.utils.translation import get_language
 
 # Internal Imports.
 from . import CoreTestCaseMixin
-from django.urls import reverse
+from django.urls import get_script_prefix, get_urlconf, reverse
 from django.urls.exceptions import NoReverseMatch
 from django_expanded_test_cases.constants import (
+    ETC_DEBUG_PRINT__COLOR,
     ETC_DEBUG_PRINT__RESPONSE_SEPARATOR,
     ETC_DEBUG_PRINT__SKIP_DISPLAY,
+    ETC_DEDUPLICATE_APPEND_SLASH_WARNINGS,
     ETC_INCLUDE_RESPONSE_DEBUG_CONTENT,
     ETC_INCLUDE_RESPONSE_DEBUG_CONTEXT,
     ETC_INCLUDE_RESPONSE_DEBUG_FORMS,
@@ -56,6 +65,101 @@ from django_expanded_test_cases.constants import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024, typed=True)
+def _cached_reverse(url, url_args, url_kwargs, urlconf, script_prefix, language):
+    """Returns reverse() of given url, or None if url is not a valid route name.
+
+    Cached per process, including the None result, so that literal urls skip reverse() after first use.
+    Values that affect the reversed url (urlconf, script prefix, and active language) are part of the cache key.
+    Arg and kwarg types are also part of the key, as equal values such as 1, 1.0, and True reverse differently.
+
+    :param url: Url value to attempt to reverse.
+    :param url_args: Tuple of (type, value) pairs of "args" to pass to reverse() function.
+    :param url_kwargs: Tuple of (key, type, value) items of "kwargs" to pass to reverse() function.
+    :return: Reversed url, or None if no reverse match was found.
+    """
+    try:
+        return reverse(
+            url,
+            args=[value for value_type, value in url_args],
+            kwargs={key: value for key, value_type, value in url_kwargs},
+            urlconf=urlconf,
+        )
+    except NoReverseMatch:
+        return None
+
+
+def _clear_reverse_cache(setting, **kwargs):
+    """Signal receiver to drop cached url reverse() results, when project urls change."""
+    if setting == 'ROOT_URLCONF':
+        _cached_reverse.cache_clear()
+
+
+setting_changed.connect(_clear_reverse_cache, dispatch_uid='etc_clear_reverse_cache')
+
+
+# Per-process record of APPEND_SLASH warnings already shown.
+# Maps each distinct url pattern to the count of repeated warnings that were skipped for it.
+_append_slash_warnings = {}
+
+
+def _warn_append_slash(warn_key, warn_msg):
+    """Displays APPEND_SLASH warning, unless one was already shown for the same url pattern.
+
+    :param warn_key: Hashable value identifying the url pattern that the warning is for.
+    :param warn_msg: Warning message to display.
+    """
+    if ETC_DEDUPLICATE_APPEND_SLASH_WARNINGS:
+        if warn_key in _append_slash_warnings:
+            # Already warned for this url pattern. Count and skip.
+            _append_slash_warnings[warn_key] += 1
+            return
+        _append_slash_warnings[warn_key] = 0
+
+    # Create console warning message.
+    warnings.warn(warn_msg)
+    # Create logging warning message.
+    logging.warning(warn_msg)
+
+
+def _get_append_slash_warning_summary():
+    """Returns count of APPEND_SLASH warnings that were skipped as repeats, as a summary str.
+
+    :return: Summary str, or None if no warnings were skipped.
+    """
+    skipped_count = sum(_append_slash_warnings.values())
+    if skipped_count == 0:
+        return None
+
+    url_count = len([value for value in _append_slash_warnings.values() if value > 0])
+    return 'Skipped {0} repeated APPEND_SLASH warning(s), across {1} url(s).'.format(skipped_count, url_count)
+
+
+def _show_append_slash_warning_summary():
+    """Displays count of APPEND_SLASH warnings that were skipped as repeats, if any."""
+    summary = _get_append_slash_warning_summary()
+    if summary is not None:
+        print('DjangoETC: {0}'.format(summary), file=sys.stderr)
+
+
+# Warnings are only skipped when deduplication is enabled. So otherwise there is never anything to show.
+# When using the ETC pytest plugin, this is shown in the pytest terminal summary instead.
+if ETC_DEDUPLICATE_APPEND_SLASH_WARNINGS:
+    atexit.register(_show_append_slash_warning_summary)
+
+
+def _format_debug_list(values):
+    """Returns display value of given list, truncated the same as a Django QuerySet repr.
+
+    :param values: List of values to display.
+    :return: Formatted string of list values.
+    """
+    values = list(values[: REPR_OUTPUT_SIZE + 1])
+    if len(values) > REPR_OUTPUT_SIZE:
+        values[-1] = '...(remaining elements truncated)...'
+    return repr(values)
+
+
 class ResponseTestCaseMixin(CoreTestCaseMixin):
     """Includes testing logic used in handling Response objects."""
 
@@ -78,11 +182,15 @@ class ResponseTestCaseMixin(CoreTestCaseMixin):
         post_data = post_data or {}
 
         # Parse out different debug types.
+        # Content formatting is the slowest section, and only relies on raw content bytes.
+        # So optionally render in background, if DEBUG_PRINT__BACKGROUND_RENDER is enabled.
         if ETC_INCLUDE_RESPONSE_DEBUG_CONTENT:
+            response_content = response.content if isinstance(response, HttpResponseBase) else response
             if return_format == 'html':
-                self.show_debug_content(response)
+                self._debug_print_in_background(self.show_debug_content, response_content)
             elif return_format == 'json':
-                self.show_debug_json_content(response, expected_json)
+                response_content = getattr(response, 'json_content', response_content)
+                self._debug_print_in_background(self.show_debug_json_content, response_content, expected_json)
             else:
                 raise ValueError('Currently supported return_format values are `html` or `json`.')
         if ETC_INCLUDE_RESPONSE_DEBUG_HEADER:
@@ -353,6 +461,22 @@ class ResponseTestCaseMixin(CoreTestCaseMixin):
                     '{0}{1}'.format(indentation, data),
                 )
 
+    def _get_json_display(self, value, color, is_match=False):
+        """Returns display value for a single json key or value, when comparing against expected json.
+
+        When console coloring is disabled, mismatched values are instead wrapped in "{+" and "+}" text markers.
+
+        :param value: Json key or value to display.
+        :param color: Color to display value with.
+        :param is_match: Bool indicating if value matches expected json.
+        :return: Formatted display value.
+        """
+        if ETC_DEBUG_PRINT__COLOR:
+            return '{0}{1}{2}'.format(color, value, ETC_OUTPUT_RESET_COLOR)
+        if is_match:
+            return value
+        return '{{+{0}+}}'.format(value)
+
     def _recurse_show_debug_json_content_with_coloring(
         self,
         actual_data,
@@ -379,18 +503,28 @@ class ResponseTestCaseMixin(CoreTestCaseMixin):
             # TODO: This maybe could be more efficiently organized.
             #   But at this point I just want it to work for now.
             container_text_color = ''
+            container_mismatch = ''
             if not level_exists:
                 container_text_color = ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR
+                container_mismatch = 'not in expected'
             elif type(actual_data) != type(expected_data):
                 container_text_color = ETC_RESPONSE_DEBUG_JSON_TYPE_MISMATCH_COLOR
+                container_mismatch = 'type mismatch'
             elif len(actual_data) != len(expected_data):
                 container_text_color = ETC_RESPONSE_DEBUG_JSON_LENGTH_MISMATCH_COLOR
+                container_mismatch = 'length mismatch'
+            if container_mismatch and not ETC_DEBUG_PRINT__COLOR:
+                # Console coloring disabled. Mark mismatch with text instead.
+                container_mismatch = '  {0}'.format(self._get_json_display(container_mismatch, container_text_color))
+            else:
+                container_mismatch = ''
 
             self._debug_print(
-                '{0}{1}{2}'.format(
+                '{0}{1}{2}{3}'.format(
                     prior_indentation,
                     container_text_color,
                     '{',
+                    container_mismatch,
                 ),
             )
 
@@ -403,11 +537,7 @@ class ResponseTestCaseMixin(CoreTestCaseMixin):
 
                 # Handle if prior recurse parent indicates this section doesn't exist in expected.
                 if not level_exists:
-                    key_display = '{0}{1}{2}'.format(
-                        ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR,
-                        key,
-                        ETC_OUTPUT_RESET_COLOR,
-                    )
+                    key_display = self._get_json_display(key, ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR)
 
                 # Determine if key is present.
                 elif isinstance(expected_data, dict):
@@ -415,19 +545,11 @@ class ResponseTestCaseMixin(CoreTestCaseMixin):
                     if key in expected_data.keys():
                         # Key is found in actual and expected.
                         next_expected = expected_data[key]
-                        key_display = '{0}{1}{2}'.format(
-                            ETC_RESPONSE_DEBUG_JSON_MATCH_COLOR,
-                            key,
-                            ETC_OUTPUT_RESET_COLOR,
-                        )
+                        key_display = self._get_json_display(key, ETC_RESPONSE_DEBUG_JSON_MATCH_COLOR, is_match=True)
 
                 if key_display is None:
                     # Key present in actual but missing in expected.
-                    key_display = '{0}{1}{2}'.format(
-                        ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR,
-                        key,
-                        ETC_OUTPUT_RESET_COLOR,
-                    )
+                    key_display = self._get_json_display(key, ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR)
                     next_level_exists = False
 
                 if isinstance(value, dict) or isinstance(value, list) or isinstance(value, tuple):
@@ -447,34 +569,22 @@ class ResponseTestCaseMixin(CoreTestCaseMixin):
 
                     # Handle if prior recurse parent indicates this section doesn't exist in expected.
                     if not next_level_exists:
-                        value_display = '{0}{1}{2}'.format(
-                            ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR,
-                            value,
-                            ETC_OUTPUT_RESET_COLOR,
-                        )
+                        value_display = self._get_json_display(value, ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR)
 
                     # Determine if values match.
                     elif type(value) != type(next_expected):
                         # Types don't match.
-                        value_display = '{0}{1}{2}'.format(
-                            ETC_RESPONSE_DEBUG_JSON_TYPE_MISMATCH_COLOR,
-                            value,
-                            ETC_OUTPUT_RESET_COLOR,
-                        )
+                        value_display = self._get_json_display(value, ETC_RESPONSE_DEBUG_JSON_TYPE_MISMATCH_COLOR)
 
                     elif value != next_expected:
                         # Values do not match.
-                        value_display = '{0}{1}{2}'.format(
-                            ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR,
-                            value,
-                            ETC_OUTPUT_RESET_COLOR,
-                        )
+                        value_display = self._get_json_display(value, ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR)
                     else:
                         # Everything matches up. All green.
-                        value_display = '{0}{1}{2}'.format(
-                            ETC_RESPONSE_DEBUG_JSON_MATCH_COLOR,
+                        value_display = self._get_json_display(
                             value,
-                            ETC_OUTPUT_RESET_COLOR,
+                            ETC_RESPONSE_DEBUG_JSON_MATCH_COLOR,
+                            is_match=True,
                         )
 
                     if isinstance(value, str):
@@ -511,18 +621,28 @@ class ResponseTestCaseMixin(CoreTestCaseMixin):
             # TODO: This maybe could be more efficiently organized.
             #   But at this point I just want it to work for now.
             container_text_color = ''
+            container_mismatch = ''
             if not level_exists:
                 container_text_color = ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR
+                container_mismatch = 'not in expected'
             elif type(actual_data) != type(expected_data):
                 container_text_color = ETC_RESPONSE_DEBUG_JSON_TYPE_MISMATCH_COLOR
+                container_mismatch = 'type mismatch'
             elif len(actual_data) != len(expected_data):
                 container_text_color = ETC_RESPONSE_DEBUG_JSON_LENGTH_MISMATCH_COLOR
+                container_mismatch = 'length mismatch'
+            if container_mismatch and not ETC_DEBUG_PRINT__COLOR:
+                # Console coloring disabled. Mark mismatch with text instead.
+                container_mismatch = '  {0}'.format(self._get_json_display(container_mismatch, container_text_color))
+            else:
+                container_mismatch = ''
 
             self._debug_print(
-                '{0}{1}{2}'.format(
+                '{0}{1}{2}{3}'.format(
                     prior_indentation,
                     container_text_color,
                     '[',
+                    container_mismatch,
                 ),
             )
 
@@ -534,11 +654,7 @@ class ResponseTestCaseMixin(CoreTestCaseMixin):
 
                 # Handle if prior recurse parent indicates this section doesn't exist in expected.
                 if not level_exists:
-                    value_display = '{0}{1}{2}'.format(
-                        ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR,
-                        value,
-                        ETC_OUTPUT_RESET_COLOR,
-                    )
+                    value_display = self._get_json_display(value, ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR)
 
                 # Determine if index is present.
                 elif isinstance(expected_data, list) or isinstance(expected_data, tuple):
@@ -550,11 +666,7 @@ class ResponseTestCaseMixin(CoreTestCaseMixin):
                         next_expected = expected_data[index]
                         if type(value) != type(next_expected):
                             # Types don't match.
-                            value_display = '{0}{1}{2}'.format(
-                                ETC_RESPONSE_DEBUG_JSON_TYPE_MISMATCH_COLOR,
-                                value,
-                                ETC_OUTPUT_RESET_COLOR,
-                            )
+                            value_display = self._get_json_display(value, ETC_RESPONSE_DEBUG_JSON_TYPE_MISMATCH_COLOR)
 
                         else:
                             # Types do match.
@@ -570,36 +682,30 @@ class ResponseTestCaseMixin(CoreTestCaseMixin):
                                 != len(next_expected)
                             ):
                                 # Is dict or array type and lengths do not match.
-                                value_display = '{0}{1}{2}'.format(
-                                    ETC_RESPONSE_DEBUG_JSON_LENGTH_MISMATCH_COLOR,
+                                value_display = self._get_json_display(
                                     value,
-                                    ETC_OUTPUT_RESET_COLOR,
+                                    ETC_RESPONSE_DEBUG_JSON_LENGTH_MISMATCH_COLOR,
                                 )
                             else:
                                 # Verify values match.
                                 if value != next_expected:
                                     # Expected and actual do not match.
-                                    value_display = '{0}{1}{2}'.format(
-                                        ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR,
+                                    value_display = self._get_json_display(
                                         value,
-                                        ETC_OUTPUT_RESET_COLOR,
+                                        ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR,
                                     )
 
                                 else:
                                     # Everything matches up. All green.
-                                    value_display = '{0}{1}{2}'.format(
-                                        ETC_RESPONSE_DEBUG_JSON_MATCH_COLOR,
+                                    value_display = self._get_json_display(
                                         value,
-                                        ETC_OUTPUT_RESET_COLOR,
+                                        ETC_RESPONSE_DEBUG_JSON_MATCH_COLOR,
+                                        is_match=True,
                                     )
 
                 if value_display is None:
                     # Index present in actual but missing in expected.
-                    value_display = '{0}{1}{2}'.format(
-                        ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR,
-                        value,
-                        ETC_OUTPUT_RESET_COLOR,
-                    )
+                    value_display = self._get_json_display(value, ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR)
                     next_level_exists = False
 
                 if isinstance(value, dict) or isinstance(value, list) or isinstance(value, tuple):
@@ -1164,14 +1270,15 @@ class ResponseTestCaseMixin(CoreTestCaseMixin):
                 fore=ETC_RESPONSE_DEBUG_USER_INFO_COLOR,
             )
 
-            # User groups.
+            # User groups and permissions.
+            # Pulled from ETC's record of assigned values when possible, to avoid additional queries.
+            user_groups, user_permissions = self._get_user_auth_data(user)
             self._debug_print(
-                '    * User Groups: {0}'.format(user.groups.all()), fore=ETC_RESPONSE_DEBUG_USER_INFO_COLOR
+                '    * User Groups: {0}'.format(_format_debug_list(user_groups)),
+                fore=ETC_RESPONSE_DEBUG_USER_INFO_COLOR,
             )
-
-            # User permissions.
             self._debug_print(
-                '    * User Permissions: {0}'.format(user.user_permissions.all()),
+                '    * User Permissions: {0}'.format(_format_debug_list(user_permissions)),
                 fore=ETC_RESPONSE_DEBUG_USER_INFO_COLOR,
             )
 
@@ -1225,7 +1332,24 @@ class ResponseTestCaseMixin(CoreTestCaseMixin):
 
         # Attempt to get reverse of provided url.
         try:
-            url = reverse(url, args=url_args, kwargs=url_kwargs)
+            reversed_url = _cached_reverse(
+                url,
+                tuple((type(value), value) for value in url_args),
+                tuple(sorted((key, type(value), value) for key, value in url_kwargs.items())),
+                get_urlconf(settings.ROOT_URLCONF),
+                get_script_prefix(),
+                get_language(),
+            )
+        except TypeError:
+            # Provided args/kwargs are unhashable, so can't be cached. Reverse directly instead.
+            try:
+                reversed_url = reverse(url, args=url_args, kwargs=url_kwargs)
+            except NoReverseMatch:
+                reversed_url = None
+
+        if reversed_url is not None:
+            route_name = url
+            url = reversed_url
 
             # PART 1 for providing warning based on APPEND_SLASH setting.
             # See https://stackoverflow.com/a/42213107 for discussion on why this setting exists
@@ -1242,10 +1366,7 @@ class ResponseTestCaseMixin(CoreTestCaseMixin):
                             'Consider appending a url slash. '
                             'Url was: {0}'
                         ).format(url)
-                        # Create console warning message.
-                        warnings.warn(warn_msg)
-                        # Create logging warning message.
-                        logging.warning(warn_msg)
+                        _warn_append_slash(('reverse', route_name), warn_msg)
 
                 else:
                     # As per project Django settings, url should NOT have a trailing slash.
@@ -1257,12 +1378,9 @@ class ResponseTestCaseMixin(CoreTestCaseMixin):
                             'Consider removing the trailing url slash. '
                             'Url was: {0}'
                         ).format(url)
-                        # Create console warning message.
-                        warnings.warn(warn_msg)
-                        # Create logging warning message.
-                        logging.warning(warn_msg)
+                        _warn_append_slash(('reverse', route_name), warn_msg)
 
-        except NoReverseMatch:
+        else:
             # Could not find as reverse. Assume is literal url.
 
             # PART 2 for providing warning based on APPEND_SLASH setting.
@@ -1300,10 +1418,7 @@ class ResponseTestCaseMixin(CoreTestCaseMixin):
                                 'Consider appending a url slash. '
                                 'Url was: {0}'
                             ).format(url)
-                            # Create console warning message.
-                            warnings.warn(warn_msg)
-                            # Create logging warning message.
-                            logging.warning(warn_msg)
+                            _warn_append_slash(('literal', url_check), warn_msg)
 
                     else:
                         # As per project Django settings, url should NOT have a trailing slash.
@@ -1315,10 +1430,7 @@ class ResponseTestCaseMixin(CoreTestCaseMixin):
                                 'Consider removing the trailing url slash. '
                                 'Url was: {0}'
                             ).format(url)
-                            # Create console warning message.
-                            warnings.warn(warn_msg)
-                            # Create logging warning message.
-                            logging.warning(warn_msg)
+                            _warn_append_slash(('literal', url_check), warn_msg)
 
             # Trim any known extra values on literal url str.
             # Remove http prefix, if present.
@@ -1427,6 +1539,8 @@ class ResponseTestCaseMixin(CoreTestCaseMixin):
             Generally True for UnitTest direct comparison. False for console output/human examination.
         :return: Formatted response content.
         """
+        start_time = time.perf_counter()
+
         # Handle for provided response types.
         if isinstance(response, HttpResponseBase):
             response_content = response.content.decode('utf-8')
@@ -1449,6 +1563,11 @@ class ResponseTestCaseMixin(CoreTestCaseMixin):
         # Further trim whitespace around specific characters, for easier comparison.
         response_content = self.standardize_html_tags(response_content)
 
+        # Record normalization time, if running as part of a timed assertResponse().
+        response_timings = getattr(self, '_active_response_timings', None)
+        if response_timings is not None:
+            response_timings.add_time('normalization', start_time)
+
         return response_content
 
     # region Html Search Functions
@@ -0,0 +1,70 @@
+"""
+Pytest plugin for Django Expanded Test Cases project.
+
+Requires pytest-django. To use, add to the project's root conftest.py:
+    pytest_plugins = ['django_expanded_test_cases.pytest_plugin']
+"""
+
+# System Imports.
+import atexit
+import sys
+
+# Third-Party Imports.
+import pytest
+
+
+# End-of-run reports, as (module name, report getter name, interpreter exit display function name).
+# Shown in the pytest terminal summary, rather than printed to stderr after pytest has already finished.
+_END_OF_RUN_REPORTS = (
+    (
+        'django_expanded_test_cases.mixins.response_mixin',
+        '_get_append_slash_warning_summary',
+        '_show_append_slash_warning_summary',
+    ),
+    (
+        'django_expanded_test_cases.test_cases.integration_test_case',
+        '_get_response_timings_report',
+        '_show_response_timings_report',
+    ),
+)
+
+
+@pytest.fixture(scope='session', autouse=True)
+def etc_precreate_default_users(django_db_setup, django_db_blocker):
+    """Creates the ETC default test users once, directly after the test database is set up.
+
+    Test cases then reuse these existing users, instead of creating them for every test or class.
+    When running with pytest-xdist, each worker sets up its own test database, so this runs once per worker.
+    """
+    # Package imports here to avoid situational "Apps aren't loaded yet" error.
+    from django_expanded_test_cases.constants import ETC_AUTO_GENERATE_USERS
+    from django_expanded_test_cases.mixins.core_mixin import (
+        _clear_precreated_default_users,
+        _precreate_default_users,
+    )
+
+    if not ETC_AUTO_GENERATE_USERS:
+        yield
+        return
+
+    with django_db_blocker.unblock():
+        _precreate_default_users()
+    yield
+    _clear_precreated_default_users()
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Displays the ETC end-of-run reports in the pytest terminal summary.
+
+    Each report is then removed from the interpreter exit handlers, so that it's not shown twice.
+    """
+    for module_name, get_report_name, show_report_name in _END_OF_RUN_REPORTS:
+        module = sys.modules.get(module_name, None)
+        if module is None:
+            # Module was never imported during the test run, so has nothing to report.
+            continue
+
+        atexit.unregister(getattr(module, show_report_name))
+        report = getattr(module, get_report_name)()
+        if report is not None:
+            terminalreporter.write_line('DjangoETC: {0}'.format(report))
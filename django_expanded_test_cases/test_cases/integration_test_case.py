@@ -3,16 +3,38 @@ Testing logic for views and other multi-part components.
 """
 
 # System Imports.
+import asyncio
+import atexit
 import json
 import logging
+import math
+import os
 import re
+import statistics
+import sys
+import sysconfig
 import textwrap
+import time
+import tracemalloc
 import warnings
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache, wraps
+from http.cookies import SimpleCookie
+from unittest.mock import patch
+from urllib.parse import urljoin, urlsplit
 
 # Third-Party Imports.
+import django
+import django.test.client
+from asgiref.sync import async_to_sync
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.core.signals import request_started
+from django.db import connections
+from django.forms import BaseForm, BaseFormSet
+from django.http import QueryDict
 from django.http.response import HttpResponseBase
+from django.test.client import Client, RedirectCycleError
 from django.urls import reverse
 from django.urls.exceptions import NoReverseMatch
 
@@ -22,21 +44,36 @@ from django_expanded_test_cases.constants import (
     ETC_ALLOW_MESSAGE_PARTIALS,
     ETC_ALLOW_TITLE_PARTIALS,
     ETC_ASSERT_CONTENT__SURROUNDING_CHECK_OUTPUT_LENGTH,
+    ETC_ASSERT_NO_N_PLUS_ONE,
+    ETC_BENCHMARK_OUTPUT_FILE,
     ETC_DEFAULT_STANDARD_USER_IDENTIFIER,
+    ETC_FOLLOW_REDIRECTS,
     ETC_INCLUDE_RESPONSE_DEBUG_URL,
+    ETC_LIGHTWEIGHT_CLIENT,
+    ETC_MAX_REDIRECTS,
+    ETC_N_PLUS_ONE_THRESHOLD,
+    ETC_PERFORMANCE_BASELINE_FILE,
+    ETC_PERFORMANCE_BASELINE_MODE,
+    ETC_PERFORMANCE_BASELINE_SAMPLES,
+    ETC_PERFORMANCE_BASELINE_TOLERANCE,
     ETC_OUTPUT_ACTUALS_MATCH_COLOR,
     ETC_OUTPUT_ERROR_COLOR,
     ETC_OUTPUT_EXPECTED_MATCH_COLOR,
     ETC_OUTPUT_RESET_COLOR,
     ETC_REQUEST_USER_STRICTNESS,
     ETC_RESET_CLIENT_STATE_ON_REQUEST,
+    ETC_RESPONSE_DEBUG_LOGGERS,
     ETC_RESPONSE_DEBUG_LOGGING_LEVEL,
+    ETC_RESPONSE_TIMINGS_REPORT,
+    ETC_RESPONSE_TIMINGS_REPORT_LENGTH,
     ETC_SKIP_CONTENT_AFTER,
     ETC_SKIP_CONTENT_BEFORE,
+    ETC_USER_MODEL_IDENTIFIER,
     ETC_VIEWS_SHOULD_REDIRECT,
     VOID_ELEMENT_LIST,
 )
 from django_expanded_test_cases.mixins import ResponseTestCaseMixin
+from django_expanded_test_cases.mixins.core_mixin import _DEFAULT_USER_VALUES
 
 
 # Initialize logging.
@@ -91,9 +128,692 @@ class ResponseUrlData:
         self.computed = ComputedUrlData()
 
 
+class ResponseTimings:
+    """Per-phase timings of a single response generation and assertion. All values are in milliseconds."""
+
+    # Recorded phases, in order of execution.
+    # Note that "normalization" time is also included in the "debug_print" and "assertions" phases that ran it.
+    phases = ('user_setup', 'url_handling', 'request', 'debug_print', 'normalization', 'assertions')
+    # Phases that never overlap with one another. Aka, all phases except "normalization".
+    exclusive_phases = ('user_setup', 'url_handling', 'request', 'debug_print', 'assertions')
+
+    def __init__(self):
+        # Identifying values for aggregation.
+        self.url = None
+        self.test_id = None
+        self.test_class = None
+
+        # Phase durations.
+        for phase in self.phases:
+            setattr(self, phase, 0.0)
+        self.total = 0.0
+
+    def add_time(self, phase, start_time):
+        """Adds time elapsed since provided time.perf_counter() value to given phase.
+
+        :param phase: Name of phase to add time to.
+        :param start_time: The time.perf_counter() value from when phase was started.
+        """
+        setattr(self, phase, getattr(self, phase) + ((time.perf_counter() - start_time) * 1000))
+
+    def as_dict(self):
+        """Returns phase durations as a dict."""
+        return {**{phase: getattr(self, phase) for phase in self.phases}, 'total': self.total}
+
+
+# Per-process record of all response timings, for the end-of-run report.
+# Only populated when the RESPONSE_TIMINGS_REPORT setting is enabled.
+_recorded_response_timings = []
+
+
+def summarize_response_timings(timings_list):
+    """Sums the phase durations of multiple ResponseTimings instances.
+
+    :param timings_list: Iterable of ResponseTimings instances.
+    :return: Dict of summed phase durations (in milliseconds), plus a "count" of summed responses.
+    """
+    summary = {phase: 0.0 for phase in ResponseTimings.phases}
+    summary['total'] = 0.0
+    summary['count'] = 0
+    for timings in timings_list:
+        for phase, duration in timings.as_dict().items():
+            summary[phase] += duration
+        summary['count'] += 1
+
+    return summary
+
+
+def format_response_timings_report(timings_list, url_count=10):
+    """Formats a report of multiple ResponseTimings instances, ranking the slowest phases and urls.
+
+    :param timings_list: Iterable of ResponseTimings instances.
+    :param url_count: Max number of slowest urls to include in report.
+    :return: Report str.
+    """
+    timings_list = list(timings_list)
+    summary = summarize_response_timings(timings_list)
+
+    report = 'Response timings for {0} assertResponse call(s), {1:.2f} ms total.\n'.format(
+        summary['count'],
+        summary['total'],
+    )
+
+    # Rank phases by total time spent.
+    # Normalization time is already counted within other phases, so it is shown separately rather than ranked.
+    report += '\nSlowest phases:\n'
+    for phase in sorted(ResponseTimings.exclusive_phases, key=lambda phase: summary[phase], reverse=True):
+        report += '    {0}: {1:.2f} ms\n'.format(phase, summary[phase])
+    report += '    (normalization, within above phases: {0:.2f} ms)\n'.format(summary['normalization'])
+
+    # Rank urls by total time spent, across all responses for the url.
+    url_timings = {}
+    for timings in timings_list:
+        url_timings.setdefault(timings.url, []).append(timings.total)
+    report += '\nSlowest urls:\n'
+    for url, durations in sorted(url_timings.items(), key=lambda item: sum(item[1]), reverse=True)[:url_count]:
+        report += '    {0}: {1:.2f} ms total, {2:.2f} ms average, {3:.2f} ms max, over {4} call(s)\n'.format(
+            url,
+            sum(durations),
+            sum(durations) / len(durations),
+            max(durations),
+            len(durations),
+        )
+
+    return report
+
+
+def _get_response_timings_report():
+    """Returns the end-of-run response timings report.
+
+    :return: Report str, or None if no timings were recorded.
+    """
+    if not _recorded_response_timings:
+        return None
+
+    return format_response_timings_report(_recorded_response_timings, ETC_RESPONSE_TIMINGS_REPORT_LENGTH)
+
+
+def _show_response_timings_report():
+    """Displays the end-of-run response timings report, if any timings were recorded."""
+    report = _get_response_timings_report()
+    if report is not None:
+        print('DjangoETC: {0}'.format(report), file=sys.stderr)
+
+
+# Timings are only recorded for the full run when the report is enabled.
+# When using the ETC pytest plugin, this is shown in the pytest terminal summary instead.
+if ETC_RESPONSE_TIMINGS_REPORT:
+    atexit.register(_show_response_timings_report)
+
+
+# Paths to skip when finding the code that triggered a query.
+# Aka, Django itself, this package, the Python standard library, and installed third-party packages.
+_QUERY_ORIGIN_SKIP_PATHS = tuple(
+    os.path.join(path, '')
+    for path in (
+        os.path.dirname(os.path.abspath(django.__file__)),
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        sysconfig.get_paths()['stdlib'],
+        sysconfig.get_paths()['purelib'],
+    )
+)
+
+
+@lru_cache(maxsize=None)
+def _is_query_origin_skipped(filename):
+    """Returns True if provided code file is one of the _QUERY_ORIGIN_SKIP_PATHS locations."""
+    return os.path.abspath(filename).startswith(_QUERY_ORIGIN_SKIP_PATHS)
+
+
+def _get_query_origin():
+    """Returns location of the innermost project code that is currently running, such as to find what ran a query.
+
+    Runs for every recorded query. So frames are walked directly, stopping at the first project frame,
+    rather than building a full `traceback` stack summary (which also loads the source line of every frame).
+
+    :return: Code location, in format "<file>:<line> in <function>".
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        code = frame.f_code
+        if not _is_query_origin_skipped(code.co_filename):
+            return '{0}:{1} in {2}'.format(code.co_filename, frame.f_lineno, code.co_name)
+        frame = frame.f_back
+
+    return 'Unknown'
+
+
+# Regex patterns to normalize SQL into a "fingerprint", so that queries which only differ by values can be grouped.
+# Applied in order.
+_SQL_FINGERPRINT_PATTERNS = (
+    # Quoted string literals.
+    (re.compile(r"'(?:[^']|'')*'"), '?'),
+    # Numeric literals.
+    (re.compile(r'\b\d+(?:\.\d+)?\b'), '?'),
+    # Query param placeholders.
+    (re.compile(r'%s|%\(\w+\)s'), '?'),
+    # Value lists of any length, such as from IN clauses.
+    (re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)'), '(...)'),
+    # Multiple value lists, such as from bulk inserts.
+    (re.compile(r'\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+'), '(...)'),
+    # Repeated whitespace.
+    (re.compile(r'\s+'), ' '),
+)
+
+
+def fingerprint_sql(sql):
+    """Normalizes provided SQL, such that queries which only differ by literal/param values are equal.
+
+    Ex: `SELECT * FROM "user" WHERE "id" IN (%s, %s) LIMIT 21`
+    becomes `SELECT * FROM "user" WHERE "id" IN (...) LIMIT ?`
+
+    :param sql: SQL str to normalize.
+    :return: Normalized SQL str.
+    """
+    for pattern, replacement in _SQL_FINGERPRINT_PATTERNS:
+        sql = pattern.sub(replacement, sql)
+
+    return sql.strip()
+
+
+class RecordedQuery:
+    """A single database query, as recorded by QueryRecorder."""
+
+    def __init__(self, sql, params, duration, using, origin, request_index=0):
+        self.sql = sql
+        self.params = params
+        # Query duration, in milliseconds.
+        self.duration = duration
+        # Alias of database connection that ran query.
+        self.using = using
+        # Location of project code that ran query.
+        self.origin = origin
+        # Index of request that ran query, when multiple requests were recorded (such as a followed redirect chain).
+        self.request_index = request_index
+
+    @property
+    def fingerprint(self):
+        """Query SQL, normalized to ignore literal/param values. See fingerprint_sql()."""
+        return fingerprint_sql(self.sql)
+
+
+class QueryRecorder:
+    """Database execute wrapper, to record all queries run while active.
+
+    See https://docs.djangoproject.com/en/dev/topics/db/instrumentation/
+    """
+
+    def __init__(self):
+        self.queries = []
+        # Index of current request. Incremented as each new request starts.
+        self.request_index = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        start_time = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append(
+                RecordedQuery(
+                    sql,
+                    params,
+                    (time.perf_counter() - start_time) * 1000,
+                    context['connection'].alias,
+                    _get_query_origin(),
+                    request_index=self.request_index,
+                )
+            )
+
+    def _request_started(self, **kwargs):
+        """Signal receiver to track which request each query belongs to."""
+        self.request_index += 1
+
+    @contextmanager
+    def record(self):
+        """Records all queries run within context, for all database connections."""
+        request_started.connect(self._request_started)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(self))
+                yield self
+        finally:
+            request_started.disconnect(self._request_started)
+
+
+def group_queries(queries, per_request=False):
+    """Groups multiple RecordedQuery instances by SQL fingerprint. See fingerprint_sql().
+
+    :param queries: Iterable of RecordedQuery instances.
+    :param per_request: Bool indicating if queries from different requests should be grouped separately.
+                        If so, dict keys are instead (request_index, fingerprint) tuples.
+    :return: Dict of {fingerprint: [queries]}, in order first seen.
+    """
+    query_groups = {}
+    for query in queries:
+        if per_request:
+            query_groups.setdefault((query.request_index, query.fingerprint), []).append(query)
+        else:
+            query_groups.setdefault(query.fingerprint, []).append(query)
+
+    return query_groups
+
+
+def format_query_report(queries):
+    """Formats a report of multiple RecordedQuery instances, grouped by SQL fingerprint. See fingerprint_sql().
+
+    Groups are ordered by number of queries, then by total duration.
+
+    :param queries: Iterable of RecordedQuery instances.
+    :return: Report str.
+    """
+    query_groups = group_queries(queries)
+
+    report = ''
+    for fingerprint, query_group in sorted(
+        query_groups.items(),
+        key=lambda item: (len(item[1]), sum(query.duration for query in item[1])),
+        reverse=True,
+    ):
+        report += '    {0}x, {1:.2f} ms: {2}\n'.format(
+            len(query_group),
+            sum(query.duration for query in query_group),
+            fingerprint,
+        )
+        # Show each unique origin, in order first seen.
+        for origin in dict.fromkeys(query.origin for query in query_group):
+            report += '        from {0}\n'.format(origin)
+
+    return report
+
+
+# Per-process performance baseline values, in format {url: {user: values}}.
+# Loaded from the PERFORMANCE_BASELINE_FILE setting on first use.
+_performance_baseline = None
+
+# Performance baseline values recorded by this process, in the same format.
+# Only these are written back to the PERFORMANCE_BASELINE_FILE, so that parallel test processes don't overwrite
+# each other's values.
+_recorded_performance_baseline = {}
+
+# Max seconds to wait on another process to finish writing the PERFORMANCE_BASELINE_FILE.
+_PERFORMANCE_BASELINE_LOCK_TIMEOUT = 30
+
+
+def _get_performance_baseline():
+    """Returns performance baseline values, loading them from the PERFORMANCE_BASELINE_FILE on first call."""
+    global _performance_baseline
+
+    if _performance_baseline is None:
+        _performance_baseline = {}
+        if ETC_PERFORMANCE_BASELINE_FILE and os.path.isfile(ETC_PERFORMANCE_BASELINE_FILE):
+            with open(ETC_PERFORMANCE_BASELINE_FILE, 'r') as baseline_file:
+                _performance_baseline = json.load(baseline_file)
+
+    return _performance_baseline
+
+
+def _get_performance_baseline_user_key(user):
+    """Returns key to save performance baseline values under, for the given request user.
+
+    Default ETC users are keyed by their role (aka TestCase attribute name), so that keys are unaffected by the
+    user identifier settings. All other users are keyed by their USER_MODEL_IDENTIFIER value.
+
+    :param user: User that response was generated with.
+    :return: Baseline user key str.
+    """
+    if user.is_anonymous:
+        return 'anonymous'
+
+    identifier = str(getattr(user, ETC_USER_MODEL_IDENTIFIER))
+    for role, user_values in _DEFAULT_USER_VALUES.items():
+        if identifier == user_values['identifier']:
+            return role
+    return identifier
+
+
+@contextmanager
+def _performance_baseline_lock():
+    """Holds an exclusive lock on the PERFORMANCE_BASELINE_FILE, across all processes.
+
+    Uses a separate lock file, as file locking is otherwise platform specific.
+    If the lock can't be acquired in time, such as from a process that previously crashed, then the lock is ignored.
+    """
+    lock_path = '{0}.lock'.format(ETC_PERFORMANCE_BASELINE_FILE)
+    lock_file = None
+    timeout_time = time.monotonic() + _PERFORMANCE_BASELINE_LOCK_TIMEOUT
+    while lock_file is None:
+        try:
+            lock_file = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if time.monotonic() > timeout_time:
+                print(
+                    'DjangoETC: Timed out waiting on lock file "{0}". Saving performance baseline anyway.'.format(
+                        lock_path,
+                    ),
+                    file=sys.stderr,
+                )
+                break
+            time.sleep(0.05)
+
+    try:
+        yield
+    finally:
+        if lock_file is not None:
+            os.close(lock_file)
+            os.remove(lock_path)
+
+
+def _save_performance_baseline():
+    """Saves performance baseline values to the PERFORMANCE_BASELINE_FILE, if any were recorded this run.
+
+    Recorded values are merged into the current file contents, under a lock.
+    Thus parallel test processes (such as from `manage.py test --parallel` or pytest-xdist) each keep their values.
+    """
+    if ETC_PERFORMANCE_BASELINE_MODE == 'record' and ETC_PERFORMANCE_BASELINE_FILE and _recorded_performance_baseline:
+        with _performance_baseline_lock():
+            baseline = {}
+            if os.path.isfile(ETC_PERFORMANCE_BASELINE_FILE):
+                with open(ETC_PERFORMANCE_BASELINE_FILE, 'r') as baseline_file:
+                    baseline = json.load(baseline_file)
+            for url, user_values in _recorded_performance_baseline.items():
+                baseline.setdefault(url, {}).update(user_values)
+
+            # Write to temp file first, so that file is never left partially written.
+            temp_path = '{0}.{1}.tmp'.format(ETC_PERFORMANCE_BASELINE_FILE, os.getpid())
+            with open(temp_path, 'w') as baseline_file:
+                json.dump(baseline, baseline_file, indent=4, sort_keys=True)
+                baseline_file.write('\n')
+            os.replace(temp_path, ETC_PERFORMANCE_BASELINE_FILE)
+
+
+atexit.register(_save_performance_baseline)
+
+
+# Response status codes that are followed as redirects. Same as the Django test client.
+_REDIRECT_STATUS_CODES = (301, 302, 303, 307, 308)
+
+# Max number of redirects that the Django test client "follow" arg allows, before raising a RedirectCycleError.
+_DJANGO_MAX_REDIRECTS = 20
+
+
+def _get_follow_value(follow):
+    """Normalizes provided "follow" value for response assertions.
+
+    :param follow: One of True, False, or "auto". String values of "true"/"false" are also accepted.
+    :return: One of True, False, or "auto".
+    """
+    if isinstance(follow, str):
+        follow_str = follow.strip().lower()
+        if follow_str not in ('auto', 'true', 'false'):
+            raise ValueError('Invalid follow value. Must be one of: [True, False, "auto"].')
+        return 'auto' if follow_str == 'auto' else follow_str == 'true'
+    return bool(follow)
+
+
+def _get_return_format(return_format):
+    """Normalizes provided "return_format" value for response assertions.
+
+    :param return_format: One of "html" or "json".
+    :return: Normalized return format.
+    """
+    return_format = str(return_format).lower().strip()
+    if return_format not in ['html', 'json']:
+        raise ValueError('Invalid return_format arg. Currently supported return_format values are `html` or `json`.')
+    return return_format
+
+
+def _get_max_redirects(max_redirects):
+    """Validates provided max_redirects value for response assertions.
+
+    :param max_redirects: Max number of redirects to follow. Falls back to MAX_REDIRECTS setting if None.
+    :return: Validated max number of redirects.
+    """
+    max_redirects = ETC_MAX_REDIRECTS if max_redirects is None else int(max_redirects)
+    if not 0 <= max_redirects <= _DJANGO_MAX_REDIRECTS:
+        raise ValueError(
+            'Invalid max_redirects value of {0}. Must be between 0 and {1} (the Django test client limit).'.format(
+                max_redirects,
+                _DJANGO_MAX_REDIRECTS,
+            )
+        )
+    return max_redirects
+
+
+def _check_redirect_limit(response, max_redirects):
+    """Verifies that provided response did not follow more than max_redirects redirects.
+
+    The Django test client "follow" arg has a fixed limit of 20 redirects.
+    So lower limits are checked against the resulting redirect chain instead.
+
+    :param response: Django response object, after following redirects.
+    :param max_redirects: Max number of redirects that can be followed.
+    """
+    if len(getattr(response, 'redirect_chain', [])) > max_redirects:
+        raise RedirectCycleError(
+            'Too many redirects. Exceeded max_redirects value of {0}.'.format(max_redirects),
+            last_response=response,
+        )
+
+
+def _get_asgi_header_extra(headers):
+    """Converts a dict of request headers to AsyncClient "extra" kwargs.
+
+    Older Django versions do not support the "headers" arg for AsyncClient requests, and treat it as an ASGI scope
+    value instead. Whereas "extra" kwargs are added as request headers on all Django versions that have AsyncClient.
+    """
+    return {str(header_name).lower(): str(value) for header_name, value in (headers or {}).items()}
+
+
+def _get_redirect_request(response, data, secure):
+    """Determines the AsyncClient request needed to follow provided redirect response.
+
+    Mirrors the redirect handling of the Django test client "follow" arg.
+    AsyncClient requests always use the default test server host, so only the scheme of absolute urls is used.
+
+    :param response: Redirect response to follow.
+    :param data: Data of the request that generated provided response.
+    :param secure: Bool indicating if the request that generated provided response was HTTPS.
+    :return: Tuple of (request_method_name, path, data, secure) for the redirect request.
+    """
+    url_parts = urlsplit(response.url)
+    if url_parts.scheme:
+        secure = url_parts.scheme == 'https'
+
+    path = url_parts.path
+    # Empty path should be normalized to "/".
+    if not path and url_parts.netloc:
+        path = '/'
+    # Prepend the request path to handle relative path redirects.
+    if not path.startswith('/'):
+        path = urljoin(response.request['path'], path)
+
+    if response.status_code in (307, 308):
+        # Preserve request method and data for 307/308 redirects.
+        request_method = response.request['method'].lower()
+        if request_method != 'get' and url_parts.query:
+            path = '{0}?{1}'.format(path, url_parts.query)
+    else:
+        request_method = 'get'
+        data = QueryDict(url_parts.query)
+
+    return request_method, path, data, secure
+
+
+async def _async_follow_redirects(async_client, response, data=None, secure=True, headers=None):
+    """Follows any redirects of provided response, using provided AsyncClient.
+
+    Same as the Django AsyncClient "follow" arg, including setting `response.redirect_chain`.
+    Only used for Django versions before 5.0, as older AsyncClient versions do not support the "follow" arg.
+    Provided headers are sent as AsyncClient "extra" kwargs. See _get_asgi_header_extra().
+
+    :param async_client: Django AsyncClient that generated provided response.
+    :param response: Django response object to follow redirects of.
+    :param data: Data of the request that generated provided response.
+    :param secure: Bool indicating if the request that generated provided response was HTTPS.
+    :param headers: Additional test client headers, if any.
+    :return: Django response object, after any redirects.
+    """
+    redirect_chain = []
+    response.redirect_chain = redirect_chain
+
+    while response.status_code in _REDIRECT_STATUS_CODES:
+        redirect_chain.append((response.url, response.status_code))
+        request_method, path, data, secure = _get_redirect_request(response, data, secure)
+
+        response = await getattr(async_client, request_method)(
+            path,
+            data=data,
+            secure=secure,
+            **_get_asgi_header_extra(headers),
+        )
+        response.redirect_chain = redirect_chain
+
+        # Same checks as the Django test client.
+        if redirect_chain[-1] in redirect_chain[:-1]:
+            raise RedirectCycleError('Redirect loop detected.', last_response=response)
+        if len(redirect_chain) > _DJANGO_MAX_REDIRECTS:
+            raise RedirectCycleError('Too many redirects.', last_response=response)
+
+    return response
+
+
+def _store_minimal_context(store, signal, sender, template, context, **kwargs):
+    """Template render signal receiver, for IntegrationClient "minimal" context capture.
+
+    Same as the Django test client receiver, except only the messages and form objects of the top-level template
+    context are saved. Rather than a copy of every rendered template context.
+    """
+    store.setdefault('templates', []).append(template)
+    if 'context' not in store:
+        # First template rendered is the top-level one. Later context dicts take priority, same as in templates.
+        # Saved as a single item list, which the Django test client then flattens to just the dict.
+        store['context'] = [
+            {
+                key: value
+                for context_dict in context.dicts
+                for key, value in context_dict.items()
+                if key == 'messages' or isinstance(value, (BaseForm, BaseFormSet))
+            }
+        ]
+
+
+def _skip_template_store(store, signal, sender, template, context, **kwargs):
+    """Template render signal receiver, for IntegrationClient "none" context capture. Saves nothing."""
+    pass
+
+
+class IntegrationClient(Client):
+    """Django test client, with configurable capture of rendered template context.
+
+    The default Django test client copies the context of every rendered template into `response.context`.
+    For pages with many included templates, or large contexts, that can cost more than the view itself.
+
+    Context capture modes:
+        * "full" - Same as the default Django test client.
+        * "minimal" - Only captures the messages and form objects of the top-level template, as a dict.
+        * "none" - Captures no template data at all. `response.context` is None, and `response.templates` is empty.
+    """
+
+    context_capture_modes = ('full', 'minimal', 'none')
+
+    def __init__(self, *args, context_capture='full', **kwargs):
+        super().__init__(*args, **kwargs)
+        self.context_capture = context_capture
+
+    def request(self, **request):
+        """Makes a generic request. Same as the Django test client, but with configurable context capture."""
+        if self.context_capture not in self.context_capture_modes:
+            raise ValueError(
+                'Invalid context_capture value of "{0}". Must be one of: {1}.'.format(
+                    self.context_capture,
+                    list(self.context_capture_modes),
+                )
+            )
+        if self.context_capture == 'full':
+            return super().request(**request)
+
+        # The Django test client looks up its template render receiver function on each request.
+        # So only that receiver is swapped out, for the duration of this request.
+        store_templates = _store_minimal_context if self.context_capture == 'minimal' else _skip_template_store
+        with patch.object(django.test.client, 'store_rendered_templates', store_templates):
+            return super().request(**request)
+
+
+@contextmanager
+def suppress_logging(level='CRITICAL', loggers=None):
+    """Suppresses all logging of provided level or lower, for the duration of the context.
+
+    Original logging state is always restored on exit, even if an exception (such as a failed assertion) occurs.
+
+    Suppression is done by logging level, rather than by handler filtering. So suppressed loggers short-circuit on
+    their isEnabledFor() check, and never create or format log records.
+
+    :param level: Logging level (as name or number). Any logging of this level or lower is suppressed.
+                  If None, then logging is left as-is.
+    :param loggers: Optional logger name, or list of logger names, to suppress. Child loggers are also suppressed,
+                    unless they have their own level set. If None, then all logging is suppressed.
+    """
+    if level is None:
+        yield
+        return
+
+    # Sanitize provided level.
+    if isinstance(level, str):
+        level = logging.getLevelName(level.strip().upper())
+    if not isinstance(level, int):
+        raise ValueError(
+            'Invalid logging level. Must be a level number, or one of: '
+            '["NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"].'
+        )
+
+    if loggers is None:
+        # Suppress all logging. Logging.disable() is checked first by every logger's isEnabledFor().
+        orig_disable_level = logging.root.manager.disable
+        logging.disable(level)
+        try:
+            yield
+        finally:
+            logging.disable(orig_disable_level)
+
+    else:
+        # Only suppress provided loggers, by raising their level past provided level.
+        if isinstance(loggers, str):
+            loggers = [loggers]
+        orig_levels = [(logger, logger.level) for logger in (logging.getLogger(name) for name in loggers)]
+        for logger, orig_level in orig_levels:
+            logger.setLevel(max(logger.getEffectiveLevel(), level + 1))
+        try:
+            yield
+        finally:
+            for logger, orig_level in orig_levels:
+                logger.setLevel(orig_level)
+
+
+def _suppress_assertion_logging(func):
+    """Decorator for response assertions, to suppress logging for the duration of the assertion.
+
+    Configures logging for this specific assertion run. Can be used to suppress logging output for views with many
+    logging statements. Uses the debug_logging_level/debug_loggers values passed to the assertion, with settings
+    values as fallback. Original logging state is restored once the assertion ends, even if the assertion fails.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, debug_logging_level=None, debug_loggers=None, **kwargs):
+        logging_level = ETC_RESPONSE_DEBUG_LOGGING_LEVEL if debug_logging_level is None else debug_logging_level
+        loggers = ETC_RESPONSE_DEBUG_LOGGERS if debug_loggers is None else debug_loggers
+        with suppress_logging(logging_level, loggers=loggers):
+            return func(self, *args, debug_logging_level=debug_logging_level, debug_loggers=debug_loggers, **kwargs)
+
+    return wrapper
+
+
 class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
     """Testing functionality for views and other multi-part components."""
 
+    # Test client that allows skipping template context capture, when not needed.
+    client_class = IntegrationClient
+
     def __init__(self, *args, **kwargs):
         # Call parent logic.
         super().__init__(*args, **kwargs)
@@ -116,6 +836,9 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         # Call parent logic.
         return_val = super().setUpClass()
 
+        # Initialize response timings, for per-class aggregation.
+        cls._class_response_timings = []
+
         # Initialize url variables.
         try:
             cls.login_url = reverse(settings.LOGIN_URL)
@@ -147,6 +870,10 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         self._error_displayed = False
         self._reset_client_state_on_request = ETC_RESET_CLIENT_STATE_ON_REQUEST
 
+        # Initialize response timings, for per-test aggregation.
+        self._response_timings = []
+        self._active_response_timings = None
+
         # Return original python class value, if any.
         # ETC setup/teardown functions never contain a return value.
         return return_val
@@ -184,6 +911,7 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
 
     # region Custom Assertions
 
+    @_suppress_assertion_logging
     def assertResponse(
         self,
         url,
@@ -193,7 +921,7 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         secure=True,
         return_format='html',
         headers=None,
-        expected_status=200,
+        expected_status=None,
         expected_url=None,
         expected_redirect_url=None,
         expected_final_url=None,
@@ -211,6 +939,14 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         expected_content=None,
         expected_not_content=None,
         expected_json=None,
+        expected_max_queries=None,
+        expected_max_db_time_ms=None,
+        assert_no_n_plus_one=None,
+        expected_max_duration_ms=None,
+        expected_max_content_bytes=None,
+        check_performance_baseline=False,
+        follow=None,
+        max_redirects=None,
         auto_login=True,
         user=None,
         user_permissions=None,
@@ -220,6 +956,7 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         content_starts_after=None,
         content_ends_before=None,
         debug_logging_level=None,
+        debug_loggers=None,
         **kwargs,
     ):
         """Verifies the view response object at given URL matches provided parameters.
@@ -247,6 +984,7 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         :param redirect_kwargs: Values to provide for redirect URL population, in "kwarg" format.
         :param redirect_query_params: Query parameter values to provide for redirect URL population.
         :param expected_status: Expected status code, after any redirections. Default code of 200.
+                                If provided with a follow value of "auto", then the full redirect chain is followed.
         :param expected_title: Expected page title to verify. Skips title test if left as None.
         :param expected_header: Expected page h1 to verify. Skips header test if left as None.
         :param expected_messages: Expected context messages to verify. Skips message test if left as None.
@@ -255,6 +993,19 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         :param expected_not_content: Inverse of expected_content. Skips test if left as None.
         :param expected_json: If expecting JSON formatted response, then the JSON value to check for.
                               Currently requires the full JSON value. Does not do partials.
+        :param expected_max_queries: Max number of database queries the view request can run. Skips test if None.
+        :param expected_max_db_time_ms: Max total duration (in milliseconds) of database queries the view request
+                                        can run. Skips test if None.
+        :param assert_no_n_plus_one: Bool indicating if view request should be checked for "N+1" queries.
+                                     Falls back to ASSERT_NO_N_PLUS_ONE setting if None.
+        :param expected_max_duration_ms: Max duration (in milliseconds) of the view request. Skips test if None.
+        :param expected_max_content_bytes: Max size (in bytes) of the response content. Skips test if None.
+        :param check_performance_baseline: Bool indicating if response performance should be compared to (or recorded
+                                           as) the baseline values in the PERFORMANCE_BASELINE_FILE setting.
+        :param follow: How view redirects are handled. True to follow the full redirect chain. False to never follow.
+                       "auto" to stop after the first hop if only redirect expectations are given, and otherwise
+                       follow the full chain. Falls back to FOLLOW_REDIRECTS setting if None.
+        :param max_redirects: Max number of redirects to follow. Falls back to MAX_REDIRECTS setting if None.
         :param auto_login: Bool indicating if user should be auto-logged-in.
         :param user: User to log in with, if auto_login is True. Defaults to `test_user`.
         :param user_permissions: Optional permissions to provide to login user.
@@ -266,46 +1017,61 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         :param content_ends_before: The HTML that expected_content should occur before. This HTML and everything
                                     following is stripped out of the "search space" for the expected_content value.
         :param debug_logging_level: Optionally set a logging level. Any logging of this level or lower is disabled.
+        :param debug_loggers: Optional logger names to limit debug_logging_level to. If None, applies to all loggers.
         """
-
-        # Configure logging for this specific assertion run.
-        # Can be used to disable logging output for views with many logging statements.
-        orig_logging_level = None
-        if debug_logging_level or ETC_RESPONSE_DEBUG_LOGGING_LEVEL:
-            # Try to use the value passed method, use settings value as fallback.
-            logging_level = debug_logging_level or ETC_RESPONSE_DEBUG_LOGGING_LEVEL
-            orig_logging_level = logging.getLevelName(logging.root.level)
-
-            # Set logging level, which configures logging to only show messages of set level or higher.
-            # If CRITICAL is provided, then all logging is effectively disabled.
-            # If NOTSET is provided, then all logging is effectively enabled.
-            logging.disable(getattr(logging, logging_level))
+        start_time = time.perf_counter()
 
         # Handle mutable data defaults.
         data = data or {}
         headers = headers or {}
         url_args = (*kwargs.pop('args', []), *(url_args or []))
         url_query_params = url_query_params or {}
-        redirect_args = (*(redirect_args or []),)
-        redirect_kwargs = {
-            **(redirect_kwargs or {}),
-        }
-        redirect_query_params = redirect_query_params or {}
         url_kwargs = {**kwargs.pop('kwargs', {}), **(url_kwargs or {})}
         extra_usergen_kwargs = extra_usergen_kwargs or {}
+        if assert_no_n_plus_one is None:
+            # No value provided for this assertion. Fall back to settings value.
+            assert_no_n_plus_one = ETC_ASSERT_NO_N_PLUS_ONE
 
         # Sanitize required values.
-        return_format = str(return_format).lower().strip()
-        if return_format not in ['html', 'json']:
-            raise ValueError(
-                'Invalid return_format arg. Currently supported return_format values are `html` or `json`.'
-            )
+        return_format = _get_return_format(return_format)
+
+        # Determine if view redirects should be followed.
+        follow, follow_is_auto = self._get_response_follow(
+            follow,
+            return_format=return_format,
+            expected_status=expected_status,
+            expected_redirect_url=expected_redirect_url,
+            expected_final_url=expected_final_url,
+            view_should_redirect=view_should_redirect,
+            expected_title=expected_title,
+            expected_header=expected_header,
+            expected_messages=expected_messages,
+            expected_not_messages=expected_not_messages,
+            expected_content=expected_content,
+            expected_not_content=expected_not_content,
+            expected_json=expected_json,
+            expected_max_queries=expected_max_queries,
+            expected_max_db_time_ms=expected_max_db_time_ms,
+            assert_no_n_plus_one=assert_no_n_plus_one,
+            expected_max_duration_ms=expected_max_duration_ms,
+            expected_max_content_bytes=expected_max_content_bytes,
+            check_performance_baseline=check_performance_baseline,
+        )
+
+        # Determine how much template context the request needs to capture.
+        # Debug output always shows the full context. Otherwise, only messages are needed for assertions.
+        context_capture = None
+        if ETC_LIGHTWEIGHT_CLIENT and not self._debug_print_bool:
+            if expected_messages is not None or expected_not_messages is not None:
+                context_capture = 'minimal'
+            else:
+                context_capture = 'none'
 
         if self._reset_client_state_on_request:
             # Reset client "user login" state for new response generation.
             # Note that this also clears out the current session.
             # If wanting to retain session across requests, then this should be set to False first.
-            self.client.logout()
+            self._reset_client_state()
 
         # Handle getting user.
         user = self._get_default_request_user(user, auto_login)
@@ -325,8 +1091,148 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
             user_permissions=user_permissions,
             user_groups=user_groups,
             extra_usergen_kwargs=extra_usergen_kwargs,
+            record_queries=(
+                expected_max_queries is not None
+                or expected_max_db_time_ms is not None
+                or assert_no_n_plus_one
+                or check_performance_baseline
+            ),
+            follow=follow,
+            max_redirects=max_redirects,
+            context_capture=context_capture,
         )
 
+        # Run all assertions against found response.
+        return self._assertResponse__verify(
+            response,
+            url,
+            *args,
+            get=get,
+            data=data,
+            secure=secure,
+            return_format=return_format,
+            headers=headers,
+            expected_status=expected_status,
+            expected_url=expected_url,
+            expected_redirect_url=expected_redirect_url,
+            expected_final_url=expected_final_url,
+            view_should_redirect=view_should_redirect,
+            url_args=url_args,
+            url_kwargs=url_kwargs,
+            url_query_params=url_query_params,
+            redirect_args=redirect_args,
+            redirect_kwargs=redirect_kwargs,
+            redirect_query_params=redirect_query_params,
+            expected_title=expected_title,
+            expected_header=expected_header,
+            expected_messages=expected_messages,
+            expected_not_messages=expected_not_messages,
+            expected_content=expected_content,
+            expected_not_content=expected_not_content,
+            expected_json=expected_json,
+            expected_max_queries=expected_max_queries,
+            expected_max_db_time_ms=expected_max_db_time_ms,
+            assert_no_n_plus_one=assert_no_n_plus_one,
+            expected_max_duration_ms=expected_max_duration_ms,
+            expected_max_content_bytes=expected_max_content_bytes,
+            check_performance_baseline=check_performance_baseline,
+            follow=follow,
+            follow_is_auto=follow_is_auto,
+            max_redirects=max_redirects,
+            auto_login=auto_login,
+            user=user,
+            user_permissions=user_permissions,
+            user_groups=user_groups,
+            extra_usergen_kwargs=extra_usergen_kwargs,
+            ignore_content_ordering=ignore_content_ordering,
+            content_starts_after=content_starts_after,
+            content_ends_before=content_ends_before,
+            start_time=start_time,
+            **kwargs,
+        )
+
+    def _assertResponse__verify(
+        self,
+        response,
+        url,
+        *args,
+        get=True,
+        data=None,
+        secure=True,
+        return_format='html',
+        headers=None,
+        expected_status=None,
+        expected_url=None,
+        expected_redirect_url=None,
+        expected_final_url=None,
+        view_should_redirect=None,
+        url_args=None,
+        url_kwargs=None,
+        url_query_params=None,
+        redirect_args=None,
+        redirect_kwargs=None,
+        redirect_query_params=None,
+        expected_title=None,
+        expected_header=None,
+        expected_messages=None,
+        expected_not_messages=None,
+        expected_content=None,
+        expected_not_content=None,
+        expected_json=None,
+        expected_max_queries=None,
+        expected_max_db_time_ms=None,
+        assert_no_n_plus_one=None,
+        expected_max_duration_ms=None,
+        expected_max_content_bytes=None,
+        check_performance_baseline=False,
+        follow=True,
+        follow_is_auto=False,
+        max_redirects=None,
+        auto_login=True,
+        user=None,
+        user_permissions=None,
+        user_groups=None,
+        extra_usergen_kwargs=None,
+        ignore_content_ordering=False,
+        content_starts_after=None,
+        content_ends_before=None,
+        start_time=None,
+        **kwargs,
+    ):
+        """Helper function for assertResponse(), assertAccessMatrix(), and assertAsyncResponse().
+
+        Runs all assertResponse() assertions and hook functions on a response that was already retrieved.
+        Accepts the same args as assertResponse(), with the below additions.
+
+        :param response: Response object from _get_page_response() or _get_async_page_responses().
+        :param follow: Bool indicating if redirects were followed for the response.
+        :param follow_is_auto: Bool indicating if above follow value was determined from a follow value of "auto".
+        :param start_time: Start time of the assertion, for response timings. If None, then the total is summed
+                           from the recorded response timing phases instead.
+        :return: Provided response object, once all assertions pass.
+        """
+        timings = response.etc_timings
+        self._active_response_timings = timings
+
+        # Handle mutable data defaults.
+        data = data or {}
+        headers = headers or {}
+        redirect_args = (*(redirect_args or []),)
+        redirect_kwargs = {
+            **(redirect_kwargs or {}),
+        }
+        redirect_query_params = redirect_query_params or {}
+        extra_usergen_kwargs = extra_usergen_kwargs or {}
+        if assert_no_n_plus_one is None:
+            # No value provided for this assertion. Fall back to settings value.
+            assert_no_n_plus_one = ETC_ASSERT_NO_N_PLUS_ONE
+        if expected_status is None:
+            # No value provided. Default to a successful page load.
+            expected_status = 200
+
+        # If "auto" redirect handling stopped at a redirect, then there is no final page to check the status of.
+        redirect_target_skipped = follow_is_auto and not follow and response.status_code in _REDIRECT_STATUS_CODES
+
         # If response is json format, then save actual python-i-fied json data to response as well.
         # Note: Django seems to have built-in processing for `response.content`, so we have to save to
         #   a different variable. This has the added benefit that tests can see what the original json output was,
@@ -338,10 +1244,12 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
             if expected_json is not None:
                 raise ValueError(
                     'Assertion was not expecting a JSON return object, yet expected_json arg was provided. '
-                    'Either provide a return_format arg of `json`, or consider using the assertJsonResponse assertion.'
+                    'Either provide a return_format arg of `json`, '
+                    'or consider using the assertJsonResponse assertion.'
                 )
 
         # Optionally output all debug info for found response.
+        phase_start_time = time.perf_counter()
         if self._debug_print_bool:
             if return_format == 'json':
                 # Extra args for json debug output handling.
@@ -354,8 +1262,10 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
             else:
                 # Standard debug output handling.
                 self.full_debug_print(response, return_format=return_format, post_data=data)
+        timings.add_time('debug_print', phase_start_time)
 
         # Optional hook for running custom pre-builtin-test logic.
+        phase_start_time = time.perf_counter()
         self._assertResponse__pre_builtin_tests(
             url,
             *args,
@@ -381,6 +1291,14 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
             expected_not_messages=expected_not_messages,
             expected_content=expected_content,
             expected_not_content=expected_not_content,
+            expected_max_queries=expected_max_queries,
+            expected_max_db_time_ms=expected_max_db_time_ms,
+            assert_no_n_plus_one=assert_no_n_plus_one,
+            expected_max_duration_ms=expected_max_duration_ms,
+            expected_max_content_bytes=expected_max_content_bytes,
+            check_performance_baseline=check_performance_baseline,
+            follow=follow,
+            max_redirects=max_redirects,
             auto_login=auto_login,
             user=user,
             user_permissions=user_permissions,
@@ -390,11 +1308,13 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
             content_starts_after=content_starts_after,
             content_ends_before=content_ends_before,
             debug_logging_level=None,
+            debug_loggers=None,
             **kwargs,
         )
 
         # Verify page status code.
-        self.assertStatusCode(response, expected_status)
+        if not redirect_target_skipped:
+            self.assertStatusCode(response, expected_status)
 
         # Verify initial url.
         # TODO: Inconsistent expected_x_url handling.
@@ -452,12 +1372,14 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         # TODO: Inconsistent expected_x_url handling.
         #  See project issue 22 (https://github.com/brodriguez8774/django-expanded-test-cases/issues/22).
         if expected_redirect_url is not None:
+            # If redirects were not followed, then only check the redirect itself, without fetching the target.
             self.assertRedirects(
                 response,
                 expected_redirect_url,
                 redirect_args=redirect_args,
                 redirect_kwargs=redirect_kwargs,
                 redirect_query_params=redirect_query_params,
+                fetch_redirect_response=follow,
             )
 
         # Verify page title.
@@ -502,6 +1424,30 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
                     )
                 )
 
+        # Verify database query budgets.
+        if expected_max_queries is not None or expected_max_db_time_ms is not None:
+            self.assertQueryBudget(
+                response,
+                expected_max_queries=expected_max_queries,
+                expected_max_db_time_ms=expected_max_db_time_ms,
+            )
+
+        # Verify no "N+1" queries.
+        if assert_no_n_plus_one:
+            self.assertNoNPlusOneQueries(response)
+
+        # Verify response duration and size budgets.
+        if expected_max_duration_ms is not None or expected_max_content_bytes is not None:
+            self.assertResponseBudget(
+                response,
+                expected_max_duration_ms=expected_max_duration_ms,
+                expected_max_content_bytes=expected_max_content_bytes,
+            )
+
+        # Verify response performance against baseline.
+        if check_performance_baseline:
+            self._check_performance_baseline(response, get=get, data=data, secure=secure, headers=headers)
+
         # Optional hook for running custom post-builtin-test logic.
         self._assertResponse__post_builtin_tests(
             url,
@@ -528,6 +1474,14 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
             expected_not_messages=expected_not_messages,
             expected_content=expected_content,
             expected_not_content=expected_not_content,
+            expected_max_queries=expected_max_queries,
+            expected_max_db_time_ms=expected_max_db_time_ms,
+            assert_no_n_plus_one=assert_no_n_plus_one,
+            expected_max_duration_ms=expected_max_duration_ms,
+            expected_max_content_bytes=expected_max_content_bytes,
+            check_performance_baseline=check_performance_baseline,
+            follow=follow,
+            max_redirects=max_redirects,
             auto_login=auto_login,
             user=user,
             user_permissions=user_permissions,
@@ -537,12 +1491,18 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
             content_starts_after=content_starts_after,
             content_ends_before=content_ends_before,
             debug_logging_level=None,
+            debug_loggers=None,
             **kwargs,
         )
+        timings.add_time('assertions', phase_start_time)
 
-        # Reset logging level for post-assertion, if it was set earlier.
-        if orig_logging_level:
-            logging.disable(getattr(logging, orig_logging_level))
+        # Save response timings for later aggregation.
+        if start_time is not None:
+            timings.total = (time.perf_counter() - start_time) * 1000
+        else:
+            # Normalization time is already included in the other phases, so is not summed separately.
+            timings.total = sum(getattr(timings, phase) for phase in ResponseTimings.exclusive_phases)
+        self._record_response_timings(timings)
 
         # Handle potential warning if no hook functions have been implemented.
         self._hook_function_warning_check(user, *args, **kwargs)
@@ -557,7 +1517,7 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         data=None,
         secure=True,
         headers=None,
-        expected_status=200,
+        expected_status=None,
         expected_url=None,
         expected_redirect_url=None,
         expected_final_url=None,
@@ -643,7 +1603,7 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         data=None,
         secure=True,
         headers=None,
-        expected_status=200,
+        expected_status=None,
         expected_url=None,
         expected_redirect_url=None,
         expected_final_url=None,
@@ -737,7 +1697,7 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         secure=True,
         return_format='json',
         headers=None,
-        expected_status=200,
+        expected_status=None,
         expected_url=None,
         expected_redirect_url=None,
         expected_final_url=None,
@@ -860,6 +1820,266 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
             **kwargs,
         )
 
+    def assertAccessMatrix(
+        self,
+        urls,
+        user_expectations,
+        get=True,
+        data=None,
+        secure=True,
+        headers=None,
+        url_args=None,
+        url_kwargs=None,
+        url_query_params=None,
+        user_permissions=None,
+        user_groups=None,
+        extra_usergen_kwargs=None,
+        follow=None,
+        max_redirects=None,
+    ):
+        """Verifies the response of every provided URL, for every provided user.
+
+        Meant for access-control checks, where many users are checked against the same set of views.
+
+        Expected values are either a status code, or a dict of assertResponse() kwargs for a full response check.
+        A status code is the same as a dict of {"expected_status": status_code}, except that each user is logged in
+        (and given any provided Permissions/Groups) only once, with the resulting session reused for every URL.
+
+        Rather than failing on the first mismatch, all mismatches are collected and reported at once.
+
+        Note: As sessions are reused, views that end the session (such as logout) should not be included.
+
+        :param urls: Url, or list of urls, to get response objects from.
+        :param user_expectations: Dict of {user: expected_status_or_spec}.
+                                  Users can be any value accepted by get_user(). None is an anonymous user.
+        :param get: Bool indicating if response is GET or POST. Defaults to GET.
+        :param data: Optional dict of items to pass into response generation.
+        :param secure: Bool indicating if request should be retrieved as HTTP or HTTPS.
+        :param headers: Additional test client headers, if any.
+        :param url_args: Values to provide for URL population, in "arg" format.
+        :param url_kwargs: Values to provide for URL population, in "kwarg" format.
+        :param url_query_params: Query parameter values to provide for URL population.
+        :param user_permissions: Optional permissions to provide to every login user.
+        :param user_groups: Optional groups to provide to every login user.
+        :param extra_usergen_kwargs: Optional dictionary of values to pass to _get_login_user__extra_user_auth_setup().
+        :param follow: How view redirects are handled. Falls back to FOLLOW_REDIRECTS setting if None.
+                       See assertResponse() for accepted values.
+        :param max_redirects: Max number of redirects to follow. Falls back to MAX_REDIRECTS setting if None.
+        :return: Dict of {url: {user: actual_status}}.
+        """
+        # Django imports here to avoid situational "Apps aren't loaded yet" error.
+        from django.contrib.auth.models import AnonymousUser
+
+        # Handle mutable data defaults.
+        if isinstance(urls, str):
+            urls = [urls]
+        data = data or {}
+        headers = headers or {}
+        url_args = url_args or []
+        url_kwargs = url_kwargs or {}
+        url_query_params = url_query_params or {}
+        extra_usergen_kwargs = extra_usergen_kwargs or {}
+
+        # Validate data types.
+        if not isinstance(user_expectations, dict):
+            raise TypeError('Provided "user_expectations" arg must be a dict of {user: expected_status_or_spec}.')
+
+        def is_anonymous(user):
+            return user is None or isinstance(user, AnonymousUser)
+
+        # Log in each user once, and save the resulting session.
+        # Each request then only needs to swap out the session cookie.
+        session_cookie_name = settings.SESSION_COOKIE_NAME
+        sessions = {}
+        login_users = {}
+        for user, expected in user_expectations.items():
+            if isinstance(expected, dict) or is_anonymous(user):
+                # Either anonymous, or handled by the full assertResponse() logic instead.
+                continue
+
+            # Start from an empty cookie jar, so that login creates a new session rather than replacing another.
+            self._reset_client_state()
+            login_user = self._get_login_user(
+                user,
+                auto_login=True,
+                user_permissions=user_permissions,
+                user_groups=user_groups,
+                **extra_usergen_kwargs,
+            )
+            login_users[user] = login_user
+            if not isinstance(login_user, AnonymousUser):
+                sessions[user] = self.client.cookies[session_cookie_name].value
+
+        results = {}
+        mismatches = []
+        for url in urls:
+            results[url] = {}
+            for user, expected in user_expectations.items():
+                # Each request gets its own cookie jar, so that no other cookies (such as messages) carry over.
+                self._reset_client_state()
+
+                if isinstance(expected, dict):
+                    # Full response spec. Run through standard assertion logic, but collect failures.
+                    # Values in spec take priority over matrix-wide values.
+                    response_kwargs = {
+                        'get': get,
+                        'data': data,
+                        'secure': secure,
+                        'headers': headers,
+                        'url_args': url_args,
+                        'url_kwargs': url_kwargs,
+                        'url_query_params': url_query_params,
+                        'auto_login': not is_anonymous(user),
+                        'user': None if is_anonymous(user) else user,
+                        'user_permissions': user_permissions,
+                        'user_groups': user_groups,
+                        'extra_usergen_kwargs': extra_usergen_kwargs,
+                        'follow': follow,
+                        'max_redirects': max_redirects,
+                        **expected,
+                    }
+                    try:
+                        response = self.assertResponse(url, **response_kwargs)
+                        results[url][user] = response.status_code
+                    except AssertionError as err:
+                        results[url][user] = None
+                        mismatches.append((url, user, str(err).strip()))
+                    continue
+
+                # Status code only. Request with the user's saved session, rather than logging in again.
+                start_time = time.perf_counter()
+                session_key = sessions.get(user, None)
+                if session_key is not None:
+                    self.client.cookies[session_cookie_name] = session_key
+                request_follow, follow_is_auto = self._get_response_follow(follow, expected_status=expected)
+                response = self._get_page_response(
+                    url,
+                    get=get,
+                    data=data,
+                    secure=secure,
+                    headers=headers,
+                    url_args=url_args,
+                    url_kwargs=url_kwargs,
+                    query_params=url_query_params,
+                    auto_login=False,
+                    follow=request_follow,
+                    max_redirects=max_redirects,
+                )
+                response.user = login_users.get(user, None) or AnonymousUser()
+
+                # Views can cycle the session key. If so, then keep the updated value for later requests.
+                if session_key is not None and session_cookie_name in self.client.cookies:
+                    sessions[user] = self.client.cookies[session_cookie_name].value
+
+                results[url][user] = response.status_code
+                try:
+                    self._assertResponse__verify(
+                        response,
+                        url,
+                        get=get,
+                        data=data,
+                        secure=secure,
+                        headers=headers,
+                        expected_status=expected,
+                        url_args=url_args,
+                        url_kwargs=url_kwargs,
+                        url_query_params=url_query_params,
+                        follow=request_follow,
+                        follow_is_auto=follow_is_auto,
+                        max_redirects=max_redirects,
+                        auto_login=not is_anonymous(user),
+                        user=AnonymousUser() if is_anonymous(user) else user,
+                        user_permissions=user_permissions,
+                        user_groups=user_groups,
+                        extra_usergen_kwargs=extra_usergen_kwargs,
+                        start_time=start_time,
+                    )
+                except AssertionError as err:
+                    mismatches.append((url, user, str(err).strip()))
+
+        # Leave client in a logged-out state.
+        self._reset_client_state()
+
+        # Report all mismatches at once.
+        if mismatches:
+            self.fail(
+                'Access matrix had {0} mismatch(es), out of {1} checked responses:\n{2}'.format(
+                    len(mismatches),
+                    len(urls) * len(user_expectations),
+                    '\n'.join(
+                        '  Url "{0}" with user "{1}":\n{2}'.format(
+                            url,
+                            'anonymous' if is_anonymous(user) else user,
+                            textwrap.indent(message, '    '),
+                        )
+                        for url, user, message in mismatches
+                    ),
+                )
+            )
+
+        # All assertions passed. Return results in case user wants to do further checks.
+        return results
+
+    @_suppress_assertion_logging
+    def assertAsyncResponse(self, url, debug_logging_level=None, debug_loggers=None, **kwargs):
+        """Verifies the view response object at given URL, with the request sent through Django's AsyncClient.
+
+        Meant for async views, as the request is then handled by Django's ASGI request handler.
+        Accepts the same args as assertResponse(), other than the database query assertions.
+
+        :param url: Url to get response object from.
+        :param debug_logging_level: Optionally set a logging level. Any logging of this level or lower is disabled.
+        :param debug_loggers: Optional logger names to limit debug_logging_level to. If None, applies to all loggers.
+        :return: Django response object for provided url.
+        """
+        response, assertion_kwargs = self._get_async_page_responses([{'url': url, **kwargs}])[0]
+
+        # All assertions passed so far. Return response in case user wants to do further checks.
+        return self._assertResponse__verify(response, **assertion_kwargs)
+
+    def assertResponses(self, requests, concurrency=10):
+        """Verifies multiple view responses, with all requests sent concurrently through Django's AsyncClient.
+
+        Meant for suites that hit many (generally async) views, where each request is independent.
+        User login and url handling for each request are done up front. All requests are then sent concurrently,
+        with at most `concurrency` requests in progress at once. Each response is then verified in turn.
+
+        Rather than failing on the first mismatch, all mismatches are collected and reported at once.
+
+        :param requests: List of requests to send. Each request is either a url, or a dict with a "url" key.
+                         Dicts also accept the same request and assertion args as assertAsyncResponse().
+        :param concurrency: Max number of requests to have in progress at once.
+        :return: List of Django response objects, in the same order as provided requests.
+        """
+        responses = []
+        mismatches = []
+        for response, assertion_kwargs in self._get_async_page_responses(requests, concurrency=concurrency):
+            responses.append(response)
+            try:
+                self._assertResponse__verify(response, **assertion_kwargs)
+            except AssertionError as err:
+                mismatches.append((response, str(err).strip()))
+
+        # Report all mismatches at once.
+        if mismatches:
+            self.fail(
+                'Batch responses had {0} mismatch(es), out of {1} checked responses:\n{2}'.format(
+                    len(mismatches),
+                    len(responses),
+                    '\n'.join(
+                        '  Url "{0}" with user "{1}":\n{2}'.format(
+                            response.url_data.computed.initial_url,
+                            'anonymous' if response.user.is_anonymous else response.user,
+                            textwrap.indent(message, '    '),
+                        )
+                        for response, message in mismatches
+                    ),
+                )
+            )
+
+        # All assertions passed. Return responses in case user wants to do further checks.
+        return responses
+
     def assertRedirects(
         self,
         response,
@@ -876,6 +2096,15 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         However, this acts as a wrapper to also:
             * Check that provided response param is a valid Response object. Attempts to generate one if not.
             * Attempt url as reverse, before trying assertion.
+
+        If the response followed the full redirect chain (follow=True, the default), then the response is already the
+        redirect target. In that case, the target status code is verified from the response itself, without
+        re-fetching the target.
+
+        If redirects were not followed (follow=False, or follow="auto" stopping after the first hop), then the
+        response is the initial redirect response. In that case, the target is only fetched and checked if
+        fetch_redirect_response is True (the Django default). assertResponse() passes False, so that only the
+        redirect itself is checked.
         """
         # Handle mutable data defaults.
         redirect_args = redirect_args or []
@@ -949,8 +2178,121 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
             ),
         )
 
-        # Return status in case user wants to run additional logic on it.
-        return actual_status
+        # Return status in case user wants to run additional logic on it.
+        return actual_status
+
+    def assertQueryBudget(self, response, expected_max_queries=None, expected_max_db_time_ms=None):
+        """Assert that the database queries run by a response's view request are within the provided limits.
+
+        Only the view request itself is checked. Queries from ETC user setup and debug output are excluded.
+
+        :param response: Response object to check against. Must have been generated with recorded queries.
+        :param expected_max_queries: Max number of queries allowed. Skips check if None.
+        :param expected_max_db_time_ms: Max total query duration (in milliseconds) allowed. Skips check if None.
+        :return: The list of recorded queries, in case tests need to run additional logic on them.
+        """
+        queries = getattr(response, 'etc_queries', None)
+        if queries is None:
+            raise ValueError(
+                'Response does not have recorded queries. '
+                'Generate response via assertResponse() with expected_max_queries or expected_max_db_time_ms.'
+            )
+
+        db_time = sum(query.duration for query in queries)
+        errors = []
+        if expected_max_queries is not None and len(queries) > expected_max_queries:
+            errors.append(
+                'Expected at most {0} database queries. View request ran {1} queries.'.format(
+                    expected_max_queries,
+                    len(queries),
+                )
+            )
+        if expected_max_db_time_ms is not None and db_time > expected_max_db_time_ms:
+            errors.append(
+                'Expected at most {0:.2f} ms of database queries. View request queries took {1:.2f} ms.'.format(
+                    expected_max_db_time_ms,
+                    db_time,
+                )
+            )
+
+        if errors:
+            self.fail(
+                '{0}\n\nQueries run by view request ({1} queries, {2:.2f} ms):\n{3}'.format(
+                    '\n'.join(errors),
+                    len(queries),
+                    db_time,
+                    format_query_report(queries),
+                )
+            )
+
+        return queries
+
+    def assertNoNPlusOneQueries(self, response, threshold=None):
+        """Assert that a response's view request did not run any "N+1" queries.
+
+        Aka, the same query (ignoring literal/param values) was not run more than the threshold number of times.
+        Only the view request itself is checked. Queries from ETC user setup and debug output are excluded.
+        If redirects were followed, then each request in the chain is checked separately. Otherwise queries that
+        run once per request (such as session and user lookups) would be flagged on longer chains.
+
+        :param response: Response object to check against. Must have been generated with recorded queries.
+        :param threshold: Max times the same query can run. Falls back to N_PLUS_ONE_THRESHOLD setting if None.
+        :return: The list of recorded queries, in case tests need to run additional logic on them.
+        """
+        queries = getattr(response, 'etc_queries', None)
+        if queries is None:
+            raise ValueError(
+                'Response does not have recorded queries. '
+                'Generate response via assertResponse() with assert_no_n_plus_one.'
+            )
+        if threshold is None:
+            threshold = ETC_N_PLUS_ONE_THRESHOLD
+
+        repeated_queries = [
+            query
+            for query_group in group_queries(queries, per_request=True).values()
+            if len(query_group) > threshold
+            for query in query_group
+        ]
+        if repeated_queries:
+            self.fail(
+                (
+                    'Found likely N+1 queries in view request. '
+                    'Expected each query to run at most {0} times per request, ignoring literal values.\n\n'
+                    'Repeated queries:\n{1}'
+                ).format(
+                    threshold,
+                    format_query_report(repeated_queries),
+                )
+            )
+
+        return queries
+
+    def assertResponseBudget(self, response, expected_max_duration_ms=None, expected_max_content_bytes=None):
+        """Assert that a response's view request duration and content size are within the provided limits.
+
+        :param response: Response object to check against.
+        :param expected_max_duration_ms: Max duration (in milliseconds) of the view request. Skips check if None.
+        :param expected_max_content_bytes: Max size (in bytes) of the response content. Skips check if None.
+        """
+        errors = []
+        if expected_max_duration_ms is not None and response.etc_timings.request > expected_max_duration_ms:
+            errors.append(
+                'Expected view request to take at most {0:.2f} ms. View request took {1:.2f} ms.'.format(
+                    expected_max_duration_ms,
+                    response.etc_timings.request,
+                )
+            )
+        if expected_max_content_bytes is not None and len(response.content) > expected_max_content_bytes:
+            errors.append(
+                'Expected response content to be at most {0} bytes. Response content was {1} bytes.'.format(
+                    expected_max_content_bytes,
+                    len(response.content),
+                )
+            )
+
+        if errors:
+            self.fail('\n'.join(errors))
 
     def assertPageTitle(self, response, expected_title, allow_partials=None):
         """Verifies the page title HTML element.
@@ -1662,6 +3004,296 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
 
     # region Helper Functions
 
+    def _reset_client_state(self):
+        """Resets client "user login" state, for new response generation.
+
+        Has the same end result as client.logout(), of the client having no user or session.
+        But client.logout() also loads the session and user, sends the logout signal, and flushes the session store.
+        None of that is needed when the client has no cookies, so that case is skipped entirely.
+        Otherwise, the cookie jar is simply replaced. The now-unreferenced session is rolled back with other test data.
+        """
+        if self.client.cookies:
+            self.client.cookies = SimpleCookie()
+
+    def benchmarkResponse(
+        self,
+        url,
+        *args,
+        get=True,
+        data=None,
+        secure=True,
+        headers=None,
+        url_args=None,
+        url_kwargs=None,
+        url_query_params=None,
+        auto_login=True,
+        user=None,
+        user_permissions=None,
+        user_groups=None,
+        extra_usergen_kwargs=None,
+        iterations=200,
+        warmup=20,
+        output_file=None,
+        **kwargs,
+    ):
+        """Benchmarks the view at given URL, by requesting it repeatedly.
+
+        User login and url standardization are only handled once. Afterwards, only the client request is repeated.
+        Query count, content size, and memory allocations are measured in separate requests from the timed ones,
+        so that recording them doesn't skew timings.
+
+        Note that POST requests are also repeated, including any side effects they have.
+
+        :param url: Url to get response object from.
+        :param get: Bool indicating if response is GET or POST. Defaults to GET.
+        :param data: Optional dict of items to pass into response generation.
+        :param secure: Bool indicating if request should be retrieved as HTTP or HTTPS.
+        :param headers: Additional test client headers, if any.
+        :param url_args: Values to provide for URL population, in "arg" format.
+        :param url_kwargs: Values to provide for URL population, in "kwarg" format.
+        :param url_query_params: Query parameter values to provide for URL population.
+        :param auto_login: Bool indicating if user should be auto-logged-in.
+        :param user: User to log in with, if auto_login is True. Defaults to `test_user`.
+        :param user_permissions: Optional permissions to provide to login user.
+        :param user_groups: Optional groups to provide to login user.
+        :param extra_usergen_kwargs: Optional dictionary of values to pass to _get_login_user__extra_user_auth_setup().
+        :param iterations: Number of timed requests.
+        :param warmup: Number of untimed requests to run first, such as to populate caches.
+        :param output_file: File to append results to, as a single line of JSON.
+                            Falls back to BENCHMARK_OUTPUT_FILE setting if None.
+        :return: Dict of benchmark results.
+        """
+        if iterations < 1:
+            raise ValueError('Benchmark iterations must be at least 1.')
+
+        if self._reset_client_state_on_request:
+            # Reset client "user login" state for new response generation.
+            self._reset_client_state()
+
+        # Handle user login and url sanitization, then run first request.
+        # First request also records queries, so it acts as an additional untimed warmup.
+        user = self._get_default_request_user(user, auto_login)
+        response = self._get_page_response(
+            url,
+            *args,
+            get=get,
+            data=data,
+            secure=secure,
+            headers=headers,
+            url_args=url_args,
+            url_kwargs=url_kwargs,
+            query_params=url_query_params,
+            auto_login=auto_login,
+            user=user,
+            user_permissions=user_permissions,
+            user_groups=user_groups,
+            extra_usergen_kwargs=extra_usergen_kwargs,
+            record_queries=True,
+            **kwargs,
+        )
+        url = response.url_data.computed.initial_url
+
+        # Run untimed warmup requests.
+        for index in range(warmup):
+            self._sample_request(url, get=get, data=data, secure=secure, headers=headers)
+
+        # Run timed requests.
+        durations = sorted(
+            self._sample_request(url, get=get, data=data, secure=secure, headers=headers)[1]
+            for index in range(iterations)
+        )
+
+        # Run one more request to measure memory allocations.
+        is_tracing = tracemalloc.is_tracing()
+        # Peak value can only be reset on Python 3.9+. Before that, an existing trace may hold an unrelated peak.
+        can_measure_memory = not is_tracing or hasattr(tracemalloc, 'reset_peak')
+        if is_tracing and can_measure_memory:
+            # Already tracing, such as from the "-X tracemalloc" Python option. Only reset the peak value.
+            tracemalloc.reset_peak()
+        elif not is_tracing:
+            tracemalloc.start()
+        initial_memory = tracemalloc.get_traced_memory()[0]
+        self._sample_request(url, get=get, data=data, secure=secure, headers=headers)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        if not is_tracing:
+            tracemalloc.stop()
+
+        def percentile(value):
+            """Returns the given percentile of durations, using the nearest-rank method."""
+            return durations[max(math.ceil(len(durations) * value / 100), 1) - 1]
+
+        results = {
+            'test_id': self.id(),
+            'url': url,
+            'method': 'GET' if bool(get) else 'POST',
+            'user': 'anonymous' if response.user.is_anonymous else response.user.get_username(),
+            'iterations': iterations,
+            'warmup': warmup,
+            'duration_ms': {
+                'min': durations[0],
+                'p50': percentile(50),
+                'p95': percentile(95),
+                'p99': percentile(99),
+                'max': durations[-1],
+                'mean': statistics.mean(durations),
+            },
+            'queries': len(response.etc_queries),
+            'db_time_ms': sum(query.duration for query in response.etc_queries),
+            'content_bytes': len(response.content),
+            'peak_allocated_bytes': peak_memory - initial_memory if can_measure_memory else None,
+        }
+
+        # Save results to file, if requested.
+        output_file = output_file or ETC_BENCHMARK_OUTPUT_FILE
+        if output_file:
+            with open(output_file, 'a') as benchmark_file:
+                benchmark_file.write('{0}\n'.format(json.dumps(results, sort_keys=True)))
+
+        return results
+
+    def _sample_request(self, url, get=True, data=None, secure=True, headers=None):
+        """Runs a single client request for an already standardized url, and times it.
+
+        Unlike _get_page_response(), does no user or url handling. So it's cheap to call repeatedly.
+
+        :param url: Standardized url to request, such as `response.url_data.computed.initial_url`.
+        :param get: Bool indicating if response is GET or POST. Defaults to GET.
+        :param data: Optional dict of items to pass into response generation.
+        :param secure: Bool indicating if request should be retrieved as HTTP or HTTPS.
+        :param headers: Additional test client headers, if any.
+        :return: Tuple of (response, request duration in milliseconds).
+        """
+        data = data or {}
+        headers = headers or {}
+
+        start_time = time.perf_counter()
+        if bool(get):
+            response = self.client.get(url, data=data, secure=secure, follow=True, headers=headers)
+        else:
+            response = self.client.post(url, data=data, secure=secure, follow=True, headers=headers)
+
+        return response, (time.perf_counter() - start_time) * 1000
+
+    def _check_performance_baseline(self, response, get=True, data=None, secure=True, headers=None):
+        """Compares response performance to the PERFORMANCE_BASELINE_FILE values, or records new values to it.
+
+        Values are keyed by the response initial url, then by request user role or identifier.
+        GET requests are sampled PERFORMANCE_BASELINE_SAMPLES additional times, and the median duration is used.
+        POST requests are not sampled again, to avoid repeating any side effects.
+
+        :param response: Response object to check. Must have been generated with recorded queries.
+        :param get: Bool indicating if response is GET or POST. Defaults to GET.
+        :param data: Optional dict of items that were passed into response generation.
+        :param secure: Bool indicating if request was retrieved as HTTP or HTTPS.
+        :param headers: Additional test client headers, if any.
+        :return: Dict of measured performance values.
+        """
+        if not ETC_PERFORMANCE_BASELINE_FILE:
+            raise ValueError(
+                'Performance baseline check was requested, '
+                'but no DJANGO_EXPANDED_TESTCASES_PERFORMANCE_BASELINE_FILE setting is defined.'
+            )
+
+        url = response.url_data.computed.initial_url
+        user = _get_performance_baseline_user_key(response.user)
+
+        # Get median request duration.
+        # The initial request is excluded for GET requests, as it also recorded queries, and acts as a warm up.
+        if bool(get):
+            durations = [
+                self._sample_request(url, get=get, data=data, secure=secure, headers=headers)[1]
+                for index in range(max(ETC_PERFORMANCE_BASELINE_SAMPLES, 1))
+            ]
+        else:
+            durations = [response.etc_timings.request]
+        values = {
+            'duration_ms': round(statistics.median(durations), 3),
+            'queries': len(response.etc_queries),
+            'content_bytes': len(response.content),
+        }
+        response.etc_performance = values
+
+        # Handle if recording new baseline.
+        baseline = _get_performance_baseline()
+        if ETC_PERFORMANCE_BASELINE_MODE == 'record':
+            baseline.setdefault(url, {})[user] = values
+            _recorded_performance_baseline.setdefault(url, {})[user] = values
+            return values
+
+        # Handle if comparing to existing baseline.
+        expected_values = baseline.get(url, {}).get(user, None)
+        if expected_values is None:
+            # No baseline recorded yet. Nothing to compare to.
+            return values
+
+        tolerance = 1 + ETC_PERFORMANCE_BASELINE_TOLERANCE
+        errors = []
+        if values['duration_ms'] > expected_values['duration_ms'] * tolerance:
+            errors.append(
+                'Median duration of {0:.2f} ms exceeds baseline of {1:.2f} ms.'.format(
+                    values['duration_ms'],
+                    expected_values['duration_ms'],
+                )
+            )
+        if values['queries'] > expected_values['queries']:
+            errors.append(
+                'Query count of {0} exceeds baseline of {1}.'.format(
+                    values['queries'],
+                    expected_values['queries'],
+                )
+            )
+        if values['content_bytes'] > expected_values['content_bytes'] * tolerance:
+            errors.append(
+                'Content size of {0} bytes exceeds baseline of {1} bytes.'.format(
+                    values['content_bytes'],
+                    expected_values['content_bytes'],
+                )
+            )
+
+        if errors:
+            err_msg = 'Response performance regressed from baseline, for url "{0}" with user "{1}":\n    {2}'.format(
+                url,
+                user,
+                '\n    '.join(errors),
+            )
+            if ETC_PERFORMANCE_BASELINE_MODE == 'warn':
+                warnings.warn(err_msg)
+            else:
+                self.fail(err_msg)
+
+        return values
+
+    def _record_response_timings(self, timings):
+        """Saves provided response timings, for per-test, per-class, and (optionally) per-run aggregation.
+
+        :param timings: ResponseTimings instance to save.
+        """
+        self._response_timings.append(timings)
+        type(self)._class_response_timings.append(timings)
+        if ETC_RESPONSE_TIMINGS_REPORT:
+            _recorded_response_timings.append(timings)
+
+        # Response is fully processed. Stop recording further content normalization.
+        self._active_response_timings = None
+
+    def get_response_timings(self, scope='test'):
+        """Returns summed per-phase timings of all assertResponse() calls within given scope.
+
+        :param scope: One of "test" (current test), "class" (all tests so far in current test class),
+            or "run" (all tests so far in test run, only recorded if RESPONSE_TIMINGS_REPORT setting is enabled).
+        :return: Dict of summed phase durations (in milliseconds), plus a "count" of summed responses.
+        """
+        if scope == 'test':
+            timings_list = self._response_timings
+        elif scope == 'class':
+            timings_list = type(self)._class_response_timings
+        elif scope == 'run':
+            timings_list = _recorded_response_timings
+        else:
+            raise ValueError('Invalid scope arg. Must be one of: ["test", "class", "run"].')
+
+        return summarize_response_timings(timings_list)
+
     def _get_default_request_user(self, user, auto_login):
         """
         # We first prioritize a direct value passed into this function (if not the default).
@@ -1711,6 +3343,91 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         # Return calculated user.
         return user
 
+    @contextmanager
+    def _client_context_capture(self, context_capture):
+        """Temporarily sets the template context capture mode of the test client.
+
+        :param context_capture: One of "full", "minimal", or "none".
+        """
+        orig_context_capture = self.client.context_capture
+        self.client.context_capture = context_capture
+        try:
+            yield
+        finally:
+            self.client.context_capture = orig_context_capture
+
+    def _get_response_follow(
+        self,
+        follow=None,
+        return_format='html',
+        expected_status=None,
+        expected_redirect_url=None,
+        expected_final_url=None,
+        view_should_redirect=None,
+        expected_title=None,
+        expected_header=None,
+        expected_messages=None,
+        expected_not_messages=None,
+        expected_content=None,
+        expected_not_content=None,
+        expected_json=None,
+        expected_max_queries=None,
+        expected_max_db_time_ms=None,
+        assert_no_n_plus_one=None,
+        expected_max_duration_ms=None,
+        expected_max_content_bytes=None,
+        check_performance_baseline=False,
+        **kwargs,
+    ):
+        """Determines if view redirects should be followed, for provided assertResponse() args.
+
+        Any other assertResponse() args are accepted, but ignored.
+
+        :param follow: One of True, False, or "auto". Falls back to FOLLOW_REDIRECTS setting if None.
+        :return: Tuple of (follow, follow_is_auto). Where follow is a bool.
+        """
+        if follow is None:
+            # No value provided. Fall back to settings value.
+            follow = ETC_FOLLOW_REDIRECTS
+        follow = _get_follow_value(follow)
+        if follow != 'auto':
+            return follow, False
+
+        if assert_no_n_plus_one is None:
+            # No value provided for this assertion. Fall back to settings value.
+            assert_no_n_plus_one = ETC_ASSERT_NO_N_PLUS_ONE
+
+        # Only follow the full redirect chain if some assertion needs the final page.
+        # Otherwise, stop after the first hop if the view is only expected to redirect.
+        # An explicitly provided expected_status is for the final page, so also needs the full chain.
+        expects_redirect = expected_redirect_url is not None or (
+            view_should_redirect if view_should_redirect is not None else ETC_VIEWS_SHOULD_REDIRECT
+        )
+        needs_final_response = (
+            return_format == 'json'
+            or expected_status is not None
+            or assert_no_n_plus_one
+            or check_performance_baseline
+            or any(
+                value is not None
+                for value in (
+                    expected_final_url,
+                    expected_title,
+                    expected_header,
+                    expected_messages,
+                    expected_not_messages,
+                    expected_content,
+                    expected_not_content,
+                    expected_json,
+                    expected_max_queries,
+                    expected_max_db_time_ms,
+                    expected_max_duration_ms,
+                    expected_max_content_bytes,
+                )
+            )
+        )
+        return not expects_redirect or needs_final_response, True
+
     def _get_page_response(
         self,
         url,
@@ -1727,6 +3444,10 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         user_permissions=None,
         user_groups=None,
         extra_usergen_kwargs=None,
+        record_queries=False,
+        follow=True,
+        max_redirects=None,
+        context_capture=None,
         **kwargs,
     ):
         """Helper function for assertResponse().
@@ -1744,6 +3465,13 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         :param user_permissions: Set of Django Permissions to give to test user before accessing page.
         :param user_groups: Set of Django PermissionGroups to give to test user before accessing page.
         :param extra_usergen_kwargs: Optional dictionary of values to pass to _get_login_user__extra_user_auth_setup().
+        :param record_queries: Bool indicating if database queries run by the request should be recorded.
+                               If so, then they're saved to the response, as `response.etc_queries`.
+        :param follow: Bool indicating if redirects should be followed. If not, then `response.redirect_chain` is
+                       not set, and the response is the initial view response.
+        :param max_redirects: Max number of redirects to follow. Falls back to MAX_REDIRECTS setting if None.
+        :param context_capture: How much template context the IntegrationClient should capture for the request.
+                                One of "full", "minimal", or "none". If None, then the client is left as-is.
         :return: Django response object for provided url.
         """
 
@@ -1769,6 +3497,12 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         if not isinstance(data, dict):
             raise TypeError('Provided "data" arg must be a dict, for passing into POST requests.')
 
+        # Start recording response timings.
+        # Also saved to class, so that any content normalization during assertions is recorded.
+        timings = ResponseTimings()
+        self._active_response_timings = timings
+        start_time = time.perf_counter()
+
         # Handle getting user.
         user = self._get_default_request_user(user, auto_login)
         user = self._get_login_user(
@@ -1779,8 +3513,10 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
             user_groups=user_groups,
             **extra_usergen_kwargs,
         )
+        timings.add_time('user_setup', start_time)
 
         # Handle url sanitization.
+        phase_start_time = time.perf_counter()
         url = self.standardize_url(
             url,
             url_args=url_args,
@@ -1792,15 +3528,269 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         full_url = '{0}{1}'.format(self.site_root_url, url)
         if ETC_INCLUDE_RESPONSE_DEBUG_URL:
             self.show_debug_url(full_url)
+        timings.add_time('url_handling', phase_start_time)
+
+        # Validate redirect limit before sending any request.
+        max_redirects = _get_max_redirects(max_redirects)
 
         # Get response object.
-        if bool(get):
-            response = self.client.get(url, data=data, secure=secure, follow=True, headers=headers)
-        else:
-            response = self.client.post(url, data=data, secure=secure, follow=True, headers=headers)
+        # If requested, only the request itself has queries recorded. Not any ETC setup or debug queries.
+        phase_start_time = time.perf_counter()
+        query_recorder = QueryRecorder()
+        with ExitStack() as stack:
+            if record_queries:
+                stack.enter_context(query_recorder.record())
+            if context_capture is not None and isinstance(self.client, IntegrationClient):
+                stack.enter_context(self._client_context_capture(context_capture))
+
+            if bool(get):
+                response = self.client.get(url, data=data, secure=secure, follow=follow, headers=headers)
+            else:
+                response = self.client.post(url, data=data, secure=secure, follow=follow, headers=headers)
+            if follow:
+                _check_redirect_limit(response, max_redirects)
+        timings.add_time('request', phase_start_time)
 
         # Update response object with additional useful values for further testing/analysis.
+        self._set_response_url_data(response, response_url_data, url, full_url)
+        # Save user data to response.
+        response.user = user
+        # Save recorded queries to response, if any.
+        response.etc_queries = query_recorder.queries if record_queries else None
+        # Save response timings to response.
+        timings.url = url
+        timings.test_id = self.id()
+        timings.test_class = type(self).__name__
+        timings.total = (time.perf_counter() - start_time) * 1000
+        response.etc_timings = timings
+
+        # Return generated response.
+        return response
+
+    def _get_async_page_responses(self, requests, concurrency=10):
+        """Helper function for assertAsyncResponse() and assertResponses().
+
+        Handles user login and url standardization for each request, then sends all requests concurrently through
+        Django's AsyncClient.
+
+        User login and url handling are not async-safe, so they're done up front, one request at a time.
+        Each request then gets its own AsyncClient, holding a copy of the resulting session cookies.
+
+        :param requests: List of requests to send. Each request is either a url, or a dict with a "url" key.
+        :param concurrency: Max number of requests to have in progress at once.
+        :return: List of (response, assertion_kwargs) pairs, in the same order as provided requests.
+        """
+        if int(concurrency) < 1:
+            raise ValueError('Provided "concurrency" arg must be at least 1.')
+
+        prepared_requests = []
+        for request_kwargs in requests:
+            if isinstance(request_kwargs, str):
+                request_kwargs = {'url': request_kwargs}
+            prepared_requests.append(self._prepare_async_request(**request_kwargs))
+
+        async def send_requests():
+            # Created within the event loop, as older Python versions bind semaphores to the loop on creation.
+            semaphore = asyncio.Semaphore(int(concurrency))
+
+            async def send_request(prepared_request):
+                async with semaphore:
+                    phase_start_time = time.perf_counter()
+                    async_client = prepared_request['client']
+                    request_method = async_client.get if prepared_request['get'] else async_client.post
+                    follow = prepared_request['follow']
+                    follow_kwargs = {'follow': True} if follow and django.VERSION >= (5, 0) else {}
+                    response = await request_method(
+                        prepared_request['url'],
+                        data=prepared_request['data'],
+                        secure=prepared_request['secure'],
+                        **follow_kwargs,
+                        **_get_asgi_header_extra(prepared_request['headers']),
+                    )
+                    if follow:
+                        if not follow_kwargs:
+                            response = await _async_follow_redirects(
+                                async_client,
+                                response,
+                                data=prepared_request['data'],
+                                secure=prepared_request['secure'],
+                                headers=prepared_request['headers'],
+                            )
+                        _check_redirect_limit(response, prepared_request['max_redirects'])
+                    prepared_request['timings'].add_time('request', phase_start_time)
+                    return response
+
+            return await asyncio.gather(*(send_request(prepared_request) for prepared_request in prepared_requests))
+
+        responses = async_to_sync(send_requests)()
+
+        # Update response objects with the same additional values as _get_page_response().
+        results = []
+        for prepared_request, response in zip(prepared_requests, responses):
+            timings = prepared_request['timings']
+            self._set_response_url_data(
+                response,
+                prepared_request['url_data'],
+                prepared_request['url'],
+                prepared_request['full_url'],
+            )
+            response.user = prepared_request['user']
+            response.etc_queries = None
+            timings.url = prepared_request['url']
+            timings.test_id = self.id()
+            timings.test_class = type(self).__name__
+            response.etc_timings = timings
+            results.append((response, prepared_request['assertion_kwargs']))
+
+        if self._reset_client_state_on_request:
+            # Leave client in a logged-out state.
+            self._reset_client_state()
+
+        return results
+
+    def _prepare_async_request(
+        self,
+        url,
+        get=True,
+        data=None,
+        secure=True,
+        headers=None,
+        url_args=None,
+        url_kwargs=None,
+        url_query_params=None,
+        auto_login=True,
+        user=None,
+        user_permissions=None,
+        user_groups=None,
+        extra_usergen_kwargs=None,
+        return_format='html',
+        follow=None,
+        max_redirects=None,
+        **assertion_kwargs,
+    ):
+        """Helper function for _get_async_page_responses().
+
+        Handles user login and url standardization for a single request, so that it can be sent asynchronously.
+
+        :return: Dict of prepared request values.
+        """
+        # Handle mutable data defaults.
+        data = data or {}
+        headers = headers or {}
+        url_args = url_args or []
+        url_kwargs = url_kwargs or {}
+        url_query_params = url_query_params or {}
+        extra_usergen_kwargs = extra_usergen_kwargs or {}
+
+        # Validate data types.
+        if not isinstance(data, dict):
+            raise TypeError('Provided "data" arg must be a dict.')
+        max_redirects_value = _get_max_redirects(max_redirects)
+
+        # Queries of concurrent requests can't be attributed to a single response, so are never recorded.
+        for query_arg in (
+            'expected_max_queries',
+            'expected_max_db_time_ms',
+            'assert_no_n_plus_one',
+            'check_performance_baseline',
+        ):
+            if assertion_kwargs.get(query_arg, None):
+                raise ValueError(
+                    'The {0} arg is not supported for AsyncClient requests. Use assertResponse() instead.'.format(
+                        query_arg,
+                    )
+                )
+        # Also skip the ASSERT_NO_N_PLUS_ONE setting fallback.
+        assertion_kwargs['assert_no_n_plus_one'] = False
+
+        # Sanitize required values.
+        return_format = _get_return_format(return_format)
+        follow, follow_is_auto = self._get_response_follow(follow, return_format=return_format, **assertion_kwargs)
+
+        # Save provided values for user post-test debugging.
+        response_url_data = ResponseUrlData(url, url_args, url_kwargs, url_query_params)
+
+        # Handle getting user.
+        # Client starts from an empty cookie jar, so that each login creates a separate session.
+        # If wanting to retain session across requests, then `self._reset_client_state_on_request` should be set to
+        # False first. Each request then starts from a copy of the current client session cookies instead.
+        timings = ResponseTimings()
+        start_time = time.perf_counter()
+        if self._reset_client_state_on_request:
+            self._reset_client_state()
+        user = self._get_default_request_user(user, auto_login)
+        login_user = self._get_login_user(
+            user,
+            auto_login=auto_login,
+            user_permissions=user_permissions,
+            user_groups=user_groups,
+            **extra_usergen_kwargs,
+        )
+        async_client = self.async_client_class()
+        async_client.cookies = SimpleCookie(self.client.cookies)
+        timings.add_time('user_setup', start_time)
+
+        # Handle url sanitization.
+        phase_start_time = time.perf_counter()
+        url = self.standardize_url(
+            url,
+            url_args=url_args,
+            url_kwargs=url_kwargs,
+            url_query_params=url_query_params,
+            append_root=False,
+            display_warning=True,
+        )
+        full_url = '{0}{1}'.format(self.site_root_url, url)
+        if ETC_INCLUDE_RESPONSE_DEBUG_URL:
+            self.show_debug_url(full_url)
+        timings.add_time('url_handling', phase_start_time)
+
+        return {
+            'client': async_client,
+            'url': url,
+            'full_url': full_url,
+            'url_data': response_url_data,
+            'get': bool(get),
+            'data': data,
+            'secure': secure,
+            'headers': headers,
+            'user': login_user,
+            'follow': follow,
+            'max_redirects': max_redirects_value,
+            'timings': timings,
+            # Values for _assertResponse__verify(), once the response is retrieved.
+            'assertion_kwargs': {
+                'url': response_url_data.provided.url,
+                'get': get,
+                'data': data,
+                'secure': secure,
+                'headers': headers,
+                'url_args': url_args,
+                'url_kwargs': url_kwargs,
+                'url_query_params': url_query_params,
+                'auto_login': auto_login,
+                'user': user,
+                'user_permissions': user_permissions,
+                'user_groups': user_groups,
+                'extra_usergen_kwargs': extra_usergen_kwargs,
+                'return_format': return_format,
+                'follow': follow,
+                'follow_is_auto': follow_is_auto,
+                'max_redirects': max_redirects,
+                **assertion_kwargs,
+            },
+        }
+
+    def _set_response_url_data(self, response, response_url_data, url, full_url):
+        """Helper function for _get_page_response().
+
+        Computes final url data from the provided response, and saves it to the response as `response.url_data`.
 
+        :param response: Django response object to update.
+        :param response_url_data: ResponseUrlData object, holding the originally provided url values.
+        :param url: The fully standardized url that the request was sent to.
+        :param full_url: The same as above, but with the project site root prepended.
+        """
         # The fully computed url after standardizing with provided args/kwargs/query params.
         # But before actually attempting to get response and process in any way.
         response_url_data.computed.initial_url = url
@@ -1808,10 +3798,16 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
         response_url_data.computed.full_initial_url = full_url
 
         # If redirects occurred, then the final url at the end of the redirect chain.
+        # If redirects were not followed, then the url the response redirects to.
         redirect_url = None
-        if hasattr(response, 'redirect_chain') and len(response.redirect_chain) > 0:
-            redirect_data = response.redirect_chain[-1]
-            if redirect_data[1] == 302 and redirect_data[0] != response_url_data.computed.initial_url:
+        if hasattr(response, 'redirect_chain'):
+            redirect_data = response.redirect_chain[-1] if len(response.redirect_chain) > 0 else None
+        else:
+            redirect_data = (
+                (response.url, response.status_code) if response.status_code in _REDIRECT_STATUS_CODES else None
+            )
+        if redirect_data is not None and redirect_data[1] in _REDIRECT_STATUS_CODES:
+            if redirect_data[0] != response_url_data.computed.initial_url:
                 redirect_url = redirect_data[0]
                 response_url_data.computed.redirect_url = redirect_url
                 response_url_data.computed.full_redirect_url = '{0}{1}'.format(self.site_root_url, redirect_url)
@@ -1828,11 +3824,6 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
 
         # Save calculated set of url data to response.
         response.url_data = response_url_data
-        # Save user data to response.
-        response.user = user
-
-        # Return generated response.
-        return response
 
     def _get_login_user(self, user, *args, auto_login=True, user_permissions=None, user_groups=None, **kwargs):
         """Handles simulating user login with corresponding permissions/groups/etc.
@@ -1875,8 +3866,8 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
             raise TypeError('Provided Django Permissions must be either a str, array, or model format.')
 
         # Add all Permissions to provided user.
-        for permission in user_permissions:
-            user = self.add_user_permission(permission, user=user)
+        if user_permissions:
+            user = self.add_user_permissions(user_permissions, user=user)
 
         # Handle possible types for Groups.
         if isinstance(user_groups, list) or isinstance(user_groups, tuple):
@@ -1890,8 +3881,8 @@ class IntegrationTestCase(BaseTestCase, ResponseTestCaseMixin):
             raise TypeError('Provided Django Groups must be either a str, array, or model format.')
 
         # Add all Groups to provided user.
-        for group in user_groups:
-            user = self.add_user_group(group, user=user)
+        if user_groups:
+            user = self.add_user_groups(user_groups, user=user)
 
         # Optional hook to run additional authentication logic/setup on User.
         # For example, if project has 2-Factor setup that needs to be run.
@@ -0,0 +1,45 @@
+"""
+Test runner for Django Expanded Test Cases project.
+"""
+
+# Third-Party Imports.
+from django.contrib.auth import get_user_model
+from django.db import router
+from django.db.models.signals import post_migrate
+from django.test.runner import DiscoverRunner
+
+# Internal Imports.
+from django_expanded_test_cases.constants import ETC_AUTO_GENERATE_USERS
+from django_expanded_test_cases.mixins.core_mixin import _clear_precreated_default_users, _precreate_default_users
+
+
+class ExpandedTestRunner(DiscoverRunner):
+    """Test runner that creates the ETC default test users once, as part of test database setup.
+
+    Users are created directly after migrations run, which is before the database is cloned for parallel workers.
+    Test cases then reuse these existing users, instead of creating them for every test or class.
+
+    To use, set in project settings:
+        TEST_RUNNER = 'django_expanded_test_cases.test_runner.ExpandedTestRunner'
+    """
+
+    def setup_databases(self, **kwargs):
+        """Sets up test databases, creating default users in the user database after it's migrated."""
+        if not ETC_AUTO_GENERATE_USERS:
+            return super().setup_databases(**kwargs)
+
+        def precreate_default_users(sender, using, **signal_kwargs):
+            # Migrate sends once per app. Only handle the one that provides the user tables.
+            if sender.label == 'auth' and using == router.db_for_write(get_user_model()):
+                _precreate_default_users(using=using)
+
+        post_migrate.connect(precreate_default_users, dispatch_uid='etc_precreate_default_users')
+        try:
+            return super().setup_databases(**kwargs)
+        finally:
+            post_migrate.disconnect(dispatch_uid='etc_precreate_default_users')
+
+    def teardown_databases(self, old_config, **kwargs):
+        """Tears down test databases, forgetting any pre-created default users."""
+        super().teardown_databases(old_config, **kwargs)
+        _clear_precreated_default_users()
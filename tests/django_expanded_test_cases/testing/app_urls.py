@@ -22,6 +22,7 @@ urlpatterns = [
     path('views/three-messages/', views.view_with_three_messages, name='response-with-three-messages'),
     path('views/repeating-elements/', views.view_with_repeating_elements, name='response-with-repeating-elements'),
     path('views/<int:id>/<str:name>/', views.view_with_args, name='response-with-args'),
+    path('views/error/', views.view_that_raises_error, name='response-with-error'),
     # Template response views.
     path('template-response/home/', views.template_response_home, name='template-response-home'),
     path(
@@ -37,13 +38,23 @@ urlpatterns = [
     # Json response views.
     path('json/basic-dict/', views.json_response_basic_dict, name='json-response-basic-dict'),
     path('json/basic-list/', views.json_response_basic_list, name='json-response-basic-list'),
+    path('json/request-host/', views.json_response_request_host, name='json-response-request-host'),
+    path('json/request-data/', views.json_response_request_data, name='json-response-request-data'),
     # Model test views.
     path('user/detail/<int:pk>/', views.user_detail, name='user-detail'),
+    path('user/list/', views.user_list, name='user-list'),
+    path('user/async-detail/<int:pk>/', views.async_user_detail, name='async-user-detail'),
+    # Auth test views.
+    path('auth/staff-only/', views.staff_only, name='staff-only'),
     # Redirect views.
     path('redirect/index/', views.redirect_to_index, name='redirect-to-index'),
     path('redirect/one-message/', views.redirect_to_one_message, name='redirect-to-one-message'),
     path('redirect/basic-form/', views.redirect_to_basic_form, name='redirect-to-basic-form'),
     path('redirect/with_args/<int:id>/<str:name>/', views.redirect_with_args, name='redirect-with-args'),
+    path('redirect/status/<int:status>/', views.redirect_with_status, name='redirect-with-status'),
+    path('redirect/request-data/<int:status>/', views.redirect_to_request_data, name='redirect-to-request-data'),
+    path('redirect/absolute-url/', views.redirect_to_absolute_url, name='redirect-to-absolute-url'),
+    path('redirect/chain/<int:count>/', views.redirect_chain, name='redirect-chain'),
     # Form views.
     path('forms/basic-form/', views.view_with_basic_form, name='response-with-basic-form'),
     path('forms/basic-formset/', views.view_with_basic_formset, name='response-with-basic-formset'),
@@ -97,6 +97,12 @@ else:
     # So we want it off to avoid information overload and spam.
     DJANGO_EXPANDED_TESTCASES_DEBUG_PRINT = False
 
+# Always include console coloring, so that color output is consistently tested regardless of terminal.
+DJANGO_EXPANDED_TESTCASES_DEBUG_PRINT__COLOR = True
+
+# Always show every APPEND_SLASH warning, so that warning output is consistently tested regardless of test order.
+DJANGO_EXPANDED_TESTCASES_DEDUPLICATE_APPEND_SLASH_WARNINGS = False
+
 # endregion Package settings for testing
 
 
@@ -3,9 +3,10 @@ Views for django-expanded-test-cases project UnitTests.
 """
 
 # Third-Party Imports.
+from asgiref.sync import sync_to_async
 from django.contrib import messages
 from django.contrib.auth import get_user_model
-from django.http import JsonResponse
+from django.http import HttpResponseForbidden, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.template.response import TemplateResponse
 from django.urls import reverse
@@ -269,6 +270,15 @@ def json_response_basic_dict(request):
     )
 
 
+def json_response_request_host(request):
+    return JsonResponse({'host': request.get_host(), 'secure': request.is_secure()})
+
+
+def json_response_request_data(request):
+    request_data = request.POST if request.method == 'POST' else request.GET
+    return JsonResponse({'method': request.method, 'data': request_data.dict()})
+
+
 def json_response_basic_list(request):
     request_headers = dict(request.headers)
     return JsonResponse(
@@ -314,6 +324,73 @@ def user_detail(request, pk):
     )
 
 
+def user_list(request):
+    """Page that simulates a model list page, which runs an extra query for each listed model."""
+
+    # Pull database info.
+    users = get_user_model().objects.all().order_by('pk')
+
+    # Render response.
+    return render(
+        request,
+        'django_expanded_test_cases/index.html',
+        {
+            'header': 'User List Page',
+            'text': 'Pretend this is a user list page.',
+            'li_set': ['{0}: {1} group(s)'.format(user.username, user.groups.count()) for user in users],
+        },
+    )
+
+
+async def async_user_detail(request, pk):
+    """Page that simulates an async model detail page."""
+
+    # Pull database info.
+    # Uses sync_to_async() rather than aget(), for compatibility with older Django versions.
+    user = await sync_to_async(get_user_model().objects.get)(pk=pk)
+
+    # Generate response messages.
+    messages.info(request, 'Loaded user asynchronously.')
+
+    # Render response.
+    return render(
+        request,
+        'django_expanded_test_cases/index.html',
+        {
+            'header': 'Async User Detail Page',
+            'text': '{0}'.format(user),
+            'li_set': ('Username: "{0}"'.format(user.username),),
+        },
+    )
+
+
+def view_that_raises_error(request):
+    """Page that simulates a view that errors partway through handling."""
+
+    # Render part of the response, so that template signals are sent before the error.
+    render(request, 'django_expanded_test_cases/index.html', {'header': 'Error Page'})
+
+    raise ValueError('Simulated view error.')
+
+
+def staff_only(request):
+    """Page that simulates a view restricted to staff users."""
+
+    # Verify user access.
+    if not request.user.is_staff:
+        return HttpResponseForbidden()
+
+    # Render response.
+    return render(
+        request,
+        'django_expanded_test_cases/index.html',
+        {
+            'header': 'Staff Page',
+            'text': 'Pretend this is a staff-only page.',
+        },
+    )
+
+
 def redirect_to_index(request):
     """Page that simulates a redirect."""
 
@@ -356,6 +433,46 @@ def redirect_with_args(request, id, name):
     )
 
 
+def redirect_with_status(request, status):
+    """Page that simulates a redirect, with a redirect status code other than the default 302."""
+
+    # Redirect to intended view.
+    response = redirect('django_expanded_test_cases:index')
+    response.status_code = status
+    return response
+
+
+def redirect_to_request_data(request, status):
+    """Page that simulates a redirect to a view that displays the request data, with provided redirect status code."""
+
+    # Redirect to intended view.
+    response = redirect('django_expanded_test_cases:json-response-request-data')
+    response.status_code = status
+    return response
+
+
+def redirect_to_absolute_url(request):
+    """Page that simulates a redirect to an absolute url, with a different port."""
+
+    # Redirect to intended view.
+    return redirect(
+        'https://testserver:8443{0}'.format(reverse('django_expanded_test_cases:json-response-request-host')),
+    )
+
+
+def redirect_chain(request, count):
+    """Page that simulates a chain of multiple redirects, such as from several url rewrites."""
+
+    # Access user, so that each request in chain runs the same session/user lookups.
+    if not request.user.is_authenticated:
+        return redirect('django_expanded_test_cases:index')
+
+    # Redirect to next view in chain.
+    if count > 0:
+        return redirect('django_expanded_test_cases:redirect-chain', count - 1)
+    return redirect('django_expanded_test_cases:index')
+
+
 def view_with_basic_form(request):
     """View that simulates a form page."""
 
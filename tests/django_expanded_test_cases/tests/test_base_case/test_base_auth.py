@@ -3,14 +3,22 @@ Tests for tests/base_test_case.py under different project authentication setting
 """
 
 # System Imports.
+import copy
+import os
 from unittest.mock import patch
 
 # Third-Party Imports.
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.models import ContentType
 
 # Internal Imports.
 from django_expanded_test_cases import BaseTestCase
+from django_expanded_test_cases.mixins import UserHandle
+from django_expanded_test_cases.mixins.core_mixin import (
+    _precreate_default_users,
+    _precreated_users,
+)
 
 
 class TestBaseClassAuth__Base(BaseTestCase):
@@ -77,6 +85,76 @@ class TestBaseClassAuth__Base(BaseTestCase):
             self.assertEqual(test_user.is_staff, False)
             self.assertEqual(test_user.is_active, True)
 
+    def test__precreated_default_users(self):
+        """
+        Tests binding to default users that were pre-created during test database setup.
+        """
+        # Replace users created for this test with "pre-created" ones. All changes are rolled back after test.
+        # Any actual pre-created state (such as from the ETC pytest plugin) is restored after test.
+        get_user_model().objects.all().delete()
+        with patch.dict(_precreated_users), patch.dict(os.environ):
+            _precreate_default_users()
+            precreated_pks = {name: handle.pk for name, handle in _precreated_users['handles'].items()}
+
+            with self.subTest('Binds existing users - Only checks that users exist'):
+                with self.assertNumQueries(1):
+                    self._auto_generate_test_users()
+
+                self.assertEqual(self.test_superuser.pk, precreated_pks['test_superuser'])
+                self.assertEqual(self.test_admin.pk, precreated_pks['test_admin'])
+                self.assertEqual(self.test_inactive_user.pk, precreated_pks['test_inactive_user'])
+                self.assertEqual(self.test_user.pk, precreated_pks['test_user'])
+                self.assertEqual(self.test_user.unhashed_password, 'password')
+                self.assertEqual(get_user_model().objects.count(), 4)
+
+            with self.subTest('Binds existing users - Loaded from database in worker process'):
+                _precreated_users['handles'] = None
+
+                with self.assertNumQueries(2):
+                    self._auto_generate_test_users()
+
+                self.assertEqual(self.test_user.pk, precreated_pks['test_user'])
+                self.assertEqual(self.test_user.first_name, 'UserFirst')
+                self.assertTrue(self.test_user.check_password('password'))
+                self.assertEqual(get_user_model().objects.count(), 4)
+
+            with self.subTest('Incompatible settings - Users are regenerated'):
+                self._auto_generate_test_users(extra_usergen_kwargs={'first_name': 'Other'})
+
+                self.assertNotEqual(self.test_user.pk, precreated_pks['test_user'])
+                self.assertEqual(self.test_user.first_name, 'UserFirst')
+                self.assertEqual(get_user_model().objects.count(), 4)
+
+    def test__get_user__repeated_lookups(self):
+        """
+        Tests get_user() function, when the same non-default user is requested multiple times in one test.
+        """
+        with self.subTest('First lookup - Creates user'):
+            new_user = self.get_user('new_user')
+
+            self.assertEqual(new_user.username, 'new_user')
+            self.assertTrue(new_user.check_password('password'))
+
+        with self.subTest('Repeated lookup - Uses same instance without queries'):
+            with self.assertNumQueries(0):
+                repeated_user = self.get_user('new_user')
+
+            self.assertIs(repeated_user, new_user)
+
+        with self.subTest('Repeated lookup with new password - Updates same instance'):
+            repeated_user = self.get_user('new_user', password='new_password')
+
+            self.assertIs(repeated_user, new_user)
+            self.assertTrue(new_user.check_password('new_password'))
+            self.assertEqual(new_user.unhashed_password, 'new_password')
+
+        with self.subTest('Lookup after user deletion - Recreates user'):
+            new_user.delete()
+            recreated_user = self.get_user('new_user')
+
+            self.assertIsNot(recreated_user, new_user)
+            self.assertIsNotNone(recreated_user.pk)
+
     def test__add_user_permission(self):
         """
         Tests add_user_permission() function.
@@ -410,6 +488,160 @@ class TestBaseClassAuth__Base(BaseTestCase):
         self.assertFalse(self.test_admin.groups.all().exists())
         self.assertFalse(self.test_user.groups.all().exists())
 
+    def test__add_user_permissions(self):
+        """
+        Tests add_user_permissions() function.
+        """
+        permission_1 = Permission.objects.get(codename='add_user')
+        permission_2 = Permission.objects.get(codename='change_user')
+
+        # Ensure cached lookup is populated, so that only the write itself is counted.
+        self.add_user_permissions(['add_user'], user='test_admin')
+
+        with self.subTest('Add multiple Permissions - Single write'):
+            with self.assertNumQueries(2):
+                return_val = self.add_user_permissions(['add_user', 'Can change user'])
+
+            self.assertEqual(return_val, self.test_user)
+            self.assertEqual(list(self.test_user.user_permissions.order_by('pk')), [permission_1, permission_2])
+
+        with self.subTest('Add already held Permissions - Write is skipped'):
+            with self.assertNumQueries(0):
+                self.add_user_permissions(['add_user', permission_2])
+
+            self.assertEqual(list(self.test_user.user_permissions.order_by('pk')), [permission_1, permission_2])
+
+        with self.subTest('Add unknown Permission - Raises error'):
+            with self.assertRaises(ValueError):
+                self.add_user_permissions(['add_user', 'unknown_permission'])
+
+    def test__add_user_groups(self):
+        """
+        Tests add_user_groups() function.
+        """
+        group_1 = Group.objects.create(name='group_1')
+        group_2 = Group.objects.create(name='group_2')
+
+        with self.subTest('Add multiple Groups'):
+            return_val = self.add_user_groups(['group_1', group_2])
+
+            self.assertEqual(return_val, self.test_user)
+            self.assertEqual(list(self.test_user.groups.order_by('pk')), [group_1, group_2])
+
+        with self.subTest('Add already held Groups - Write is skipped'):
+            with self.assertNumQueries(0):
+                self.add_user_groups(['group_1', 'group_2'])
+
+            self.assertEqual(list(self.test_user.groups.order_by('pk')), [group_1, group_2])
+
+        with self.subTest('Add unknown Group - Raises error'):
+            with self.assertRaises(ValueError):
+                self.add_user_groups(['unknown_group'])
+
+    def test__make_users(self):
+        """
+        Tests make_users() function.
+        """
+        group_1 = Group.objects.create(name='group_1')
+        permission_1 = Permission.objects.get(codename='add_user')
+        permission_2 = Permission.objects.get(codename='change_user')
+
+        with self.subTest('Create multiple users'):
+            handles = self.make_users(
+                {
+                    'editor': ['add_user', 'change_user'],
+                    'viewer': {'user_groups': ['group_1'], 'first_name': 'Viewer'},
+                    'nobody': [],
+                }
+            )
+
+            self.assertEqual(list(handles.keys()), ['editor', 'viewer', 'nobody'])
+            self.assertTrue(all(isinstance(handle, UserHandle) for handle in handles.values()))
+
+            editor = self.get_user('editor')
+            self.assertEqual(editor.pk, handles['editor'].pk)
+            self.assertTrue(editor.check_password('password'))
+            self.assertEqual(list(editor.user_permissions.order_by('pk')), [permission_1, permission_2])
+            self.assertEqual(list(editor.groups.all()), [])
+
+            viewer = self.get_user('viewer')
+            self.assertEqual(viewer.first_name, 'Viewer')
+            self.assertEqual(list(viewer.user_permissions.all()), [])
+            self.assertEqual(list(viewer.groups.all()), [group_1])
+
+            self.assertEqual(list(self.get_user('nobody').user_permissions.all()), [])
+
+        with self.subTest('Auth data is recorded - No further queries needed'):
+            with self.assertNumQueries(0):
+                groups, permissions = self._get_user_auth_data(self.get_user('editor'))
+            self.assertEqual(groups, [])
+            self.assertEqual(permissions, [permission_1, permission_2])
+
+            with self.assertNumQueries(0):
+                self.add_user_permissions(['add_user'], user='editor')
+
+        with self.subTest('Users, Permissions, and Groups are each created with a single query'):
+            with self.assertNumQueries(3):
+                self.make_users(
+                    {
+                        'editor_2': ['add_user', 'add_user'],
+                        'viewer_2': {'user_groups': [group_1]},
+                        'manager_2': {'user_permissions': ['change_user'], 'user_groups': ['group_1']},
+                    }
+                )
+
+            self.assertEqual(list(self.get_user('editor_2').user_permissions.all()), [permission_1])
+            self.assertEqual(list(self.get_user('manager_2').user_permissions.all()), [permission_2])
+            self.assertEqual(list(self.get_user('manager_2').groups.all()), [group_1])
+
+        with self.subTest('Invalid spec - Raises error'):
+            with self.assertRaises(TypeError):
+                self.make_users({'invalid_user': 'add_user'})
+
+    def test__get_user_auth_data(self):
+        """
+        Tests _get_user_auth_data() function.
+        """
+        group_1 = Group.objects.create(name='group_1')
+        group_2 = Group.objects.create(name='group_2')
+        permission_1 = Permission.objects.get(codename='add_user')
+
+        with self.subTest('Test with no Groups/Permissions'):
+            with self.assertNumQueries(0):
+                groups, permissions = self._get_user_auth_data(self.test_user)
+            self.assertEqual(groups, [])
+            self.assertEqual(permissions, [])
+
+        with self.subTest('Test after ETC adds Groups/Permissions - Uses recorded values'):
+            self.add_user_group(group_1)
+            self.add_user_permission('add_user')
+
+            with self.assertNumQueries(0):
+                groups, permissions = self._get_user_auth_data(self.test_user)
+            self.assertEqual(groups, [group_1])
+            self.assertEqual(permissions, [permission_1])
+
+        with self.subTest('Test after external Group change - Falls back to query'):
+            self.test_user.groups.add(group_2)
+
+            with self.assertNumQueries(2):
+                groups, permissions = self._get_user_auth_data(self.test_user)
+            self.assertEqual(groups, [group_1, group_2])
+            self.assertEqual(permissions, [permission_1])
+
+            # Result is recorded for subsequent calls.
+            with self.assertNumQueries(0):
+                groups, permissions = self._get_user_auth_data(self.test_user)
+            self.assertEqual(groups, [group_1, group_2])
+
+        with self.subTest('Test after Group deletion - Falls back to query'):
+            group_2.delete()
+
+            with self.assertNumQueries(2):
+                groups, permissions = self._get_user_auth_data(self.test_user)
+            self.assertEqual(groups, [group_1])
+            self.assertEqual(permissions, [permission_1])
+
     # endregion User Management Function Tests
 
 
@@ -498,6 +730,148 @@ class TestBaseClassAuth__Base(BaseTestCase):
 #             self.assertEqual(test_user.is_active, True)
 
 
+class TestBaseClassAuth_WithLazyUsers(BaseTestCase):
+    """Tests for BaseTestCase class, when using settings to generate users lazily.
+
+    Required as a separate class, since user generation is handled on class initialization.
+    """
+
+    @patch('django_expanded_test_cases.mixins.core_mixin.ETC_AUTO_GENERATE_USERS_LAZILY', True)
+    def setUp(self):
+        # Call parent logic.
+        super().setUp()
+
+    def test__default_users__lazy_creation(self):
+        """
+        Tests that default users are only created on first access.
+        """
+        with self.subTest('Before access - User does not exist'):
+            self.assertFalse(get_user_model().objects.filter(username='test_admin').exists())
+
+        with self.subTest('On access - User is created'):
+            test_admin = self.test_admin
+
+            self.assertTrue(get_user_model().objects.filter(pk=test_admin.pk, username='test_admin').exists())
+            self.assertTrue(test_admin.check_password('password'))
+            self.assertEqual(test_admin.unhashed_password, 'password')
+
+        with self.subTest('Repeated access - Uses same instance without queries'):
+            with self.assertNumQueries(0):
+                repeated_admin = self.test_admin
+
+            self.assertIs(repeated_admin, test_admin)
+
+
+class TestBaseClassAuth_WithUserHandles(BaseTestCase):
+    """Tests for BaseTestCase class, when using settings to hold users generated in setUpTestData() as handles.
+
+    Required as a separate class, since user generation is handled on class initialization.
+    """
+
+    @classmethod
+    @patch('django_expanded_test_cases.mixins.core_mixin.ETC_AUTO_GENERATE_USERS_IN_SETUPTESTDATA', True)
+    @patch('django_expanded_test_cases.mixins.core_mixin.ETC_USE_USER_HANDLES', True)
+    def setUpTestData(cls):
+        # Call parent logic.
+        super().setUpTestData()
+
+    @patch('django_expanded_test_cases.mixins.core_mixin.ETC_AUTO_GENERATE_USERS_IN_SETUPTESTDATA', True)
+    def setUp(self):
+        # Call parent logic.
+        super().setUp()
+
+    def test__user_handles(self):
+        """
+        Tests default users, when held as handles.
+        """
+        with self.subTest('First access - Instance is rebuilt without queries'):
+            with self.assertNumQueries(0):
+                test_user = self.test_user
+
+            self.assertEqual(test_user.username, 'test_user')
+            self.assertEqual(test_user.unhashed_password, 'password')
+            self.assertTrue(test_user.check_password('password'))
+            self.assertTrue(get_user_model().objects.filter(pk=test_user.pk).exists())
+
+        with self.subTest('Repeated access - Uses same instance within test'):
+            self.assertIs(self.test_user, test_user)
+            self.assertIs(self.get_user('test_user'), test_user)
+
+        with self.subTest('Direct handle usage'):
+            handle = UserHandle(self.test_admin)
+
+            self.assertEqual(handle.pk, self.test_admin.pk)
+            self.assertEqual(handle.identifier, 'test_admin')
+            self.assertIs(copy.deepcopy(handle), handle)
+            self.assertIs(self.get_user(handle), handle.get())
+            self.assertEqual(handle.get(), self.test_admin)
+
+    def test__user_handles__isolation_1(self):
+        """
+        Tests that changes to user instance in one test never carry over to another.
+        """
+        self.assertEqual(self.test_user.first_name, 'UserFirst')
+        self.test_user.first_name = 'Changed'
+
+    def test__user_handles__isolation_2(self):
+        """
+        Tests that changes to user instance in one test never carry over to another.
+        """
+        self.assertEqual(self.test_user.first_name, 'UserFirst')
+        self.test_user.first_name = 'Changed'
+
+
+class TestBaseClassAuth_WithSharedUsers(BaseTestCase):
+    """Tests for BaseTestCase class, when default users are generated once in setUpTestData().
+
+    Required as a separate class, since user generation is handled on class initialization.
+    """
+
+    @classmethod
+    @patch('django_expanded_test_cases.mixins.core_mixin.ETC_AUTO_GENERATE_USERS_IN_SETUPTESTDATA', True)
+    def setUpTestData(cls):
+        # Call parent logic.
+        super().setUpTestData()
+
+    @patch('django_expanded_test_cases.mixins.core_mixin.ETC_AUTO_GENERATE_USERS_IN_SETUPTESTDATA', True)
+    def setUp(self):
+        # Call parent logic.
+        super().setUp()
+
+    def _assert_auth_isolation(self):
+        """Adds auth to shared default user, and verifies that nothing carries over from a prior test."""
+        Group.objects.create(name='group_1')
+        test_user = self.get_user('test_user')
+
+        with self.subTest('Auth data starts empty'):
+            self.assertEqual(test_user.user_permissions.count(), 0)
+            self.assertEqual(test_user.groups.count(), 0)
+            self.assertEqual(self._get_user_auth_data(test_user), ([], []))
+
+        with self.subTest('Auth data is written to database'):
+            self.add_user_permissions(['add_user'], user=test_user)
+            self.add_user_groups(['group_1'], user=test_user)
+
+            self.assertEqual(list(test_user.user_permissions.values_list('codename', flat=True)), ['add_user'])
+            self.assertEqual(list(test_user.groups.values_list('name', flat=True)), ['group_1'])
+
+            groups, permissions = self._get_user_auth_data(test_user)
+            self.assertEqual([group.name for group in groups], ['group_1'])
+            self.assertEqual([permission.codename for permission in permissions], ['add_user'])
+
+    def test__auth_isolation_1(self):
+        """
+        Tests that Group/Permission changes in one test never carry over to another.
+        """
+        self._assert_auth_isolation()
+
+    def test__auth_isolation_2(self):
+        """
+        Tests that Group/Permission changes in one test never carry over to another.
+        """
+        self._assert_auth_isolation()
+
+
 class TestBaseClassAuth_WithRealNames(BaseTestCase):
     """Tests for BaseTestCase class, when using settings to generate users with real names.
 
@@ -616,7 +616,7 @@ class BaseTestMixin:
             self.assertEqual(
                 std_out_lines[5],
                 '{0}esting.{1}'.format(
-                    ETC_OUTPUT_EXPECTED_ERROR_COLOR,
+                    ETC_OUTPUT_EXPECTED_MATCH_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -631,8 +631,9 @@ class BaseTestMixin:
             )
             self.assertEqual(
                 std_out_lines[9],
-                '{0}Testing.{1}'.format(
+                '{0}T{1}esting.{2}'.format(
                     ETC_OUTPUT_ACTUALS_ERROR_COLOR,
+                    ETC_OUTPUT_ACTUALS_MATCH_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -661,8 +662,9 @@ class BaseTestMixin:
             )
             self.assertEqual(
                 std_out_lines[5],
-                '{0}Testing.{1}'.format(
+                '{0}T{1}esting.{2}'.format(
                     ETC_OUTPUT_EXPECTED_ERROR_COLOR,
+                    ETC_OUTPUT_EXPECTED_MATCH_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -678,7 +680,7 @@ class BaseTestMixin:
             self.assertEqual(
                 std_out_lines[9],
                 '{0}esting.{1}'.format(
-                    ETC_OUTPUT_ACTUALS_ERROR_COLOR,
+                    ETC_OUTPUT_ACTUALS_MATCH_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -708,7 +710,7 @@ class BaseTestMixin:
             self.assertEqual(
                 std_out_lines[5],
                 '{0}sting.{1}'.format(
-                    ETC_OUTPUT_EXPECTED_ERROR_COLOR,
+                    ETC_OUTPUT_EXPECTED_MATCH_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -723,8 +725,9 @@ class BaseTestMixin:
             )
             self.assertEqual(
                 std_out_lines[9],
-                '{0}Testing.{1}'.format(
+                '{0}Te{1}sting.{2}'.format(
                     ETC_OUTPUT_ACTUALS_ERROR_COLOR,
+                    ETC_OUTPUT_ACTUALS_MATCH_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -753,8 +756,9 @@ class BaseTestMixin:
             )
             self.assertEqual(
                 std_out_lines[5],
-                '{0}Testing.{1}'.format(
+                '{0}Te{1}sting.{2}'.format(
                     ETC_OUTPUT_EXPECTED_ERROR_COLOR,
+                    ETC_OUTPUT_EXPECTED_MATCH_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -770,7 +774,7 @@ class BaseTestMixin:
             self.assertEqual(
                 std_out_lines[9],
                 '{0}sting.{1}'.format(
-                    ETC_OUTPUT_ACTUALS_ERROR_COLOR,
+                    ETC_OUTPUT_ACTUALS_MATCH_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -799,9 +803,8 @@ class BaseTestMixin:
             )
             self.assertEqual(
                 std_out_lines[5],
-                '{0}Tes{1}ing.{2}'.format(
+                '{0}Tesing.{1}'.format(
                     ETC_OUTPUT_EXPECTED_MATCH_COLOR,
-                    ETC_OUTPUT_EXPECTED_ERROR_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -816,9 +819,10 @@ class BaseTestMixin:
             )
             self.assertEqual(
                 std_out_lines[9],
-                '{0}Tes{1}ting.{2}'.format(
+                '{0}Tes{1}t{2}ing.{3}'.format(
                     ETC_OUTPUT_ACTUALS_MATCH_COLOR,
                     ETC_OUTPUT_ACTUALS_ERROR_COLOR,
+                    ETC_OUTPUT_ACTUALS_MATCH_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -847,9 +851,10 @@ class BaseTestMixin:
             )
             self.assertEqual(
                 std_out_lines[5],
-                '{0}Tes{1}ting.{2}'.format(
+                '{0}Tes{1}t{2}ing.{3}'.format(
                     ETC_OUTPUT_EXPECTED_MATCH_COLOR,
                     ETC_OUTPUT_EXPECTED_ERROR_COLOR,
+                    ETC_OUTPUT_EXPECTED_MATCH_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -864,9 +869,8 @@ class BaseTestMixin:
             )
             self.assertEqual(
                 std_out_lines[9],
-                '{0}Tes{1}ing.{2}'.format(
+                '{0}Tesing.{1}'.format(
                     ETC_OUTPUT_ACTUALS_MATCH_COLOR,
-                    ETC_OUTPUT_ACTUALS_ERROR_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -895,9 +899,8 @@ class BaseTestMixin:
             )
             self.assertEqual(
                 std_out_lines[5],
-                '{0}Te{1}ng.{2}'.format(
+                '{0}Teng.{1}'.format(
                     ETC_OUTPUT_EXPECTED_MATCH_COLOR,
-                    ETC_OUTPUT_EXPECTED_ERROR_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -912,9 +915,10 @@ class BaseTestMixin:
             )
             self.assertEqual(
                 std_out_lines[9],
-                '{0}Te{1}sting.{2}'.format(
+                '{0}Te{1}sti{2}ng.{3}'.format(
                     ETC_OUTPUT_ACTUALS_MATCH_COLOR,
                     ETC_OUTPUT_ACTUALS_ERROR_COLOR,
+                    ETC_OUTPUT_ACTUALS_MATCH_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -943,9 +947,10 @@ class BaseTestMixin:
             )
             self.assertEqual(
                 std_out_lines[5],
-                '{0}Te{1}sting.{2}'.format(
+                '{0}Te{1}sti{2}ng.{3}'.format(
                     ETC_OUTPUT_EXPECTED_MATCH_COLOR,
                     ETC_OUTPUT_EXPECTED_ERROR_COLOR,
+                    ETC_OUTPUT_EXPECTED_MATCH_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -960,9 +965,8 @@ class BaseTestMixin:
             )
             self.assertEqual(
                 std_out_lines[9],
-                '{0}Te{1}ng.{2}'.format(
+                '{0}Teng.{1}'.format(
                     ETC_OUTPUT_ACTUALS_MATCH_COLOR,
-                    ETC_OUTPUT_ACTUALS_ERROR_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -991,9 +995,8 @@ class BaseTestMixin:
             )
             self.assertEqual(
                 std_out_lines[5],
-                '{0}Testing{1}{2}'.format(
+                '{0}Testing{1}'.format(
                     ETC_OUTPUT_EXPECTED_MATCH_COLOR,
-                    ETC_OUTPUT_EXPECTED_ERROR_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -1056,9 +1059,8 @@ class BaseTestMixin:
             )
             self.assertEqual(
                 std_out_lines[9],
-                '{0}Testing{1}{2}'.format(
+                '{0}Testing{1}'.format(
                     ETC_OUTPUT_ACTUALS_MATCH_COLOR,
-                    ETC_OUTPUT_ACTUALS_ERROR_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -1087,9 +1089,8 @@ class BaseTestMixin:
             )
             self.assertEqual(
                 std_out_lines[5],
-                '{0}Test{1}{2}'.format(
+                '{0}Test{1}'.format(
                     ETC_OUTPUT_EXPECTED_MATCH_COLOR,
-                    ETC_OUTPUT_EXPECTED_ERROR_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -1152,9 +1153,8 @@ class BaseTestMixin:
             )
             self.assertEqual(
                 std_out_lines[9],
-                '{0}Test{1}{2}'.format(
+                '{0}Test{1}'.format(
                     ETC_OUTPUT_ACTUALS_MATCH_COLOR,
-                    ETC_OUTPUT_ACTUALS_ERROR_COLOR,
                     ETC_OUTPUT_RESET_COLOR,
                 ),
             )
@@ -1456,6 +1456,157 @@ class BaseTestMixin:
             self.assertEqual(std_out_lines[11], ETC_OUTPUT_RESET_COLOR)
             self.assertEqual(std_out_lines[12], '')
 
+    @skipIf(not settings.DJANGO_EXPANDED_TESTCASES_DEBUG_PRINT, 'Test only works as expected with DEBUG PRINT.')
+    def test__assertText_coloring__line_alignment(self):
+        """Tests assertText() function color output, when lines are added or removed.
+
+        Lines should be aligned by content, rather than by index.
+        """
+        expected_header = '{0}EXPECTED:{1}'.format(ETC_OUTPUT_EXPECTED_MATCH_COLOR, ETC_OUTPUT_RESET_COLOR)
+
+        with self.subTest('With line inserted at start of actuals'):
+            std_out = StringIO()
+            with redirect_stdout(std_out):
+                with self.assertRaises(AssertionError):
+                    self.assertText('Line 1.\nLine 2.', 'Inserted.\nLine 1.\nLine 2.')
+            std_out_lines = std_out.getvalue().split('\n')
+            start_index = std_out_lines.index(expected_header)
+            std_out_lines = std_out_lines[start_index:]
+
+            # Test all line values.
+            self.assertEqual(
+                std_out_lines[1],
+                '{0}Line 1.{1}'.format(ETC_OUTPUT_EXPECTED_MATCH_COLOR, ETC_OUTPUT_RESET_COLOR),
+            )
+            self.assertEqual(
+                std_out_lines[2],
+                '{0}Line 2.{1}'.format(ETC_OUTPUT_EXPECTED_MATCH_COLOR, ETC_OUTPUT_RESET_COLOR),
+            )
+            self.assertEqual(
+                std_out_lines[6],
+                '{0}ACTUAL:{1}'.format(ETC_OUTPUT_ACTUALS_MATCH_COLOR, ETC_OUTPUT_RESET_COLOR),
+            )
+            self.assertEqual(
+                std_out_lines[7],
+                '{0}Inserted.{1}'.format(ETC_OUTPUT_ACTUALS_ERROR_COLOR, ETC_OUTPUT_RESET_COLOR),
+            )
+            self.assertEqual(
+                std_out_lines[8],
+                '{0}Line 1.{1}'.format(ETC_OUTPUT_ACTUALS_MATCH_COLOR, ETC_OUTPUT_RESET_COLOR),
+            )
+            self.assertEqual(
+                std_out_lines[9],
+                '{0}Line 2.{1}'.format(ETC_OUTPUT_ACTUALS_MATCH_COLOR, ETC_OUTPUT_RESET_COLOR),
+            )
+
+        with self.subTest('With matching lines collapsed'):
+            std_out = StringIO()
+            with patch('django_expanded_test_cases.mixins.core_mixin.ETC_ASSERT_TEXT__DIFF_CONTEXT_LINES', 1):
+                with redirect_stdout(std_out):
+                    with self.assertRaises(AssertionError):
+                        self.assertText('A\nB\nC\nD\nE\nF\nG\nH\nI\nJ', 'A\nB\nC\nD\nE\nX\nG\nH\nI\nJ')
+            std_out_lines = std_out.getvalue().split('\n')
+            start_index = std_out_lines.index(expected_header)
+            std_out_lines = std_out_lines[start_index:]
+
+            # Test all line values.
+            self.assertEqual(std_out_lines[1], '{0}... 4 matching lines hidden ...'.format(ETC_OUTPUT_RESET_COLOR))
+            self.assertEqual(
+                std_out_lines[2],
+                '{0}E{1}'.format(ETC_OUTPUT_EXPECTED_MATCH_COLOR, ETC_OUTPUT_RESET_COLOR),
+            )
+            self.assertEqual(std_out_lines[3], '{0}F'.format(ETC_OUTPUT_EXPECTED_ERROR_COLOR))
+            self.assertEqual(
+                std_out_lines[4],
+                '{0}G{1}'.format(ETC_OUTPUT_EXPECTED_MATCH_COLOR, ETC_OUTPUT_RESET_COLOR),
+            )
+            self.assertEqual(std_out_lines[5], '{0}... 3 matching lines hidden ...'.format(ETC_OUTPUT_RESET_COLOR))
+            self.assertEqual(
+                std_out_lines[9],
+                '{0}ACTUAL:{1}'.format(ETC_OUTPUT_ACTUALS_MATCH_COLOR, ETC_OUTPUT_RESET_COLOR),
+            )
+            self.assertEqual(std_out_lines[10], '{0}... 4 matching lines hidden ...'.format(ETC_OUTPUT_RESET_COLOR))
+            self.assertEqual(
+                std_out_lines[11],
+                '{0}E{1}'.format(ETC_OUTPUT_ACTUALS_MATCH_COLOR, ETC_OUTPUT_RESET_COLOR),
+            )
+            self.assertEqual(std_out_lines[12], '{0}X'.format(ETC_OUTPUT_ACTUALS_ERROR_COLOR))
+            self.assertEqual(
+                std_out_lines[13],
+                '{0}G{1}'.format(ETC_OUTPUT_ACTUALS_MATCH_COLOR, ETC_OUTPUT_RESET_COLOR),
+            )
+            self.assertEqual(std_out_lines[14], '{0}... 3 matching lines hidden ...'.format(ETC_OUTPUT_RESET_COLOR))
+
+        with self.subTest('With startsWith() comparison'):
+            std_out = StringIO()
+            with redirect_stdout(std_out):
+                with self.assertRaises(AssertionError):
+                    self.assertTextStartsWith('Tesx', 'Testing.')
+            std_out_lines = std_out.getvalue().split('\n')
+            start_index = std_out_lines.index(expected_header)
+            std_out_lines = std_out_lines[start_index:]
+
+            # Test all line values. Actual text past compared portion should have no coloring.
+            self.assertEqual(
+                std_out_lines[1],
+                '{0}Tes{1}x{2}'.format(
+                    ETC_OUTPUT_EXPECTED_MATCH_COLOR,
+                    ETC_OUTPUT_EXPECTED_ERROR_COLOR,
+                    ETC_OUTPUT_RESET_COLOR,
+                ),
+            )
+            self.assertEqual(
+                std_out_lines[5],
+                '{0}Tes{1}t{2}ing.{2}'.format(
+                    ETC_OUTPUT_ACTUALS_MATCH_COLOR,
+                    ETC_OUTPUT_ACTUALS_ERROR_COLOR,
+                    ETC_OUTPUT_RESET_COLOR,
+                ),
+            )
+
+    @patch('django_expanded_test_cases.mixins.core_mixin.ETC_DEBUG_PRINT__COLOR', False)
+    def test__debug_print__without_color(self):
+        """Tests debug output when console coloring is disabled.
+
+        No color formatting should be included, even if explicitly provided.
+        """
+        with self.subTest('Direct output'):
+            std_out = StringIO()
+            with redirect_stdout(std_out):
+                self._debug_print('Test output.', fore=ETC_OUTPUT_ACTUALS_ERROR_COLOR, style=ETC_OUTPUT_RESET_COLOR)
+            self.assertEqual(std_out.getvalue(), 'Test output.\n')
+
+        with self.subTest('Line comparison - Mismatches are marked with text'):
+            self.assertEqual(self._get_line_diff_output('Tesx', 'Testing.'), ('Tes[-x-]', 'Tes{+ting.+}'))
+            self.assertEqual(self._get_line_diff_output('A test', 'A tent'), ('A te[-s-]t', 'A te{+n+}t'))
+
+    @patch('django_expanded_test_cases.mixins.core_mixin.ETC_DEBUG_PRINT__COLOR', False)
+    @patch('django_expanded_test_cases.mixins.core_mixin.ETC_OUTPUT_EXPECTED_MATCH_COLOR', '')
+    @patch('django_expanded_test_cases.mixins.core_mixin.ETC_OUTPUT_EXPECTED_ERROR_COLOR', '')
+    @patch('django_expanded_test_cases.mixins.core_mixin.ETC_OUTPUT_ACTUALS_MATCH_COLOR', '')
+    @patch('django_expanded_test_cases.mixins.core_mixin.ETC_OUTPUT_ACTUALS_ERROR_COLOR', '')
+    @patch('django_expanded_test_cases.mixins.core_mixin.ETC_OUTPUT_RESET_COLOR', '')
+    def test__assertText__failure__without_color(self):
+        """Tests assertText() failure output when console coloring is disabled.
+
+        Mismatches should still be identifiable, through text markers.
+        """
+        with self.subTest('Mismatched characters within line'):
+            std_out = StringIO()
+            with redirect_stdout(std_out):
+                with self.assertRaises(AssertionError):
+                    self.assertText('Line one.\nLine two.', 'Line one.\nLine 2.')
+            self.assertIn('EXPECTED:\nLine one.\nLine [-two-].\n', std_out.getvalue())
+            self.assertIn('ACTUAL:\nLine one.\nLine {+2+}.\n', std_out.getvalue())
+
+        with self.subTest('Mismatched full lines'):
+            std_out = StringIO()
+            with redirect_stdout(std_out):
+                with self.assertRaises(AssertionError):
+                    self.assertText('Line one.\nLine two.', 'Line one.\nLine two.\nLine three.')
+            self.assertIn('EXPECTED:\nLine one.\nLine two.\n', std_out.getvalue())
+            self.assertIn('ACTUAL:\nLine one.\nLine two.\n{+Line three.+}\n', std_out.getvalue())
+
     def test__assertTextStartsWith__success(self):
         """
         Tests assertTextStartsWith() function, in cases when it should succeed.
@@ -1822,6 +1973,33 @@ class BaseTestMixin:
                 self.assertTextEndsWith(lorem_str, modified_str)
             # self.assertEqual(str(err.exception), exception_msg)
 
+    def test__assertTextStartsWith_and_assertTextEndsWith__large_actual(self):
+        """
+        Tests assertTextStartsWith() and assertTextEndsWith() functions, when actual value is very large.
+        """
+        large_str = '\n  {0}  \n'.format(lorem_str * 100)
+
+        with self.subTest('Passing assertions'):
+            self.assertTextStartsWith(lorem_str, large_str)
+            self.assertTextEndsWith(lorem_str, large_str)
+            self.assertTextStartsWith('\n  {0}'.format(lorem_str), large_str, strip=False)
+            self.assertTextEndsWith('{0}  \n'.format(lorem_str), large_str, strip=False)
+
+        with self.subTest('Failing assertions only display relevant portion of actual value'):
+            std_out = StringIO()
+            with redirect_stdout(std_out):
+                with self.assertRaises(AssertionError):
+                    self.assertTextStartsWith('Testing', large_str)
+            self.assertIn('Lorem ipsum', std_out.getvalue())
+            self.assertLess(len(std_out.getvalue()), len(lorem_str) * 5)
+
+            std_out = StringIO()
+            with redirect_stdout(std_out):
+                with self.assertRaises(AssertionError):
+                    self.assertTextEndsWith('Testing', large_str)
+            self.assertIn('tortor ante.', std_out.getvalue())
+            self.assertLess(len(std_out.getvalue()), len(lorem_str) * 5)
+
     # endregion Assertion Tests
 
     # region Helper Function Tests
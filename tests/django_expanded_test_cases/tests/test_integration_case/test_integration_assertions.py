@@ -3,17 +3,31 @@ Tests for IntegrationTestCase class custom assertions and testing checks.
 """
 
 # System Imports.
+import json
+import logging
+import os
+import tempfile
 from unittest.mock import patch
 
 # Third-Party Imports.
 from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
 from django.http import HttpResponse
 from django.test import override_settings
+from django.test.client import RedirectCycleError
 from django.urls import reverse
 from pytest import warns
 
 # Internal Imports.
 from django_expanded_test_cases import IntegrationTestCase
+from django_expanded_test_cases.mixins.core_mixin import _DEFAULT_USER_VALUES
+from django_expanded_test_cases.test_cases.integration_test_case import (
+    _get_performance_baseline,
+    _get_performance_baseline_user_key,
+    _recorded_performance_baseline,
+    _save_performance_baseline,
+)
 from django_expanded_test_cases.constants import (
     COLORAMA_PRESENT,
     ETC_OUTPUT_ACTUALS_MATCH_COLOR,
@@ -4162,6 +4176,540 @@ class IntegrationAssertionTestCase:
             )
         self.assertText(exception_msg.format('<title>Home Page | Test Views</title>'), str(err.exception))
 
+    def test__assertResponse__expected_max_queries(self):
+        """
+        Tests "expected_max_queries" and "expected_max_db_time_ms" functionality of assertResponse() function.
+        """
+        # View runs one query for the user list, then one more per user.
+        user_count = get_user_model().objects.count()
+        self.assertGreater(user_count, 1)
+
+        with self.subTest('Within budget - Only view request queries are recorded'):
+            response = self.assertResponse(
+                'django_expanded_test_cases:user-list',
+                user='test_user',
+                expected_max_queries=user_count + 1,
+                expected_max_db_time_ms=10000,
+            )
+
+            # Login user setup queries are excluded, leaving only queries run by the view itself.
+            self.assertEqual(len(response.etc_queries), user_count + 1)
+            self.assertIn('ORDER BY', response.etc_queries[0].sql)
+            self.assertEqual(response.etc_queries[0].using, 'default')
+            self.assertIn('testing/views.py:', response.etc_queries[-1].origin)
+
+        with self.subTest('Queries not recorded by default'):
+            response = self.assertResponse('django_expanded_test_cases:user-list')
+            self.assertIsNone(response.etc_queries)
+
+            with self.assertRaises(ValueError):
+                self.assertQueryBudget(response, expected_max_queries=1)
+
+        with self.subTest('Over query count budget'):
+            with self.assertRaises(AssertionError) as err:
+                self.assertResponse(
+                    'django_expanded_test_cases:user-list',
+                    auto_login=False,
+                    expected_max_queries=1,
+                )
+            self.assertIn(
+                'Expected at most 1 database queries. View request ran {0} queries.\n'.format(user_count + 1),
+                str(err.exception),
+            )
+            self.assertIn('Queries run by view request ({0} queries, '.format(user_count + 1), str(err.exception))
+            # Repeated queries are grouped, with the most common shown first.
+            self.assertIn('\n    {0}x, '.format(user_count), str(err.exception))
+            self.assertIn('\n    1x, ', str(err.exception))
+            self.assertIn('testing/views.py', str(err.exception))
+
+        with self.subTest('Over db time budget'):
+            with self.assertRaises(AssertionError) as err:
+                self.assertResponse(
+                    'django_expanded_test_cases:user-list',
+                    auto_login=False,
+                    expected_max_db_time_ms=0,
+                )
+            self.assertIn(
+                'Expected at most 0.00 ms of database queries. View request queries took ',
+                str(err.exception),
+            )
+            self.assertNotIn('Expected at most 1 database queries.', str(err.exception))
+
+    def test__assertResponse__assert_no_n_plus_one(self):
+        """
+        Tests "assert_no_n_plus_one" functionality of assertResponse() function.
+        """
+        # View runs one query for the user list, then one more (differing only by user id) per user.
+        user_count = get_user_model().objects.count()
+        self.assertGreater(user_count, 1)
+
+        with self.subTest('No repeated queries'):
+            response = self.assertResponse(
+                'django_expanded_test_cases:user-detail',
+                url_args=(self.test_user.pk,),
+                assert_no_n_plus_one=True,
+            )
+            self.assertGreater(len(response.etc_queries), 0)
+
+        with self.subTest('Repeated queries within threshold'):
+            with patch(
+                'django_expanded_test_cases.test_cases.integration_test_case.ETC_N_PLUS_ONE_THRESHOLD',
+                user_count,
+            ):
+                self.assertResponse('django_expanded_test_cases:user-list', assert_no_n_plus_one=True)
+
+        with self.subTest('Repeated queries over threshold'):
+            with patch(
+                'django_expanded_test_cases.test_cases.integration_test_case.ETC_N_PLUS_ONE_THRESHOLD',
+                user_count - 1,
+            ):
+                with self.assertRaises(AssertionError) as err:
+                    self.assertResponse('django_expanded_test_cases:user-list', assert_no_n_plus_one=True)
+
+            self.assertIn(
+                (
+                    'Found likely N+1 queries in view request. '
+                    'Expected each query to run at most {0} times per request, ignoring literal values.\n\n'
+                    'Repeated queries:\n'
+                    '    {1}x, '
+                ).format(user_count - 1, user_count),
+                str(err.exception),
+            )
+            # Query is shown as fingerprint, along with location of the code that ran it.
+            self.assertIn('"auth_user_groups"."user_id" = ?', str(err.exception))
+            self.assertIn('testing/views.py:', str(err.exception))
+            # The non-repeated user list query is not included.
+            self.assertNotIn('ORDER BY', str(err.exception))
+
+        with self.subTest('Followed redirect chain - Each request is checked separately'):
+            # Each request in chain runs the same session and user lookups, once.
+            response = self.assertResponse(
+                'django_expanded_test_cases:redirect-chain',
+                url_args=(5,),
+                user='test_user',
+                expected_redirect_url='/',
+                assert_no_n_plus_one=True,
+            )
+            self.assertEqual(len(response.redirect_chain), 6)
+            self.assertEqual(len({query.request_index for query in response.etc_queries}), 6)
+
+        with self.subTest('Enabled via setting'):
+            with patch('django_expanded_test_cases.test_cases.integration_test_case.ETC_ASSERT_NO_N_PLUS_ONE', True):
+                with patch(
+                    'django_expanded_test_cases.test_cases.integration_test_case.ETC_N_PLUS_ONE_THRESHOLD',
+                    user_count - 1,
+                ):
+                    with self.assertRaises(AssertionError):
+                        self.assertResponse('django_expanded_test_cases:user-list')
+
+                    # Can still disable per assertion.
+                    response = self.assertResponse('django_expanded_test_cases:user-list', assert_no_n_plus_one=False)
+                    self.assertIsNone(response.etc_queries)
+
+    def test__assertResponse__expected_max_duration_ms(self):
+        """
+        Tests "expected_max_duration_ms" and "expected_max_content_bytes" functionality of assertResponse() function.
+        """
+        response = self.assertResponse('django_expanded_test_cases:index')
+        content_bytes = len(response.content)
+
+        with self.subTest('Within budget'):
+            self.assertResponse(
+                'django_expanded_test_cases:index',
+                expected_max_duration_ms=10000,
+                expected_max_content_bytes=content_bytes,
+            )
+
+        with self.subTest('Over duration budget'):
+            with self.assertRaises(AssertionError) as err:
+                self.assertResponse('django_expanded_test_cases:index', expected_max_duration_ms=0)
+            self.assertIn('Expected view request to take at most 0.00 ms. View request took ', str(err.exception))
+
+        with self.subTest('Over content size budget'):
+            with self.assertRaises(AssertionError) as err:
+                self.assertResponse('django_expanded_test_cases:index', expected_max_content_bytes=content_bytes - 1)
+            self.assertText(
+                'Expected response content to be at most {0} bytes. Response content was {1} bytes.'.format(
+                    content_bytes - 1,
+                    content_bytes,
+                ),
+                str(err.exception),
+            )
+
+    def test__assertResponse__check_performance_baseline(self):
+        """
+        Tests "check_performance_baseline" functionality of assertResponse() function.
+        """
+        module_path = 'django_expanded_test_cases.test_cases.integration_test_case'
+
+        with self.subTest('No baseline file configured'):
+            with patch('{0}.ETC_PERFORMANCE_BASELINE_FILE'.format(module_path), None):
+                with self.assertRaises(ValueError):
+                    self.assertResponse('django_expanded_test_cases:index', check_performance_baseline=True)
+
+        with self.subTest('User keys - Default users by role, others by identifier'):
+            self.assertEqual(_get_performance_baseline_user_key(AnonymousUser()), 'anonymous')
+            self.assertEqual(_get_performance_baseline_user_key(self.test_admin), 'test_admin')
+
+            other_user = self.make_users({'renamed_admin': []})['renamed_admin'].get()
+            self.assertEqual(_get_performance_baseline_user_key(other_user), 'renamed_admin')
+            with patch.dict(_DEFAULT_USER_VALUES['test_admin'], {'identifier': 'renamed_admin'}):
+                self.assertEqual(_get_performance_baseline_user_key(other_user), 'test_admin')
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            baseline_path = os.path.join(temp_dir, 'baseline.json')
+
+            with patch('{0}.ETC_PERFORMANCE_BASELINE_FILE'.format(module_path), baseline_path):
+                with patch('{0}._performance_baseline'.format(module_path), None), patch.dict(
+                    _recorded_performance_baseline,
+                    clear=True,
+                ):
+
+                    with self.subTest('Record mode - Values are saved per url and user'):
+                        with patch('{0}.ETC_PERFORMANCE_BASELINE_MODE'.format(module_path), 'record'):
+                            with patch.object(self, '_sample_request', wraps=self._sample_request) as mock_sample:
+                                response = self.assertResponse(
+                                    'django_expanded_test_cases:user-list',
+                                    user='test_user',
+                                    check_performance_baseline=True,
+                                )
+                                self.assertEqual(mock_sample.call_count, 5)
+
+                                self.assertResponse(
+                                    'django_expanded_test_cases:user-list',
+                                    auto_login=False,
+                                    check_performance_baseline=True,
+                                )
+                            _save_performance_baseline()
+
+                        with open(baseline_path, 'r') as baseline_file:
+                            baseline = json.load(baseline_file)
+                        self.assertEqual(list(baseline.keys()), ['/user/list/'])
+                        self.assertEqual(sorted(baseline['/user/list/'].keys()), ['anonymous', 'test_user'])
+                        self.assertEqual(baseline['/user/list/']['test_user'], response.etc_performance)
+                        self.assertEqual(response.etc_performance['queries'], len(response.etc_queries))
+                        self.assertEqual(response.etc_performance['content_bytes'], len(response.content))
+
+                    with self.subTest('Record mode - Merged with values saved by other processes'):
+                        # Simulate another test process saving values after this process loaded the file.
+                        other_values = {'duration_ms': 1, 'queries': 1, 'content_bytes': 1}
+                        with open(baseline_path, 'w') as baseline_file:
+                            json.dump(
+                                {'/other/': {'test_admin': other_values}, '/user/list/': {'test_admin': other_values}},
+                                baseline_file,
+                            )
+
+                        with patch('{0}.ETC_PERFORMANCE_BASELINE_MODE'.format(module_path), 'record'):
+                            _save_performance_baseline()
+
+                        with open(baseline_path, 'r') as baseline_file:
+                            baseline = json.load(baseline_file)
+                        self.assertEqual(sorted(baseline.keys()), ['/other/', '/user/list/'])
+                        self.assertEqual(baseline['/other/'], {'test_admin': other_values})
+                        self.assertEqual(
+                            sorted(baseline['/user/list/'].keys()),
+                            ['anonymous', 'test_admin', 'test_user'],
+                        )
+                        self.assertEqual(baseline['/user/list/']['test_user'], response.etc_performance)
+                        # Lock and temp files are cleaned up.
+                        self.assertEqual(os.listdir(temp_dir), ['baseline.json'])
+
+                    with self.subTest('Fail mode - Within baseline'):
+                        # Allow a large duration tolerance, as timings of a few milliseconds can vary widely.
+                        with patch('{0}.ETC_PERFORMANCE_BASELINE_TOLERANCE'.format(module_path), 100):
+                            self.assertResponse(
+                                'django_expanded_test_cases:user-list',
+                                user='test_user',
+                                check_performance_baseline=True,
+                            )
+
+                    with self.subTest('Fail mode - Regressed from baseline'):
+                        baseline = _get_performance_baseline()
+                        baseline['/user/list/']['test_user'] = {'duration_ms': 0, 'queries': 1, 'content_bytes': 1}
+
+                        with self.assertRaises(AssertionError) as err:
+                            self.assertResponse(
+                                'django_expanded_test_cases:user-list',
+                                user='test_user',
+                                check_performance_baseline=True,
+                            )
+                        self.assertIn(
+                            'Response performance regressed from baseline, for url "{0}" with user "{1}":'.format(
+                                '/user/list/',
+                                'test_user',
+                            ),
+                            str(err.exception),
+                        )
+                        self.assertIn('exceeds baseline of 0.00 ms.', str(err.exception))
+                        self.assertIn('exceeds baseline of 1.\n', str(err.exception))
+                        self.assertIn('exceeds baseline of 1 bytes.', str(err.exception))
+
+                    with self.subTest('Warn mode - Regressed from baseline'):
+                        with patch('{0}.ETC_PERFORMANCE_BASELINE_MODE'.format(module_path), 'warn'):
+                            with warns(Warning) as warning_info:
+                                self.assertResponse(
+                                    'django_expanded_test_cases:user-list',
+                                    user='test_user',
+                                    check_performance_baseline=True,
+                                )
+                        self.assertIn('Response performance regressed from baseline', str(warning_info[0].message))
+
+                    with self.subTest('No baseline for url - Nothing to compare'):
+                        self.assertResponse('django_expanded_test_cases:index', check_performance_baseline=True)
+
+                    with self.subTest('POST request - Not sampled again'):
+                        with patch.object(self, '_sample_request') as mock_sample:
+                            self.assertPostResponse('django_expanded_test_cases:index', check_performance_baseline=True)
+                        mock_sample.assert_not_called()
+
+    def test__assertResponse__follow(self):
+        """
+        Tests follow and max_redirects parameters of assertResponse() function.
+        """
+        redirect_url = 'django_expanded_test_cases:redirect-to-index'
+
+        with self.subTest('Auto follow - Only redirect expectations - Stops after first hop'):
+            with patch.object(self.client, 'get', wraps=self.client.get) as mock_get:
+                response = self.assertResponse(redirect_url, follow='auto', expected_redirect_url='/')
+
+            self.assertEqual(mock_get.call_count, 1)
+            self.assertEqual(response.status_code, 302)
+            self.assertFalse(hasattr(response, 'redirect_chain'))
+            self.assertEqual(response.url_data.computed.redirect_url, '/')
+            self.assertEqual(response.url_data.computed.final_url, '/')
+
+            response = self.assertResponse(redirect_url, follow='auto', view_should_redirect=True)
+            self.assertEqual(response.status_code, 302)
+
+        with self.subTest('Auto follow - Only redirect expectations - Still fails on incorrect redirect'):
+            with self.assertRaises(AssertionError) as err:
+                self.assertResponse(redirect_url, follow='auto', expected_redirect_url='/home/')
+            self.assertText(
+                'Response expected_redirect_url didn\'t match. Expected url was "/home/". Actual url was "/".',
+                str(err.exception),
+            )
+
+        with self.subTest('Auto follow - Final page assertions - Follows full chain'):
+            response = self.assertResponse(
+                redirect_url,
+                follow='auto',
+                expected_redirect_url='/',
+                expected_messages='Redirecting to index.',
+            )
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.redirect_chain, [('/', 302)])
+
+        with self.subTest('Auto follow - Explicit expected_status - Follows full chain'):
+            with patch.object(self.client, 'get', wraps=self.client.get) as mock_get:
+                response = self.assertResponse(
+                    redirect_url,
+                    follow='auto',
+                    expected_redirect_url='/',
+                    expected_status=200,
+                )
+
+            self.assertEqual(mock_get.call_count, 2)
+            self.assertEqual(response.status_code, 200)
+
+            with self.assertRaises(AssertionError) as err:
+                self.assertResponse(redirect_url, follow='auto', expected_redirect_url='/', expected_status=403)
+            self.assertText(
+                '200 != 403 : Expected status code (after potential redirects) of "403". Actual code was "200".',
+                str(err.exception),
+            )
+
+        with self.subTest('Auto follow - No redirect expectations - Follows full chain'):
+            response = self.assertResponse(redirect_url, follow='auto')
+
+            self.assertEqual(response.status_code, 200)
+
+        with self.subTest('Auto follow - As setting'):
+            with patch('django_expanded_test_cases.test_cases.integration_test_case.ETC_FOLLOW_REDIRECTS', 'auto'):
+                response = self.assertResponse(redirect_url, expected_redirect_url='/')
+
+            self.assertEqual(response.status_code, 302)
+
+        with self.subTest('No follow - Status is of initial view response'):
+            response = self.assertResponse(redirect_url, follow=False, expected_status=302, expected_redirect_url='/')
+
+            self.assertEqual(response.url_data.computed.redirect_url, '/')
+
+            with self.assertRaises(AssertionError):
+                self.assertResponse(redirect_url, follow=False)
+
+        with self.subTest('With string follow values'):
+            response = self.assertResponse(redirect_url, follow='False', expected_status=302)
+            self.assertFalse(hasattr(response, 'redirect_chain'))
+
+            response = self.assertResponse(redirect_url, follow=' true ')
+            self.assertEqual(response.redirect_chain, [('/', 302)])
+
+            with self.assertRaises(ValueError):
+                self.assertResponse(redirect_url, follow='sometimes')
+
+        with self.subTest('No follow - Other redirect status codes'):
+            for status in (301, 303, 307, 308):
+                status_url = reverse('django_expanded_test_cases:redirect-with-status', args=[status])
+
+                response = self.assertResponse(status_url, follow='auto', view_should_redirect=True)
+                self.assertEqual(response.status_code, status)
+                self.assertEqual(response.url_data.computed.redirect_url, '/')
+                self.assertEqual(response.url_data.computed.final_url, '/')
+
+                response = self.assertResponse(status_url, follow=False, expected_status=status)
+                self.assertEqual(response.url_data.computed.redirect_url, '/')
+
+        with self.subTest('Follow - Absolute redirect url - Server is updated'):
+            response = self.assertResponse('django_expanded_test_cases:redirect-to-absolute-url', return_format='json')
+
+            self.assertEqual(response.json_content, {'host': 'testserver:8443', 'secure': True})
+
+            # AsyncClient requests always use the default test server host, so only the scheme is updated.
+            response = self.assertAsyncResponse('django_expanded_test_cases:redirect-to-absolute-url')
+
+            self.assertTrue(response.json()['secure'])
+
+        with self.subTest('With max_redirects'):
+            response = self.assertResponse(redirect_url, max_redirects=1)
+            self.assertEqual(response.redirect_chain, [('/', 302)])
+
+            with self.assertRaises(RedirectCycleError) as err:
+                self.assertResponse(redirect_url, max_redirects=0)
+            self.assertEqual(str(err.exception), 'Too many redirects. Exceeded max_redirects value of 0.')
+
+            # Redirects are followed by the Django test client, then the resulting chain is checked against the limit.
+            chain_url = reverse('django_expanded_test_cases:redirect-chain', args=[2])
+            with patch.object(self.client, 'get', wraps=self.client.get) as mock_get:
+                with self.assertRaises(RedirectCycleError) as err:
+                    self.assertResponse(chain_url, user='test_user', max_redirects=2)
+            self.assertEqual(mock_get.call_count, 4)
+            self.assertEqual(len(err.exception.redirect_chain), 3)
+
+            with patch('django_expanded_test_cases.test_cases.integration_test_case.ETC_MAX_REDIRECTS', 0):
+                with self.assertRaises(RedirectCycleError):
+                    self.assertResponse(redirect_url)
+
+        with self.subTest('With max_redirects - Above Django test client limit'):
+            with self.assertRaises(ValueError) as err:
+                self.assertResponse(redirect_url, max_redirects=21)
+            self.assertEqual(
+                str(err.exception),
+                'Invalid max_redirects value of 21. Must be between 0 and 20 (the Django test client limit).',
+            )
+
+        with self.subTest('Follow - POST with 307/308 redirect - Method and data are kept'):
+            for status in (307, 308):
+                response = self.assertPostResponse(
+                    'django_expanded_test_cases:redirect-to-request-data',
+                    url_args=[status],
+                    data={'field': 'value'},
+                    return_format='json',
+                )
+
+                self.assertEqual(response.json_content, {'method': 'POST', 'data': {'field': 'value'}})
+                self.assertEqual(response.redirect_chain[0][1], status)
+
+        with self.subTest('Follow - POST with 302 redirect - Changed to GET'):
+            response = self.assertPostResponse(
+                'django_expanded_test_cases:redirect-to-request-data',
+                url_args=[302],
+                data={'field': 'value'},
+                return_format='json',
+            )
+
+            self.assertEqual(response.json_content, {'method': 'GET', 'data': {}})
+
+    @patch('django_expanded_test_cases.test_cases.integration_test_case.ETC_LIGHTWEIGHT_CLIENT', True)
+    def test__assertResponse__lightweight_client(self):
+        """
+        Tests assertResponse() function, when LIGHTWEIGHT_CLIENT setting is enabled.
+        """
+        message_url = 'django_expanded_test_cases:response-with-one-message'
+
+        with patch.object(self, '_debug_print_bool', False):
+            with self.subTest('With message assertions - Captures minimal context'):
+                response = self.assertResponse(message_url, expected_messages='This is a test message.')
+
+                self.assertEqual(sorted(response.context.keys()), ['messages'])
+
+                response = self.assertResponse(message_url, expected_not_messages='Not a message.')
+
+                self.assertEqual(sorted(response.context.keys()), ['messages'])
+
+            with self.subTest('Without context assertions - Captures no context'):
+                response = self.assertResponse(message_url, expected_content='This is a test message.')
+
+                self.assertIsNone(response.context)
+
+            with self.subTest('Client capture mode is restored'):
+                self.assertEqual(self.client.context_capture, 'full')
+
+        with patch.object(self, '_debug_print_bool', True):
+            with self.subTest('With debug output - Captures full context'):
+                response = self.assertResponse(message_url)
+
+                self.assertIn('header', response.context)
+
+    def test__assertResponse__debug_logging_level(self):
+        """
+        Tests debug_logging_level and debug_loggers parameters of assertResponse() function.
+        """
+        view_logger = logging.getLogger('etc_testing.views')
+        orig_disable_level = logging.root.manager.disable
+
+        with self.subTest('All loggers - Suppressed during assertion only'):
+            with patch.object(self, '_assertResponse__pre_builtin_tests') as mock_hook:
+                mock_hook.side_effect = lambda *args, **kwargs: self.assertFalse(
+                    view_logger.isEnabledFor(logging.ERROR)
+                )
+                self.assertResponse('django_expanded_test_cases:index', debug_logging_level='ERROR')
+            mock_hook.assert_called_once()
+
+            self.assertEqual(logging.root.manager.disable, orig_disable_level)
+
+        with self.subTest('Provided loggers only'):
+            with patch.object(self, '_assertResponse__pre_builtin_tests') as mock_hook:
+                mock_hook.side_effect = lambda *args, **kwargs: (
+                    self.assertFalse(view_logger.isEnabledFor(logging.ERROR)),
+                    self.assertTrue(logging.getLogger('etc_testing.other').isEnabledFor(logging.ERROR)),
+                )
+                self.assertResponse(
+                    'django_expanded_test_cases:index',
+                    debug_logging_level='ERROR',
+                    debug_loggers=['etc_testing.views'],
+                )
+            mock_hook.assert_called_once()
+
+            self.assertEqual(view_logger.level, logging.NOTSET)
+
+        with self.subTest('Empty loggers - Setting is not used'):
+            with patch(
+                'django_expanded_test_cases.test_cases.integration_test_case.ETC_RESPONSE_DEBUG_LOGGERS',
+                ['etc_testing.views'],
+            ):
+                with patch.object(self, '_assertResponse__pre_builtin_tests') as mock_hook:
+                    mock_hook.side_effect = lambda *args, **kwargs: self.assertTrue(
+                        view_logger.isEnabledFor(logging.ERROR)
+                    )
+                    self.assertResponse(
+                        'django_expanded_test_cases:index',
+                        debug_logging_level='ERROR',
+                        debug_loggers=[],
+                    )
+                mock_hook.assert_called_once()
+
+        with self.subTest('Restored when assertion fails'):
+            with self.assertRaises(AssertionError):
+                self.assertResponse(
+                    'django_expanded_test_cases:index',
+                    expected_status=404,
+                    debug_logging_level='CRITICAL',
+                )
+
+            self.assertEqual(logging.root.manager.disable, orig_disable_level)
+            self.assertTrue(view_logger.isEnabledFor(logging.CRITICAL))
+
     def test__assertGetResponse(self):
         """Tests assertGetResponse() function.
         Note: Most logic in here passes into the assertResponse() function.
@@ -4752,6 +5300,393 @@ class IntegrationAssertionTestCase:
                 str(err.exception),
             )
 
+    def test__assertAccessMatrix__success(self):
+        """
+        Tests assertAccessMatrix() function, in cases when it should succeed.
+        """
+        staff_url = 'django_expanded_test_cases:staff-only'
+
+        with self.subTest('With status codes only'):
+            results = self.assertAccessMatrix(
+                staff_url,
+                {
+                    'test_admin': 200,
+                    'test_user': 403,
+                    'test_inactive_user': 403,
+                    None: 403,
+                },
+            )
+
+            self.assertEqual(
+                results,
+                {staff_url: {'test_admin': 200, 'test_user': 403, 'test_inactive_user': 403, None: 403}},
+            )
+
+        with self.subTest('With multiple urls - Each user only logs in once'):
+            with patch.object(self.client, 'force_login', wraps=self.client.force_login) as mock_force_login:
+                results = self.assertAccessMatrix(
+                    ['django_expanded_test_cases:index', 'django_expanded_test_cases:home'],
+                    {
+                        'test_admin': 200,
+                        'test_user': 200,
+                        None: 200,
+                    },
+                )
+
+            self.assertEqual(mock_force_login.call_count, 2)
+            self.assertEqual(
+                results,
+                {
+                    'django_expanded_test_cases:index': {'test_admin': 200, 'test_user': 200, None: 200},
+                    'django_expanded_test_cases:home': {'test_admin': 200, 'test_user': 200, None: 200},
+                },
+            )
+
+        with self.subTest('With full response spec'):
+            results = self.assertAccessMatrix(
+                staff_url,
+                {
+                    'test_admin': {'expected_status': 200, 'expected_header': 'Staff Page Header'},
+                    'test_user': 403,
+                },
+            )
+
+            self.assertEqual(results, {staff_url: {'test_admin': 200, 'test_user': 403}})
+
+        with self.subTest('With user permissions'):
+            self.assertAccessMatrix(staff_url, {'test_user': 403}, user_permissions=['add_user'])
+
+            self.assertTrue(self.get_user('test_user').has_perm('auth.add_user'))
+
+        with self.subTest('With status codes only - Follow value is used'):
+            redirect_url = 'django_expanded_test_cases:redirect-to-index'
+
+            results = self.assertAccessMatrix(redirect_url, {'test_user': 200, None: 200})
+            self.assertEqual(results, {redirect_url: {'test_user': 200, None: 200}})
+
+            results = self.assertAccessMatrix(redirect_url, {'test_user': 302, None: 302}, follow=False)
+            self.assertEqual(results, {redirect_url: {'test_user': 302, None: 302}})
+
+            with patch('django_expanded_test_cases.test_cases.integration_test_case.ETC_FOLLOW_REDIRECTS', False):
+                results = self.assertAccessMatrix(redirect_url, {'test_user': 302})
+            self.assertEqual(results, {redirect_url: {'test_user': 302}})
+
+        with self.subTest('With status codes only - Max redirects value is used'):
+            with self.assertRaises(RedirectCycleError):
+                self.assertAccessMatrix('django_expanded_test_cases:redirect-to-index', {None: 200}, max_redirects=0)
+
+            with patch('django_expanded_test_cases.test_cases.integration_test_case.ETC_MAX_REDIRECTS', 0):
+                with self.assertRaises(RedirectCycleError):
+                    self.assertAccessMatrix('django_expanded_test_cases:redirect-to-index', {None: 200})
+
+        with self.subTest('With status codes only - Runs hook functions'):
+            with patch.object(self, '_assertResponse__pre_builtin_tests') as mock_pre_hook:
+                with patch.object(self, '_assertResponse__post_builtin_tests') as mock_post_hook:
+                    self.assertAccessMatrix(staff_url, {'test_admin': 200, None: 403})
+
+            self.assertEqual(mock_pre_hook.call_count, 2)
+            self.assertEqual(mock_post_hook.call_count, 2)
+            self.assertEqual(mock_post_hook.call_args_list[0].kwargs['user'], 'test_admin')
+            self.assertEqual(mock_post_hook.call_args_list[0].kwargs['response'].user, self.get_user('test_admin'))
+            self.assertEqual(mock_post_hook.call_args_list[1].kwargs['expected_status'], 403)
+
+    def test__assertAccessMatrix__failure(self):
+        """
+        Tests assertAccessMatrix() function, in cases when it should fail.
+        """
+        staff_url = 'django_expanded_test_cases:staff-only'
+
+        with self.subTest('With status codes only - All mismatches are reported'):
+            with self.assertRaises(AssertionError) as err:
+                self.assertAccessMatrix(
+                    staff_url,
+                    {
+                        'test_admin': 403,
+                        'test_user': 200,
+                        None: 403,
+                    },
+                )
+            self.assertEqual(
+                (
+                    'Access matrix had 2 mismatch(es), out of 3 checked responses:\n'
+                    '  Url "{0}" with user "test_admin":\n'
+                    '    200 != 403 : Expected status code (after potential redirects) of "403". '
+                    'Actual code was "200".\n'
+                    '  Url "{0}" with user "test_user":\n'
+                    '    403 != 200 : Expected status code (after potential redirects) of "200". Actual code was "403".'
+                ).format(staff_url),
+                str(err.exception),
+            )
+
+        with self.subTest('With full response spec'):
+            with self.assertRaises(AssertionError) as err:
+                self.assertAccessMatrix(
+                    staff_url,
+                    {
+                        'test_admin': {'expected_header': 'Wrong Header'},
+                        None: 200,
+                    },
+                )
+            self.assertIn('Access matrix had 2 mismatch(es), out of 2 checked responses:', str(err.exception))
+            self.assertIn('Url "{0}" with user "test_admin":'.format(staff_url), str(err.exception))
+            self.assertIn('Wrong Header', str(err.exception))
+            self.assertIn(
+                (
+                    '  Url "{0}" with user "anonymous":\n'
+                    '    403 != 200 : Expected status code (after potential redirects) of "200". Actual code was "403".'
+                ).format(staff_url),
+                str(err.exception),
+            )
+
+        with self.subTest('With invalid user_expectations'):
+            with self.assertRaises(TypeError):
+                self.assertAccessMatrix(staff_url, ['test_user'])
+
+    def test__assertAsyncResponse(self):
+        """
+        Tests assertAsyncResponse() function.
+        """
+        test_user = self.get_user('test_user')
+
+        with self.subTest('With async view'):
+            response = self.assertAsyncResponse(
+                'django_expanded_test_cases:async-user-detail',
+                url_args=[test_user.pk],
+                user='test_user',
+                expected_title='Async User Detail Page | Test Views',
+                expected_header='Async User Detail Page Header',
+                expected_messages='Loaded user asynchronously.',
+                expected_content='Username: "test_user"',
+            )
+
+            self.assertEqual(response.url_data.computed.initial_url, '/user/async-detail/{0}/'.format(test_user.pk))
+            self.assertEqual(response.user, test_user)
+            self.assertGreater(response.etc_timings.request, 0)
+
+        with self.subTest('With sync view'):
+            response = self.assertAsyncResponse('django_expanded_test_cases:staff-only', user='test_admin')
+
+            self.assertEqual(response.user, self.get_user('test_admin'))
+
+        with self.subTest('With redirect'):
+            response = self.assertAsyncResponse(
+                'django_expanded_test_cases:redirect-to-index',
+                expected_messages='Redirecting to index.',
+            )
+
+            self.assertEqual(response.url_data.computed.redirect_url, '/')
+
+        with self.subTest('With headers'):
+            response = self.assertAsyncResponse(
+                'django_expanded_test_cases:json-response-basic-dict',
+                headers={'X-Test-Header': 'Some Value'},
+            )
+
+            self.assertEqual('Some Value', response.json()['request_headers'].get('X-Test-Header', None))
+
+        with self.subTest('Failure - Fails on first mismatch'):
+            with self.assertRaises(AssertionError) as err:
+                self.assertAsyncResponse('django_expanded_test_cases:staff-only', expected_status=200)
+            self.assertEqual(
+                '403 != 200 : Expected status code (after potential redirects) of "200". Actual code was "403".',
+                str(err.exception),
+            )
+
+        with self.subTest('With POST request'):
+            response = self.assertAsyncResponse(
+                'django_expanded_test_cases:json-response-request-data',
+                get=False,
+                data={'field': 'value'},
+                return_format='json',
+                expected_json={'method': 'POST', 'data': {'field': 'value'}},
+            )
+
+            self.assertEqual(response.json_content, {'method': 'POST', 'data': {'field': 'value'}})
+
+        with self.subTest('With POST request - 307 redirect keeps method and data'):
+            self.assertAsyncResponse(
+                'django_expanded_test_cases:redirect-to-request-data',
+                url_args=[307],
+                get=False,
+                data={'field': 'value'},
+                return_format='json',
+                expected_json={'method': 'POST', 'data': {'field': 'value'}},
+            )
+
+        with self.subTest('With url and redirect assertions'):
+            response = self.assertAsyncResponse(
+                'django_expanded_test_cases:redirect-to-index',
+                expected_url='/redirect/index/',
+                expected_redirect_url='django_expanded_test_cases:index',
+                expected_final_url='/',
+            )
+
+            self.assertEqual(response.redirect_chain, [('/', 302)])
+
+        with self.subTest('With follow values'):
+            response = self.assertAsyncResponse(
+                'django_expanded_test_cases:redirect-to-index',
+                follow=False,
+                expected_status=302,
+            )
+
+            self.assertFalse(hasattr(response, 'redirect_chain'))
+
+            response = self.assertAsyncResponse(
+                'django_expanded_test_cases:redirect-to-index',
+                follow='auto',
+                expected_redirect_url='django_expanded_test_cases:index',
+            )
+
+            self.assertEqual(response.status_code, 302)
+
+        with self.subTest('With max_redirects'):
+            with self.assertRaises(RedirectCycleError):
+                self.assertAsyncResponse('django_expanded_test_cases:redirect-to-index', max_redirects=0)
+
+            with self.assertRaises(ValueError):
+                self.assertAsyncResponse('django_expanded_test_cases:index', max_redirects=21)
+
+        with self.subTest('Runs hook functions'):
+            with patch.object(self, '_assertResponse__pre_builtin_tests') as mock_pre_hook:
+                with patch.object(self, '_assertResponse__post_builtin_tests') as mock_post_hook:
+                    self.assertAsyncResponse('django_expanded_test_cases:index', user='test_user')
+
+            mock_pre_hook.assert_called_once()
+            mock_post_hook.assert_called_once()
+            self.assertEqual(mock_post_hook.call_args.args[0], 'django_expanded_test_cases:index')
+            self.assertEqual(mock_post_hook.call_args.kwargs['user'], 'test_user')
+
+        with self.subTest('With unsupported assertion arg'):
+            with self.assertRaises(ValueError):
+                self.assertAsyncResponse('django_expanded_test_cases:index', expected_max_queries=5)
+
+            with self.assertRaises(ValueError):
+                self.assertAsyncResponse('django_expanded_test_cases:index', assert_no_n_plus_one=True)
+
+    def test__assertResponses__success(self):
+        """
+        Tests assertResponses() function, in cases when it should succeed.
+        """
+        test_user = self.get_user('test_user')
+
+        with self.subTest('With urls only'):
+            responses = self.assertResponses(
+                ['django_expanded_test_cases:index', 'django_expanded_test_cases:home'],
+            )
+
+            self.assertEqual(
+                [response.url_data.computed.initial_url for response in responses],
+                ['/', '/home/'],
+            )
+
+        with self.subTest('With request specs - Responses are in request order'):
+            responses = self.assertResponses(
+                [
+                    {
+                        'url': 'django_expanded_test_cases:async-user-detail',
+                        'url_args': [test_user.pk],
+                        'user': 'test_user',
+                        'expected_content': 'Username: "test_user"',
+                    },
+                    {
+                        'url': 'django_expanded_test_cases:staff-only',
+                        'user': 'test_admin',
+                        'expected_header': 'Staff Page Header',
+                    },
+                    {
+                        'url': 'django_expanded_test_cases:staff-only',
+                        'user': 'test_user',
+                        'expected_status': 403,
+                    },
+                    {
+                        'url': 'django_expanded_test_cases:staff-only',
+                        'auto_login': False,
+                        'expected_status': 403,
+                    },
+                ],
+                concurrency=2,
+            )
+
+            self.assertEqual(
+                [(response.status_code, str(response.user)) for response in responses],
+                [(200, 'test_user'), (200, 'test_admin'), (403, 'test_user'), (403, 'AnonymousUser')],
+            )
+
+        with self.subTest('With POST and json requests'):
+            responses = self.assertResponses(
+                [
+                    {
+                        'url': 'django_expanded_test_cases:json-response-request-data',
+                        'get': False,
+                        'data': {'field': 'value'},
+                        'expected_json': {'method': 'POST', 'data': {'field': 'value'}},
+                        'return_format': 'json',
+                    },
+                    {
+                        'url': 'django_expanded_test_cases:json-response-request-data',
+                        'data': {'field': 'value'},
+                        'expected_json': {'method': 'GET', 'data': {'field': 'value'}},
+                        'return_format': 'json',
+                    },
+                ],
+            )
+
+            self.assertEqual([response.json_content['method'] for response in responses], ['POST', 'GET'])
+
+        with self.subTest('Client is left logged out'):
+            self.assertNotIn(settings.SESSION_COOKIE_NAME, self.client.cookies)
+
+        with self.subTest('With client reset disabled - Session is kept'):
+            session = self.client.session
+            session['etc_testing_session_variable'] = 'Some Value'
+            session.save()
+            self._reset_client_state_on_request = False
+            try:
+                responses = self.assertResponses(
+                    [{'url': 'django_expanded_test_cases:index', 'auto_login': False}],
+                )
+            finally:
+                self._reset_client_state_on_request = True
+
+            self.assertEqual(
+                'Some Value',
+                responses[0].asgi_request.session.get('etc_testing_session_variable', None),
+            )
+            self.assertEqual('Some Value', self.client.session.get('etc_testing_session_variable', None))
+
+        with self.subTest('With invalid concurrency'):
+            with self.assertRaises(ValueError):
+                self.assertResponses(['django_expanded_test_cases:index'], concurrency=0)
+
+    def test__assertResponses__failure(self):
+        """
+        Tests assertResponses() function, in cases when it should fail.
+        """
+        staff_url = 'django_expanded_test_cases:staff-only'
+
+        with self.subTest('All mismatches are reported'):
+            with self.assertRaises(AssertionError) as err:
+                self.assertResponses(
+                    [
+                        {'url': staff_url, 'user': 'test_admin', 'expected_status': 403},
+                        {'url': staff_url, 'user': 'test_admin'},
+                        {'url': staff_url, 'auto_login': False},
+                    ]
+                )
+            self.assertEqual(
+                (
+                    'Batch responses had 2 mismatch(es), out of 3 checked responses:\n'
+                    '  Url "/auth/staff-only/" with user "test_admin":\n'
+                    '    200 != 403 : Expected status code (after potential redirects) of "403". '
+                    'Actual code was "200".\n'
+                    '  Url "/auth/staff-only/" with user "anonymous":\n'
+                    '    403 != 200 : Expected status code (after potential redirects) of "200". '
+                    'Actual code was "403".'
+                ),
+                str(err.exception),
+            )
+
     # endregion Response Assertion Tests
 
     # region Element Assertion Tests
@@ -4781,6 +5716,24 @@ class IntegrationAssertionTestCase:
                 expected_redirect_url='django_expanded_test_cases:index',
             )
 
+        with self.subTest('With followed response - Redirect target is not re-fetched'):
+            response = self.assertResponse('django_expanded_test_cases:redirect-to-index')
+
+            with patch.object(self.client, 'get', wraps=self.client.get) as mock_get:
+                with patch.object(self, '_get_page_response', wraps=self._get_page_response) as mock_page_response:
+                    self.assertRedirects(response, expected_redirect_url='django_expanded_test_cases:index')
+                    self.assertRedirects(response, '/', target_status_code=200)
+            self.assertEqual(mock_get.call_count, 0)
+            self.assertEqual(mock_page_response.call_count, 0)
+
+            with self.assertRaises(AssertionError):
+                self.assertRedirects(response, '/', target_status_code=404)
+
+        with self.subTest('With async response'):
+            response = self.assertAsyncResponse('django_expanded_test_cases:redirect-to-index')
+
+            self.assertRedirects(response, expected_redirect_url='django_expanded_test_cases:index')
+
     def test__assertResponseRedirects__failure(self):
         """
         Tests assertResponseRedirects() function, in cases when it should fail.
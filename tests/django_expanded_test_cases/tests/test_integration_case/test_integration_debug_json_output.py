@@ -2045,6 +2045,63 @@ class TestIntegrationDebugJsonOutput(IntegrationTestCase, IntegrationDebugOutput
         # Passed. Strip content section.
         actual_text = actual_text.replace(expected_text, '')
 
+    @skipIf(not settings.DJANGO_EXPANDED_TESTCASES_DEBUG_PRINT, 'Test only works as expected with DEBUG PRINT.')
+    @patch('django_expanded_test_cases.mixins.core_mixin.ETC_DEBUG_PRINT__COLOR', False)
+    @patch('django_expanded_test_cases.mixins.response_mixin.ETC_DEBUG_PRINT__COLOR', False)
+    @patch('django_expanded_test_cases.mixins.response_mixin.ETC_RESPONSE_DEBUG_JSON_TYPE_MISMATCH_COLOR', '')
+    @patch('django_expanded_test_cases.mixins.response_mixin.ETC_RESPONSE_DEBUG_JSON_LENGTH_MISMATCH_COLOR', '')
+    @patch('django_expanded_test_cases.mixins.response_mixin.ETC_RESPONSE_DEBUG_JSON_CONTENT_MISMATCH_COLOR', '')
+    @unittest.mock.patch('sys.stdout', new_callable=io.StringIO)
+    def test__json_debug_output__highlighting__basic_dict__without_color(self, mock_stdout):
+        """Verifying output of assertResponse, with different failure types.
+
+        This one tests that JSON mismatches are still marked when console coloring is disabled.
+        """
+
+        # Force assertion error so we can check debug output.
+        with self.assertRaises(AssertionError):
+            self.assertJsonResponse(
+                'django_expanded_test_cases:json-response-basic-dict',
+                expected_url='/json/basic-dict/',
+                expected_json={
+                    "success": "Test",
+                    "test_list": [
+                        "Sublist Item 1",
+                        "Sublist Item 2",
+                    ],
+                    "request_headers": "Test",
+                    "none_type": None,
+                    "int_type": 5,
+                },
+            )
+
+        # Stdout (aka console debug print out) is being captured by above unittest.mock.
+        actual_text = mock_stdout.getvalue()
+
+        with self.subTest('Test content section'):
+            # Check for content section.
+            expected_text = (
+                '========== response.content ==========\n'
+                '{0}\n'
+                '  "success": "{{+This is a test Json response.+}}",\n'
+                '  "test_list":\n'
+                '  [  {{+length mismatch+}}\n'
+                '    "Sublist Item 1",\n'
+                '    "Sublist Item 2",\n'
+                '    "{{+Sublist Item 3+}}",\n'
+                '  ],\n'
+                '  "request_headers":\n'
+                '  {0}  {{+type mismatch+}}\n'
+                '    "{{+Cookie+}}": "{{++}}",\n'
+                '    "{{+Content-Type+}}": "{{+application/json+}}",\n'
+                '    "{{+Accept+}}": "{{+application/json+}}",\n'
+                '  {1},\n'
+                '  "none_type": None,\n'
+                '  "int_type": 5,\n'
+                '{1}\n'
+            ).format('{', '}')
+            self.assertIn(expected_text, actual_text)
+
     # endregion Dict as Base
 
     # region List as Base
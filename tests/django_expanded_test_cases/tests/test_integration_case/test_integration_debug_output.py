@@ -10,6 +10,7 @@ from unittest.mock import patch
 # Third-Party Imports.
 from django import VERSION as django_version
 from django.conf import settings
+from django.contrib.auth.models import Permission
 from django.test import override_settings
 
 # Internal Imports.
@@ -2171,8 +2172,8 @@ class TestIntegrationDebugOutput(IntegrationTestCase, IntegrationDebugOutputTest
                 '    * Last: "SuperUserLast"\n'
                 '    * Email: "super_user@example.com"\n'
                 '    * is_authenticated: True\n'
-                '    * User Groups: <QuerySet []>\n'
-                '    * User Permissions: <QuerySet []>\n'
+                '    * User Groups: []\n'
+                '    * User Permissions: []\n'
                 '\n'
                 '\n'
             )
@@ -2433,8 +2434,8 @@ class TestIntegrationDebugOutput(IntegrationTestCase, IntegrationDebugOutputTest
                 '    * Last: "AdminUserLast"\n'
                 '    * Email: "admin_user@example.com"\n'
                 '    * is_authenticated: True\n'
-                '    * User Groups: <QuerySet []>\n'
-                '    * User Permissions: <QuerySet []>\n'
+                '    * User Groups: []\n'
+                '    * User Permissions: []\n'
                 '\n'
                 '\n'
             )
@@ -2695,8 +2696,8 @@ class TestIntegrationDebugOutput(IntegrationTestCase, IntegrationDebugOutputTest
                 '    * Last: "UserLast"\n'
                 '    * Email: "user@example.com"\n'
                 '    * is_authenticated: True\n'
-                '    * User Groups: <QuerySet []>\n'
-                '    * User Permissions: <QuerySet []>\n'
+                '    * User Groups: []\n'
+                '    * User Permissions: []\n'
                 '\n'
                 '\n'
             )
@@ -2705,6 +2706,34 @@ class TestIntegrationDebugOutput(IntegrationTestCase, IntegrationDebugOutputTest
         # Passed. Strip user section.
         actual_text = actual_text.replace(expected_text, '')
 
+    @unittest.mock.patch('sys.stdout', new_callable=io.StringIO)
+    def test__general_debug_output__different_users__many_permissions(self, mock_stdout):
+        """Verifying output of user info section, with more Permissions than are displayed."""
+        permission_codenames = list(
+            Permission.objects.order_by('content_type__app_label', 'content_type__model', 'codename').values_list(
+                'codename',
+                flat=True,
+            )[:25]
+        )
+        self.add_user_permissions(permission_codenames, user=self.test_user)
+
+        self.show_debug_user_info(self.test_user)
+
+        actual_text = self.strip_text_colors(mock_stdout.getvalue())
+
+        with self.subTest('Output is a plain list, truncated the same as a QuerySet repr'):
+            self.assertIn('    * User Groups: []\n', actual_text)
+            self.assertNotIn('<QuerySet', actual_text)
+            self.assertIn(
+                '    * User Permissions: [{0}, \'...(remaining elements truncated)...\']\n'.format(
+                    ', '.join(
+                        repr(permission)
+                        for permission in Permission.objects.filter(codename__in=permission_codenames[:20])
+                    ),
+                ),
+                actual_text,
+            )
+
     # endregion Different Users
 
     # region Form Handling
@@ -9768,3 +9797,82 @@ class TestIntegrationDebugOutput__WithStdOutSeparator(IntegrationTestCase, Integ
 
 
 # TODO: Unsure how to verify ETC_DEBUG_PRINT__TEST_SEPARATOR and ETC_DEBUG_PRINT__LOGGING_SEPARATOR at this time.
+
+
+class TestIntegrationDebugOutput__WithBackgroundRender(IntegrationTestCase, IntegrationDebugOutputTestCase):
+    """Tests for IntegrationTestCase class "debug output" logic, when rendering output in a background thread."""
+
+    @patch('django_expanded_test_cases.mixins.core_mixin.ETC_AUTO_GENERATE_USERS_IN_SETUPTESTDATA', True)
+    @patch('django_expanded_test_cases.mixins.core_mixin.ETC_DEBUG_PRINT__BACKGROUND_RENDER', True)
+    def setUp(self, *args, **kwargs):
+        """Override setting for background rendering."""
+        super().setUp(*args, **kwargs)
+
+    @unittest.mock.patch('sys.stdout', new_callable=io.StringIO)
+    def test__debug_output__background_render(self, mock_stdout):
+        """Verifying output of assertResponse, when held for background rendering."""
+
+        # Set error output to not truncate text comparison errors for these tests.
+        self.maxDiff = None
+
+        # Force assertion error so we can check debug output.
+        with self.assertRaises(AssertionError):
+            self.assertGetResponse(
+                'django_expanded_test_cases:template-response-home',
+                expected_title='Testing',
+            )
+
+        with self.subTest('Test output is held until displayed'):
+            self.assertEqual('', mock_stdout.getvalue())
+
+        # Display held output, as normally occurs on test tearDown.
+        self._display_held_debug_output()
+        full_text = mock_stdout.getvalue()
+        actual_text = self.strip_text_colors(full_text)
+
+        with self.subTest('Test url section'):
+            # Check for url section.
+            expected_text = (
+                '------------------------------------------------------------\n'
+                'Attempting to access url "127.0.0.1/template-response/home/"\n'
+                '------------------------------------------------------------\n'
+                '\n'
+            )
+            self.assertTextStartsWith(expected_text, actual_text)
+
+        # Passed. Strip url section.
+        actual_text = actual_text.replace(expected_text, '')
+
+        with self.subTest('Test content section'):
+            # Check for content section, rendered in background thread.
+            expected_text = (
+                '========== response.content ==========\n'
+                '<head>\n'
+                ' <meta charset="utf-8">\n'
+                ' <title>Home Page | Test Views</title>\n'
+                '</head>\n'
+                '<body>\n'
+                ' <h1>Home Page Header</h1>\n'
+                ' <p>Pretend this is the project landing page.</p>\n'
+                '</body>\n'
+                '\n'
+                '\n'
+                '========== response.headers ==========\n'
+            )
+            self.assertTextStartsWith(expected_text, actual_text)
+
+        with self.subTest('Test error section is still displayed last'):
+            self.assertTextEndsWith(
+                (
+                    "========== TestIntegrationDebugOutput__WithBackgroundRender UnitTesting AssertionError ==========\n"
+                    "Expected title HTML contents of \"Testing\" (using exact matching). "
+                    "Actual value was \"Home Page | Test Views\".\n"
+                    "\n"
+                    "\n"
+                ),
+                actual_text,
+            )
+
+        with self.subTest('Test held output is cleared after display'):
+            self._display_held_debug_output()
+            self.assertEqual(full_text, mock_stdout.getvalue())
@@ -3,16 +3,46 @@ Tests for IntegrationTestCase class "helper function" utilities and logic.
 """
 
 # System Imports.
+import json
 import logging
-from unittest.mock import patch
+import os
+import tempfile
+import warnings
+from contextlib import redirect_stderr
+from io import StringIO
+from unittest.mock import MagicMock, patch
 
 # Third-Party Imports.
+import django.test.client
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser, Group, Permission
 from django.contrib.contenttypes.models import ContentType
 from django.http import HttpResponse
+from django.test import override_settings
+from django.test.client import RedirectCycleError
+from django.urls import reverse
 
 # Internal Imports.
 from django_expanded_test_cases import IntegrationTestCase
+from django_expanded_test_cases.test_cases.integration_test_case import (
+    IntegrationClient,
+    QueryRecorder,
+    ResponseTimings,
+    _async_follow_redirects,
+    _get_query_origin,
+    _get_response_timings_report,
+    _show_response_timings_report,
+    fingerprint_sql,
+    format_response_timings_report,
+    suppress_logging,
+)
+from django_expanded_test_cases.mixins.response_mixin import (
+    _append_slash_warnings,
+    _cached_reverse,
+    _show_append_slash_warning_summary,
+)
+from django_expanded_test_cases.pytest_plugin import pytest_terminal_summary
 
 
 class IntegrationHelperTestCase:
@@ -286,6 +316,439 @@ class IntegrationHelperTestCase:
             # Verify other users are unaffected.
             self.assertFalse(self.test_superuser.groups.all().exists())
 
+    def test___reset_client_state(self):
+        """
+        Tests _reset_client_state() function.
+        """
+        with self.subTest('With no session - Nothing to reset'):
+            with patch.object(self.client, 'logout') as mock_logout:
+                self._reset_client_state()
+                response = self.assertResponse('django_expanded_test_cases:index', auto_login=False)
+
+            mock_logout.assert_not_called()
+            self.assertTrue(response.context['user'].is_anonymous)
+
+        with self.subTest('With logged in user - Cookies are reset without full logout'):
+            self.client.force_login(self.test_user)
+            self.assertIn('_auth_user_id', self.client.session.keys())
+
+            with patch.object(self.client, 'logout') as mock_logout:
+                self._reset_client_state()
+
+            mock_logout.assert_not_called()
+            self.assertEqual(len(self.client.cookies), 0)
+            self.assertNotIn('_auth_user_id', self.client.session.keys())
+
+            response = self.assertResponse('django_expanded_test_cases:index', auto_login=False)
+            self.assertTrue(response.context['user'].is_anonymous)
+
+    def test__get_response_timings(self):
+        """
+        Tests response timing recording and get_response_timings() function.
+        """
+        # Class timings also include any earlier tests in class.
+        initial_class_count = self.get_response_timings(scope='class')['count']
+
+        with self.subTest('No responses - All timings are zero'):
+            timings_summary = self.get_response_timings()
+
+            self.assertEqual(timings_summary['count'], 0)
+            self.assertEqual(timings_summary['total'], 0)
+            for phase in ResponseTimings.phases:
+                self.assertEqual(timings_summary[phase], 0)
+
+        with self.subTest('Single response - Timings saved to response'):
+            response = self.assertResponse('django_expanded_test_cases:index', expected_content='Index')
+
+            self.assertIsInstance(response.etc_timings, ResponseTimings)
+            self.assertEqual(response.etc_timings.url, '/')
+            self.assertEqual(response.etc_timings.test_id, self.id())
+            self.assertGreater(response.etc_timings.request, 0)
+            self.assertGreater(response.etc_timings.normalization, 0)
+            self.assertGreater(response.etc_timings.assertions, 0)
+            self.assertGreaterEqual(
+                response.etc_timings.total,
+                sum(getattr(response.etc_timings, phase) for phase in ResponseTimings.exclusive_phases),
+            )
+
+            timings_summary = self.get_response_timings()
+            self.assertEqual(timings_summary['count'], 1)
+            self.assertEqual(timings_summary, {**response.etc_timings.as_dict(), 'count': 1})
+
+        with self.subTest('Multiple responses - Timings are summed'):
+            response_2 = self.assertResponse('django_expanded_test_cases:login')
+
+            timings_summary = self.get_response_timings()
+            self.assertEqual(timings_summary['count'], 2)
+            self.assertAlmostEqual(timings_summary['total'], response.etc_timings.total + response_2.etc_timings.total)
+            self.assertEqual(self.get_response_timings(scope='class')['count'], initial_class_count + 2)
+
+        with self.subTest('Run scope - Only recorded when setting is enabled'):
+            with patch('django_expanded_test_cases.test_cases.integration_test_case._recorded_response_timings', []):
+                self.assertResponse('django_expanded_test_cases:index')
+                self.assertEqual(self.get_response_timings(scope='run')['count'], 0)
+
+                with patch(
+                    'django_expanded_test_cases.test_cases.integration_test_case.ETC_RESPONSE_TIMINGS_REPORT',
+                    True,
+                ):
+                    self.assertResponse('django_expanded_test_cases:index')
+                self.assertEqual(self.get_response_timings(scope='run')['count'], 1)
+
+        with self.subTest('Invalid scope'):
+            with self.assertRaises(ValueError):
+                self.get_response_timings(scope='invalid')
+
+    def test__format_response_timings_report(self):
+        """
+        Tests format_response_timings_report() function.
+        """
+        timings_list = []
+        for url, duration in (('/slow/', 30), ('/fast/', 5), ('/slow/', 10)):
+            timings = ResponseTimings()
+            timings.url = url
+            timings.request = duration
+            timings.user_setup = 1
+            timings.normalization = 2
+            timings.total = duration + 1
+            timings_list.append(timings)
+
+        report = format_response_timings_report(timings_list, url_count=1)
+
+        self.assertText(
+            (
+                'Response timings for 3 assertResponse call(s), 48.00 ms total.\n'
+                '\n'
+                'Slowest phases:\n'
+                '    request: 45.00 ms\n'
+                '    user_setup: 3.00 ms\n'
+                '    url_handling: 0.00 ms\n'
+                '    debug_print: 0.00 ms\n'
+                '    assertions: 0.00 ms\n'
+                '    (normalization, within above phases: 6.00 ms)\n'
+                '\n'
+                'Slowest urls:\n'
+                '    /slow/: 42.00 ms total, 21.00 ms average, 31.00 ms max, over 2 call(s)\n'
+            ),
+            report,
+        )
+
+        with self.subTest('End of run report - Pytest plugin'):
+            terminalreporter = MagicMock()
+            with patch(
+                'django_expanded_test_cases.test_cases.integration_test_case._recorded_response_timings',
+                timings_list,
+            ):
+                with patch('django_expanded_test_cases.pytest_plugin.atexit.unregister') as mock_unregister:
+                    pytest_terminal_summary(terminalreporter)
+
+            terminalreporter.write_line.assert_any_call(
+                'DjangoETC: {0}'.format(format_response_timings_report(timings_list)),
+            )
+            mock_unregister.assert_any_call(_show_response_timings_report)
+
+        with self.subTest('End of run report - No timings recorded'):
+            with patch('django_expanded_test_cases.test_cases.integration_test_case._recorded_response_timings', []):
+                self.assertIsNone(_get_response_timings_report())
+
+    def test__benchmarkResponse(self):
+        """
+        Tests benchmarkResponse() function.
+        """
+        with self.subTest('Requests are repeated, without repeating user and url handling'):
+            with patch.object(self, '_sample_request', wraps=self._sample_request) as mock_sample:
+                with patch.object(self, '_get_login_user', wraps=self._get_login_user) as mock_login:
+                    results = self.benchmarkResponse(
+                        'django_expanded_test_cases:user-list',
+                        user='test_user',
+                        iterations=10,
+                        warmup=2,
+                    )
+
+            mock_login.assert_called_once()
+            # Warmup requests, then timed requests, then one memory allocation request.
+            self.assertEqual(mock_sample.call_count, 2 + 10 + 1)
+
+        with self.subTest('Results'):
+            self.assertEqual(results['test_id'], self.id())
+            self.assertEqual(results['url'], '/user/list/')
+            self.assertEqual(results['method'], 'GET')
+            self.assertEqual(results['user'], 'test_user')
+            self.assertEqual(results['iterations'], 10)
+            self.assertEqual(results['warmup'], 2)
+            self.assertEqual(
+                sorted(results['duration_ms'].keys()),
+                ['max', 'mean', 'min', 'p50', 'p95', 'p99'],
+            )
+            self.assertLessEqual(results['duration_ms']['min'], results['duration_ms']['p50'])
+            self.assertLessEqual(results['duration_ms']['p50'], results['duration_ms']['p95'])
+            self.assertLessEqual(results['duration_ms']['p95'], results['duration_ms']['p99'])
+            self.assertLessEqual(results['duration_ms']['p99'], results['duration_ms']['max'])
+            self.assertEqual(results['queries'], get_user_model().objects.count() + 1)
+            self.assertGreater(results['content_bytes'], 0)
+            self.assertGreater(results['peak_allocated_bytes'], 0)
+
+        with self.subTest('Already tracing, without tracemalloc.reset_peak() - Memory is not measured'):
+            with patch(
+                'django_expanded_test_cases.test_cases.integration_test_case.tracemalloc',
+                spec=['is_tracing', 'start', 'stop', 'get_traced_memory'],
+            ) as mock_tracemalloc:
+                mock_tracemalloc.is_tracing.return_value = True
+                mock_tracemalloc.get_traced_memory.return_value = (0, 0)
+
+                results = self.benchmarkResponse('django_expanded_test_cases:index', iterations=1, warmup=0)
+
+            self.assertIsNone(results['peak_allocated_bytes'])
+            mock_tracemalloc.start.assert_not_called()
+            mock_tracemalloc.stop.assert_not_called()
+
+        with self.subTest('Results are appended to output file'):
+            with tempfile.TemporaryDirectory() as temp_dir:
+                output_path = os.path.join(temp_dir, 'benchmarks.jsonl')
+
+                self.benchmarkResponse(
+                    'django_expanded_test_cases:index',
+                    iterations=1,
+                    warmup=0,
+                    output_file=output_path,
+                )
+                with patch(
+                    'django_expanded_test_cases.test_cases.integration_test_case.ETC_BENCHMARK_OUTPUT_FILE',
+                    output_path,
+                ):
+                    self.benchmarkResponse(
+                        'django_expanded_test_cases:index',
+                        get=False,
+                        auto_login=False,
+                        iterations=1,
+                        warmup=0,
+                    )
+
+                with open(output_path, 'r') as output_file:
+                    lines = output_file.readlines()
+
+            self.assertEqual(len(lines), 2)
+            self.assertEqual(json.loads(lines[0])['method'], 'GET')
+            self.assertEqual(json.loads(lines[1])['method'], 'POST')
+            self.assertEqual(json.loads(lines[1])['user'], 'anonymous')
+            self.assertEqual(json.loads(lines[1])['iterations'], 1)
+
+        with self.subTest('Invalid iterations'):
+            with self.assertRaises(ValueError):
+                self.benchmarkResponse('django_expanded_test_cases:index', iterations=0)
+
+    def test__IntegrationClient__context_capture(self):
+        """
+        Tests template context capture modes of IntegrationClient class.
+        """
+        self.assertIsInstance(self.client, IntegrationClient)
+        form_url = reverse('django_expanded_test_cases:response-with-basic-form')
+        message_url = reverse('django_expanded_test_cases:response-with-one-message')
+
+        with self.subTest('Full capture - Same as Django test client'):
+            response = self.client.get(form_url)
+
+            self.assertEqual(response.context['header'], 'Basic Form Page')
+            self.assertIn('form', response.context)
+            self.assertGreater(len(response.templates), 0)
+
+        with self.subTest('Minimal capture - Only messages and forms of top-level template'):
+            self.client.context_capture = 'minimal'
+            response = self.client.get(form_url)
+
+            self.assertEqual(sorted(response.context.keys()), ['form', 'messages'])
+            self.assertEqual(response.templates[0].name, 'django_expanded_test_cases/form.html')
+
+            response = self.client.get(message_url)
+
+            self.assertEqual(sorted(response.context.keys()), ['messages'])
+            self.assertEqual(self.get_context_messages(response), ['This is a test message.'])
+
+        with self.subTest('No capture'):
+            self.client.context_capture = 'none'
+            response = self.client.get(form_url)
+
+            self.assertIsNone(response.context)
+            self.assertEqual(response.templates, [])
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.resolver_match.url_name, 'response-with-basic-form')
+
+        for context_capture in ('minimal', 'none'):
+            with self.subTest('{0} capture - View raises exception'.format(context_capture.capitalize())):
+                self.client.context_capture = context_capture
+                orig_store_rendered_templates = django.test.client.store_rendered_templates
+
+                # Same as the Django test client, the view exception is raised.
+                with self.assertRaisesMessage(ValueError, 'Simulated view error.'):
+                    self.client.get(reverse('django_expanded_test_cases:response-with-error'))
+
+                # Template render receiver is restored, even on error.
+                self.assertIs(django.test.client.store_rendered_templates, orig_store_rendered_templates)
+
+                # Or with exceptions disabled, the error response is returned.
+                self.client.raise_request_exception = False
+                try:
+                    response = self.client.get(reverse('django_expanded_test_cases:response-with-error'))
+                finally:
+                    self.client.raise_request_exception = True
+
+                self.assertEqual(response.status_code, 500)
+                self.assertEqual(response.resolver_match.url_name, 'response-with-error')
+
+                # Later requests are unaffected.
+                response = self.client.get(form_url)
+                self.assertEqual(response.status_code, 200)
+
+        with self.subTest('Invalid capture mode'):
+            self.client.context_capture = 'partial'
+            with self.assertRaises(ValueError):
+                self.client.get(form_url)
+
+        self.client.context_capture = 'full'
+
+    def test__suppress_logging(self):
+        """
+        Tests suppress_logging() context manager.
+        """
+        view_logger = logging.getLogger('etc_testing.views')
+        child_logger = logging.getLogger('etc_testing.views.child')
+        other_logger = logging.getLogger('etc_testing.other')
+        orig_disable_level = logging.root.manager.disable
+
+        with self.subTest('All loggers'):
+            with suppress_logging('WARNING'):
+                self.assertFalse(view_logger.isEnabledFor(logging.WARNING))
+                self.assertFalse(other_logger.isEnabledFor(logging.WARNING))
+                self.assertTrue(other_logger.isEnabledFor(logging.ERROR))
+
+            self.assertTrue(view_logger.isEnabledFor(logging.WARNING))
+            self.assertEqual(logging.root.manager.disable, orig_disable_level)
+
+        with self.subTest('Provided loggers only'):
+            with suppress_logging(logging.CRITICAL, loggers='etc_testing.views'):
+                self.assertFalse(view_logger.isEnabledFor(logging.CRITICAL))
+                self.assertFalse(child_logger.isEnabledFor(logging.CRITICAL))
+                self.assertTrue(other_logger.isEnabledFor(logging.CRITICAL))
+
+            self.assertEqual(view_logger.level, logging.NOTSET)
+            self.assertTrue(child_logger.isEnabledFor(logging.CRITICAL))
+
+        with self.subTest('Restored on exception'):
+            with self.assertRaises(AssertionError):
+                with suppress_logging('CRITICAL'):
+                    with suppress_logging('ERROR', loggers=['etc_testing.views']):
+                        self.fail('Simulated assertion failure.')
+
+            self.assertEqual(logging.root.manager.disable, orig_disable_level)
+            self.assertEqual(view_logger.level, logging.NOTSET)
+
+        with self.subTest('No level - Logging left as-is'):
+            with suppress_logging(None):
+                self.assertEqual(logging.root.manager.disable, orig_disable_level)
+
+        with self.subTest('Invalid level'):
+            with self.assertRaises(ValueError):
+                with suppress_logging('LOUD'):
+                    pass
+
+    def test__fingerprint_sql(self):
+        """
+        Tests fingerprint_sql() function.
+        """
+        with self.subTest('Params and literals are normalized'):
+            self.assertText(
+                'SELECT ? FROM "user" WHERE "id" = ? AND "name" = ? LIMIT ?',
+                fingerprint_sql('SELECT 1 FROM "user" WHERE "id" = %s AND "name" = \'it\'\'s\' LIMIT 21'),
+            )
+
+        with self.subTest('Value lists of any length are equal'):
+            self.assertText(
+                'SELECT * FROM "user" WHERE "id" IN (...)',
+                fingerprint_sql('SELECT * FROM "user" WHERE "id" IN (%s, %s, %s)'),
+            )
+            self.assertText(
+                fingerprint_sql('SELECT * FROM "user" WHERE "id" IN (%s)'),
+                fingerprint_sql('SELECT * FROM "user" WHERE "id" IN (1, 2)'),
+            )
+            self.assertText(
+                'INSERT INTO "user" ("name", "age") VALUES (...)',
+                fingerprint_sql('INSERT INTO "user" ("name", "age") VALUES (%s, %s), (%s, %s)'),
+            )
+
+        with self.subTest('Identifiers and whitespace'):
+            self.assertText(
+                'SELECT "app_v2"."id" FROM "app_v2"',
+                fingerprint_sql('SELECT   "app_v2"."id"\n    FROM "app_v2"  '),
+            )
+
+    def test___get_query_origin(self):
+        """
+        Tests _get_query_origin() function.
+        """
+
+        with self.subTest('Called from project code - Is calling location'):
+            origin = _get_query_origin()
+
+            self.assertTrue(origin.startswith('{0}:'.format(__file__)))
+            self.assertTrue(origin.endswith(' in test___get_query_origin'))
+
+        with self.subTest('Called from a query - Is project location of query'):
+            with QueryRecorder().record() as query_recorder:
+                list(get_user_model().objects.filter(username='test_user'))
+
+            self.assertEqual(len(query_recorder.queries), 1)
+            self.assertTrue(query_recorder.queries[0].origin.startswith('{0}:'.format(__file__)))
+
+    def test___async_follow_redirects(self):
+        """
+        Tests _async_follow_redirects() function, used for AsyncClient redirects on Django versions before 5.0.
+        """
+
+        def follow(url, data=None, get=True):
+            async def send_request():
+                request_method = self.async_client.get if get else self.async_client.post
+                response = await request_method(url, data=data, secure=True)
+                return await _async_follow_redirects(self.async_client, response, data=data, secure=True)
+
+            return async_to_sync(send_request)()
+
+        with self.subTest('Redirect chain is followed'):
+            response = follow(reverse('django_expanded_test_cases:redirect-to-index'))
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.redirect_chain, [('/', 302)])
+
+        for status in (307, 308):
+            with self.subTest('POST with {0} redirect - Method and data are kept'.format(status)):
+                response = follow(
+                    reverse('django_expanded_test_cases:redirect-to-request-data', args=[status]),
+                    data={'field': 'value'},
+                    get=False,
+                )
+
+                self.assertEqual(response.json(), {'method': 'POST', 'data': {'field': 'value'}})
+
+        with self.subTest('POST with 302 redirect - Changed to GET'):
+            response = follow(
+                reverse('django_expanded_test_cases:redirect-to-request-data', args=[302]),
+                data={'field': 'value'},
+                get=False,
+            )
+
+            self.assertEqual(response.json(), {'method': 'GET', 'data': {}})
+
+        with self.subTest('Absolute url - Scheme is kept'):
+            response = follow(reverse('django_expanded_test_cases:redirect-to-absolute-url'))
+
+            self.assertTrue(response.json()['secure'])
+
+        with self.subTest('Too many redirects'):
+            # Redirect chain view only continues the chain for authenticated users.
+            self.async_client.force_login(get_user_model().objects.get(username='test_user'))
+
+            with self.assertRaises(RedirectCycleError):
+                follow(reverse('django_expanded_test_cases:redirect-chain', args=[25]))
+
     def test__get_page_title__empty_title(self):
         """
         Tests get_page_title() function, when page title is empty.
@@ -801,6 +1264,130 @@ class IntegrationHelperTestCase:
             self.assertText('https://abcd.efghijk/lmnop/qrs.tuv.wx/yz/my/cool/url/', url)
             self.site_root_url = default_site_root
 
+    def test__standardize_url__reverse_cache(self):
+        """
+        Tests standardize_url() function, when repeatedly resolving the same urls.
+        """
+        _cached_reverse.cache_clear()
+
+        with self.subTest('Route name - Only reversed once'):
+            with patch('django_expanded_test_cases.mixins.response_mixin.reverse', wraps=reverse) as mock_reverse:
+                for index in range(3):
+                    url = self.standardize_url('django_expanded_test_cases:index', append_root=False)
+                    self.assertText('/', url)
+
+            self.assertEqual(mock_reverse.call_count, 1)
+
+        with self.subTest('Route name with args - Each set of args is reversed once'):
+            with patch('django_expanded_test_cases.mixins.response_mixin.reverse', wraps=reverse) as mock_reverse:
+                for index in range(3):
+                    url = self.standardize_url(
+                        'django_expanded_test_cases:response-with-args',
+                        url_args=(1, 'test'),
+                        append_root=False,
+                    )
+                    self.assertText('/views/1/test/', url)
+                    url = self.standardize_url(
+                        'django_expanded_test_cases:response-with-args',
+                        url_kwargs={'id': 2, 'name': 'test'},
+                        append_root=False,
+                    )
+                    self.assertText('/views/2/test/', url)
+
+            self.assertEqual(mock_reverse.call_count, 2)
+
+        with self.subTest('Route name with args - Equal values of different types are cached separately'):
+            for index in range(2):
+                for url_arg, expected_url in ((1, '/views/1/1/'), (True, '/views/1/True/'), (1.0, '/views/1/1.0/')):
+                    url = self.standardize_url(
+                        'django_expanded_test_cases:response-with-args',
+                        url_args=(1, url_arg),
+                        append_root=False,
+                    )
+                    self.assertText(expected_url, url)
+                    url = self.standardize_url(
+                        'django_expanded_test_cases:response-with-args',
+                        url_kwargs={'id': 1, 'name': url_arg},
+                        append_root=False,
+                    )
+                    self.assertText(expected_url, url)
+
+        with self.subTest('Literal url - Failed reverse is also cached'):
+            with patch('django_expanded_test_cases.mixins.response_mixin.reverse', wraps=reverse) as mock_reverse:
+                for index in range(3):
+                    url = self.standardize_url('/my/cool/url/', append_root=False)
+                    self.assertText('/my/cool/url/', url)
+
+            self.assertEqual(mock_reverse.call_count, 1)
+
+        with self.subTest('Changing project urls - Cache is cleared'):
+            self.assertGreater(_cached_reverse.cache_info().currsize, 0)
+
+            with override_settings(ROOT_URLCONF='tests.django_expanded_test_cases.testing.urls'):
+                self.assertEqual(_cached_reverse.cache_info().currsize, 0)
+
+    @patch('django_expanded_test_cases.mixins.response_mixin.ETC_DEDUPLICATE_APPEND_SLASH_WARNINGS', True)
+    @patch.dict(_append_slash_warnings, clear=True)
+    def test__standardize_url__deduplicated_warnings(self):
+        """
+        Tests standardize_url() function, when the same APPEND_SLASH warning would be raised multiple times.
+        """
+
+        with self.subTest('Literal url - Only warns once'):
+            with warnings.catch_warnings(record=True) as warning_info:
+                warnings.simplefilter('always')
+                for index in range(3):
+                    self.standardize_url('/my/cool/url', display_warning=True)
+                    self.standardize_url('/my/cool/url?test=1', display_warning=True)
+
+            self.assertEqual(len(warning_info), 1)
+            self.assertIn('but provided url does not contain a trailing slash.', str(warning_info[0].message))
+            self.assertEqual(_append_slash_warnings[('literal', '/my/cool/url')], 5)
+
+        with self.subTest('Different literal url - Warns again'):
+            with warnings.catch_warnings(record=True) as warning_info:
+                warnings.simplefilter('always')
+                self.standardize_url('/my/other/url', display_warning=True)
+                self.standardize_url('/my/other/url', display_warning=True)
+
+            self.assertEqual(len(warning_info), 1)
+            self.assertIn('Url was: /my/other/url', str(warning_info[0].message))
+
+        with self.subTest('End of run summary'):
+            with redirect_stderr(StringIO()) as output:
+                _show_append_slash_warning_summary()
+
+            self.assertText(
+                'DjangoETC: Skipped 6 repeated APPEND_SLASH warning(s), across 2 url(s).\n',
+                output.getvalue(),
+            )
+
+        with self.subTest('End of run summary - Pytest plugin'):
+            terminalreporter = MagicMock()
+            with patch('django_expanded_test_cases.pytest_plugin.atexit.unregister') as mock_unregister:
+                pytest_terminal_summary(terminalreporter)
+
+            terminalreporter.write_line.assert_any_call(
+                'DjangoETC: Skipped 6 repeated APPEND_SLASH warning(s), across 2 url(s).'
+            )
+            mock_unregister.assert_any_call(_show_append_slash_warning_summary)
+
+        with self.subTest('No repeats - No summary'):
+            _append_slash_warnings.clear()
+            with redirect_stderr(StringIO()) as output:
+                _show_append_slash_warning_summary()
+
+            self.assertText('', output.getvalue())
+
+        with self.subTest('Deduplication disabled - Warns every time'):
+            with patch('django_expanded_test_cases.mixins.response_mixin.ETC_DEDUPLICATE_APPEND_SLASH_WARNINGS', False):
+                with warnings.catch_warnings(record=True) as warning_info:
+                    warnings.simplefilter('always')
+                    for index in range(3):
+                        self.standardize_url('/my/cool/url', display_warning=True)
+
+            self.assertEqual(len(warning_info), 3)
+
     def test__standardize_url__failure(self):
         """
         Tests standardize_url() function, in situations when it should fail.